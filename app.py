@@ -9,13 +9,14 @@ from decouple import config
 DATABASE_URL = "postgresql://maiddy_admin:youngpotygotop123@db:5432/maiddy_db"  # Docker/DBeaver 연결 시 교체 필요
 engine = create_engine(DATABASE_URL)
 metadata = MetaData()
-metadata.reflect(bind=engine)
 Session = sessionmaker(bind=engine)
 session = Session()
 
-# 기존 테이블 참조
-Diary = metadata.tables.get('diary')
-Checklist = metadata.tables.get('checklist')
+# 기존 테이블 참조: import 시 전체 스키마를 읽지 않고, 처음 쓸 때 필요한 테이블만 읽는다
+def get_table(name):
+    if name not in metadata.tables:
+        Table(name, metadata, autoload_with=engine)
+    return metadata.tables[name]
 
 # OpenAI API 키 설정
 openai.api_key = config("OPENAI_API_KEY")
@@ -32,6 +33,7 @@ app = Flask(__name__)
 def evaluate_day():
     user_id = request.args.get('user_id')
     today = datetime.date.today()
+    Diary, Checklist = get_table('diary'), get_table('checklist')
 
     # 일기와 체크리스트 가져오기
     diary_entry = session.execute(Diary.select().where(Diary.c.user_id == user_id, Diary.c.date == today)).fetchone()
@@ -85,6 +87,7 @@ def add_entry():
     data = request.json
     user_id = data.get('user_id')
     entry_type = data.get('type')  # 'diary' 또는 'checklist'
+    Diary, Checklist = get_table('diary'), get_table('checklist')
 
     if entry_type == 'diary':
         session.execute(Diary.insert().values(user_id=user_id, date=datetime.date.today(), content=data.get('content')))
@@ -100,6 +103,7 @@ def add_entry():
 @app.route('/routine', methods=['GET'])
 def generate_routine():
     user_id = request.args.get('user_id')
+    Checklist = get_table('checklist')
 
     # 과거 데이터 가져오기
     checklist_entries = session.execute(Checklist.select().where(Checklist.c.user_id == user_id)).fetchall()
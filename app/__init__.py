@@ -1,12 +1,20 @@
 from flask import Flask, jsonify
 from config import Config
 from app.extensions import db, migrate
+from app.utils.clients import clients
+from app.utils.usage_ledger import usage_ledger
+from app.utils.startup import startup
 from app.routes.chatbot import chatbot_bp
 from app.routes.feedback import feedback_bp
 from app.routes.recommend import recommend_bp
+from app.routes.stats import stats_bp
+from app.routes.ingest import ingest_bp
+from app.routes.metrics import metrics_bp
+from app.commands import register_commands
 
 
 def create_app(config_class=Config):
+    startup.mark('imports')
     app = Flask(__name__)
     
     app.config.from_object(config_class)
@@ -16,20 +24,26 @@ def create_app(config_class=Config):
     
     db.init_app(app)
     migrate.init_app(app, db)
+    clients.init_app(app)
+    usage_ledger.init_app(app)
+    startup.init_app(app)
     
     register_blueprints(app)
+    register_commands(app)
     
     with app.app_context():
         from app.scheduler import init_scheduler, init_app
         
         init_app(app)
         
-        success, message = init_scheduler()
-        if not success:
-            app.logger.error(f"Failed to initialize scheduler: {message}")
-        else:
-            app.logger.info(message)
+        if app.config['SCHEDULER_ENABLED']:
+            success, message = init_scheduler()
+            if not success:
+                app.logger.error(f"Failed to initialize scheduler: {message}")
+            else:
+                app.logger.info(message)
     
+    startup.app_created()
     return app
 
 
@@ -37,3 +51,6 @@ def register_blueprints(app):
     app.register_blueprint(feedback_bp, url_prefix='/feedback')
     app.register_blueprint(recommend_bp, url_prefix='/recommend')
     app.register_blueprint(chatbot_bp, url_prefix='/chatbot')
+    app.register_blueprint(stats_bp, url_prefix='/stats')
+    app.register_blueprint(ingest_bp, url_prefix='/ingest')
+    app.register_blueprint(metrics_bp, url_prefix='/metrics')
@@ -0,0 +1,188 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl
+from asgiref.wsgi import WsgiToAsgi
+from app.utils.async_llm_service import AsyncLLMService
+from app.utils.clients import clients
+from app.utils.streaming import sse_event
+from app.utils.validation import parse_chat_request, parse_feedback_request, parse_recommend_request
+
+SSE_HEADERS = [
+    (b'content-type', b'text/event-stream; charset=utf-8'),
+    (b'cache-control', b'no-cache'),
+    (b'x-accel-buffering', b'no'),
+]
+
+
+def create_asgi_app(flask_app):
+    """AI 엔드포인트(/chatbot/, /feedback/, /recommend/)의 POST는 AsyncLLMService로 처리하고
+    나머지 요청은 기존 Flask 앱(WSGI)으로 넘기는 ASGI 앱.
+
+    OpenAI 응답을 기다리는 동안 워커 스레드를 점유하지 않으므로 한 프로세스에서
+    수백 개의 동시 요청을 유지할 수 있다.
+    """
+    service = AsyncLLMService(flask_app)
+    wsgi_app = WsgiToAsgi(flask_app)
+    handlers = {
+        '/chatbot/': _chatbot,
+        '/feedback/': _feedback,
+        '/recommend/': _recommend,
+    }
+
+    async def app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await _lifespan(flask_app, receive, send)
+            return
+
+        handler = handlers.get(scope['path']) if scope['type'] == 'http' and scope['method'] == 'POST' else None
+        if handler is None:
+            await wsgi_app(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        query = dict(parse_qsl(scope.get('query_string', b'').decode('latin-1')))
+        try:
+            data = json.loads(body) if body else None
+        except ValueError:
+            data = None  # 검증 함수가 400으로 돌려준다
+
+        try:
+            result = await handler(service, data, query)
+        except Exception as e:
+            flask_app.logger.error(f"비동기 요청 처리 중 오류가 발생했습니다: {str(e)}")
+            await _send_json(send, 500, {'success': False, 'message': '요청 처리 중 오류가 발생했습니다.'})
+            return
+
+        if isinstance(result, tuple):
+            await _send_json(send, *result)
+        else:
+            await _send_sse(flask_app, send, result)
+
+    return app
+
+
+async def _lifespan(flask_app, receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            # DB 작업(asyncio.to_thread)용 스레드 수 제한
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(max_workers=flask_app.config['ASYNC_DB_WORKERS'], thread_name_prefix='async-db')
+            )
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await clients.aclose()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def _send_json(send, status: int, payload: dict):
+    body = json.dumps(payload).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_sse(flask_app, send, tokens):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': SSE_HEADERS})
+    try:
+        async for token in tokens:
+            await send({'type': 'http.response.body', 'body': sse_event({'token': token}).encode('utf-8'), 'more_body': True})
+        final = sse_event({'success': True}, event='done')
+    except Exception as e:
+        flask_app.logger.error(f"스트리밍 응답 생성 중 오류가 발생했습니다: {str(e)}")
+        final = sse_event({'success': False, 'message': '응답 생성 중 오류가 발생했습니다.'}, event='error')
+    await send({'type': 'http.response.body', 'body': final.encode('utf-8')})
+
+
+async def _chatbot(service: AsyncLLMService, data, query: dict):
+    params, error = parse_chat_request(data, query)
+
+    if error:
+        return 400, {'success': False, 'message': error}
+
+    if params.stream:
+        success, response = await service.stream_chat_response(params.user_id, params.question)
+        if not success:
+            return 400, {'success': False, 'message': response}
+        return response
+
+    success, response = await service.get_chat_response(params.user_id, params.question)
+
+    if not success:
+        return 400, {'success': False, 'message': response}
+
+    return 200, {
+        'success': True,
+        'message': '응답이 성공적으로 생성되었습니다',
+        'data': {
+            'response': response
+        }
+    }
+
+
+async def _feedback(service: AsyncLLMService, data, query: dict):
+    params, error = parse_feedback_request(data, query)
+
+    if error:
+        return 400, {'success': False, 'message': error}
+
+    if params.stream:
+        success, response = await service.stream_feedback(params.user_id, params.select_date,
+                                                          force_refresh=params.force_refresh)
+        if not success:
+            return 400, {'success': False, 'message': response}
+        return response
+
+    success, response = await service.create_feedback(params.user_id, params.select_date,
+                                                      force_refresh=params.force_refresh)
+
+    if not success:
+        return 400, {'success': False, 'message': response}
+
+    return 200, {
+        'success': True,
+        'message': '피드백 생성 성공',
+        'data': {
+            'feedback': response
+        }
+    }
+
+
+async def _recommend(service: AsyncLLMService, data, query: dict):
+    params, error = parse_recommend_request(data, query)
+
+    if error:
+        return 400, {'success': False, 'message': error}
+
+    if params.stream:
+        success, response = await service.stream_recommendation(params.user_id, force_refresh=params.force_refresh)
+        if not success:
+            return 400, {'success': False, 'message': response}
+        return response
+
+    success, response = await service.create_recommendation(params.user_id, force_refresh=params.force_refresh)
+
+    if not success:
+        return 400, {'success': False, 'message': response}
+
+    return 200, {
+        'success': True,
+        'message': '추천이 성공적으로 생성되었습니다',
+        'data': {
+            'recommendation': response
+        }
+    }
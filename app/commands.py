@@ -0,0 +1,318 @@
+import time
+import click
+from flask.cli import AppGroup
+
+intent_cli = AppGroup('intent', help='의도 분석 관련 명령')
+vector_cli = AppGroup('vector-index', help='embeddings.embedding 벡터 인덱스 관리')
+scheduler_cli = AppGroup('scheduler', help='스케줄러 워커 관리')
+jobs_cli = AppGroup('jobs', help='일일/주간/월간 작업 원장 관리')
+usage_cli = AppGroup('usage', help='토큰 사용량/비용 원장 조회')
+startup_cli = AppGroup('startup', help='시작 시간 측정')
+
+
+@intent_cli.command('eval')
+@click.option('--llm', 'with_llm', is_flag=True, help='LLM 경로도 함께 평가합니다 (OpenAI 호출 발생)')
+def evaluate_intent(with_llm):
+    from flask import current_app
+    from app.utils.intent import classify_intent
+    from app.utils.intent_corpus import INTENT_CORPUS
+    from app.utils.llm_service import LLMService
+
+    threshold = current_app.config['INTENT_RULE_CONFIDENCE_THRESHOLD']
+    llm_service = LLMService() if with_llm else None
+
+    rule_hits = rule_correct = llm_correct = combined_correct = 0
+    for case in INTENT_CORPUS:
+        expected = (case['type'], case['action'])
+        intent = classify_intent(case['question'])
+        confident = intent.confidence >= threshold
+        rule_ok = (intent.type, intent.action) == expected
+
+        if confident:
+            rule_hits += 1
+            rule_correct += rule_ok
+
+        llm_result = None
+        if llm_service:
+            intent_type, action, _ = llm_service._analyze_user_intent_with_llm(case['question'])
+            llm_result = (intent_type, action)
+            llm_correct += llm_result == expected
+            combined_correct += rule_ok if confident else llm_result == expected
+
+        if confident:
+            mark = 'OK' if rule_ok else 'NG'
+        elif llm_result:
+            mark = 'OK' if llm_result == expected else 'NG'
+        else:
+            mark = '--'  # LLM으로 넘어가는 경우 (--llm 없이 평가하지 않음)
+        click.echo(f"[{mark}] {intent.confidence:.2f} {'rule' if confident else 'llm '} {case['question']} -> "
+                   f"rule={intent.type}/{intent.action}" + (f" llm={llm_result[0]}/{llm_result[1]}" if llm_result else ""))
+
+    total = len(INTENT_CORPUS)
+    click.echo("")
+    click.echo(f"규칙 경로 처리율: {rule_hits}/{total} ({rule_hits / total:.1%}), 임계값 {threshold}")
+    if rule_hits:
+        click.echo(f"규칙 경로 정확도: {rule_correct}/{rule_hits} ({rule_correct / rule_hits:.1%})")
+    if llm_service:
+        click.echo(f"LLM 단독 정확도: {llm_correct}/{total} ({llm_correct / total:.1%})")
+        click.echo(f"규칙+LLM 정확도: {combined_correct}/{total} ({combined_correct / total:.1%})")
+
+
+VECTOR_INDEX_NAMES = {
+    'hnsw': 'idx_embedding_vector_hnsw',
+    'ivfflat': 'idx_embedding_vector_ivfflat',
+}
+
+
+def _vector_index_sql(index_type, config):
+    name = VECTOR_INDEX_NAMES[index_type]
+    if index_type == 'hnsw':
+        options = f"m = {int(config['VECTOR_HNSW_M'])}, ef_construction = {int(config['VECTOR_HNSW_EF_CONSTRUCTION'])}"
+    else:
+        options = f"lists = {int(config['VECTOR_IVFFLAT_LISTS'])}"
+    return (
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+        f"ON embeddings USING {index_type} (embedding vector_cosine_ops) WITH ({options})"
+    )
+
+
+@vector_cli.command('create')
+@click.option('--type', 'index_type', type=click.Choice(['hnsw', 'ivfflat']), default=None,
+              help='기본값은 VECTOR_INDEX_TYPE 설정')
+def create_vector_index(index_type):
+    from flask import current_app
+    from sqlalchemy import text
+    from app.extensions import db
+
+    index_type = index_type or current_app.config['VECTOR_INDEX_TYPE']
+    if index_type not in VECTOR_INDEX_NAMES:
+        raise click.UsageError("VECTOR_INDEX_TYPE을 hnsw 또는 ivfflat으로 설정하거나 --type을 지정하세요.")
+
+    sql = _vector_index_sql(index_type, current_app.config)
+    click.echo(sql)
+    # CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute(text(sql))
+    click.echo(f"{VECTOR_INDEX_NAMES[index_type]} 인덱스가 생성되었습니다.")
+
+
+@vector_cli.command('drop')
+@click.option('--type', 'index_type', type=click.Choice(['hnsw', 'ivfflat']), required=True)
+def drop_vector_index(index_type):
+    from sqlalchemy import text
+    from app.extensions import db
+
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {VECTOR_INDEX_NAMES[index_type]}"))
+    click.echo(f"{VECTOR_INDEX_NAMES[index_type]} 인덱스가 삭제되었습니다.")
+
+
+@vector_cli.command('status')
+def vector_index_status():
+    from sqlalchemy import text
+    from app.extensions import db
+
+    rows = db.session.execute(text(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'embeddings' ORDER BY indexname"
+    )).all()
+    for row in rows:
+        click.echo(f"{row.indexname}: {row.indexdef}")
+
+
+@scheduler_cli.command('run')
+def run_scheduler():
+    # 웹 프로세스와 분리된 전용 스케줄러 워커 (웹 쪽은 SCHEDULER_ENABLED=False)
+    import signal
+    import threading
+    from flask import current_app
+    from app.scheduler import scheduler, init_scheduler, shutdown_scheduler
+
+    if not scheduler.running:
+        success, message = init_scheduler()
+        if not success:
+            raise click.ClickException(message)
+        click.echo(message)
+    else:
+        click.echo("이 프로세스의 스케줄러가 이미 실행 중입니다.")
+
+    click.echo(f"스케줄러 워커 실행 중 (advisory lock {current_app.config['SCHEDULER_LEADER_LOCK_KEY']}), 종료하려면 Ctrl+C")
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    stop.wait()
+
+    shutdown_scheduler()
+    click.echo("스케줄러 워커가 종료되었습니다.")
+
+
+def _parse_period(value):
+    from datetime import datetime
+
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise click.BadParameter('YYYY-MM-DD 형식이어야 합니다.')
+
+
+@jobs_cli.command('status')
+@click.argument('job', type=click.Choice(['daily', 'weekly', 'monthly']))
+@click.argument('period')
+def job_status(job, period):
+    from app.utils.job_ledger import job_ledger
+
+    click.echo(job_ledger.summary(job, _parse_period(period)))
+
+
+@jobs_cli.command('drain')
+@click.argument('job', type=click.Choice(['daily', 'weekly', 'monthly']))
+@click.argument('period')
+@click.option('--retry-failed', is_flag=True, help='시도 횟수가 남은 실패 행도 다시 처리합니다')
+def drain_jobs(job, period, retry_failed):
+    # 같은 실행을 다른 노드에서 함께 처리하거나, 중단된 실행을 수동으로 이어서 처리
+    from flask import current_app
+    from app.scheduler import drain_job, init_app
+    from app.utils.job_ledger import job_ledger
+
+    init_app(current_app._get_current_object())
+    period_start = _parse_period(period)
+    if retry_failed:
+        click.echo(f"실패 행 {job_ledger.retry_failed(job, period_start)}개를 다시 대기 상태로 바꿨습니다.")
+
+    started_at = time.perf_counter()
+    results = drain_job(job, period_start)
+    elapsed = time.perf_counter() - started_at
+    click.echo(f"처리 {results.count('processed')}, 건너뜀 {results.count('skipped')}, 실패 {results.count('failed')} "
+               f"({elapsed:.1f}초, {len(results) / elapsed * 60 if elapsed > 0 else 0.0:.1f} users/min)")
+    click.echo(job_ledger.summary(job, period_start))
+
+
+@usage_cli.command('report')
+@click.option('--since', help='시작일 YYYY-MM-DD (기본: 7일 전)')
+@click.option('--until', help='종료일 YYYY-MM-DD, 포함 (기본: 오늘)')
+@click.option('--by', 'group_by', default='day,user,endpoint',
+              help='집계 기준 (day, user, endpoint, job 중 쉼표로 구분)')
+@click.option('--user', 'user_id', type=int, help='특정 사용자만')
+def usage_report(since, until, group_by, user_id):
+    from datetime import date, datetime, timedelta
+    from app.utils.usage_ledger import REPORT_GROUPS, usage_ledger
+
+    group_by = tuple(name.strip() for name in group_by.split(',') if name.strip())
+    invalid = [name for name in group_by if name not in REPORT_GROUPS]
+    if invalid or not group_by:
+        raise click.BadParameter(f"{', '.join(REPORT_GROUPS)} 중에서 골라야 합니다.", param_hint='--by')
+
+    until_date = _parse_period(until) if until else date.today()
+    since_date = _parse_period(since) if since else until_date - timedelta(days=7)
+    # 아직 버퍼에 있는 이 프로세스의 기록도 포함
+    usage_ledger.flush()
+    rows = usage_ledger.report(
+        datetime.combine(since_date, datetime.min.time()),
+        datetime.combine(until_date + timedelta(days=1), datetime.min.time()),
+        group_by,
+        user_id
+    )
+
+    click.echo('\t'.join(group_by + ('model', 'calls', 'prompt', 'completion', 'avg_ms', 'cost_usd')))
+    total_cost = 0.0
+    for row in rows:
+        cost = row['cost_usd']
+        total_cost += cost or 0.0
+        click.echo('\t'.join(
+            [str(row[name]) for name in group_by] +
+            [row['model'], str(row['calls']), str(row['prompt_tokens']), str(row['completion_tokens']),
+             str(row['avg_latency_ms']), f"{cost:.4f}" if cost is not None else '-']
+        ))
+    click.echo(f"{since_date} ~ {until_date}: {len(rows)}행, 추정 비용 ${total_cost:.4f}")
+
+
+# 새 인터프리터에서 create_app까지 실행하고 단계별 시간을 JSON 한 줄로 출력한다
+STARTUP_PROFILE_SCRIPT = """
+import json, sys, time
+started_at = time.perf_counter()
+from app import create_app
+imported_at = time.perf_counter()
+create_app()
+sys.stderr.write('startup-profile: app created\\n')
+result = {'import_s': imported_at - started_at, 'create_app_s': time.perf_counter() - imported_at}
+if sys.argv[1:] == ['warmup']:
+    from app.utils.startup import startup
+    result['warmup'] = startup.warm_up()
+print(json.dumps(result))
+"""
+# 시작 경로에서 불러오면 안 되는(첫 사용 시 불러오는) 패키지
+LAZY_PACKAGES = ('langchain', 'langchain_core', 'langchain_openai', 'langchain_community', 'openai', 'tiktoken')
+
+
+def _parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" 형식의 줄 -> [(모듈, self us, cumulative us)]
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        modules.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return modules
+
+
+@startup_cli.command('profile')
+@click.option('--top', default=20, show_default=True, help='출력할 모듈/패키지 수')
+@click.option('--warmup', is_flag=True, help='워밍업 단계(import, 클라이언트 생성, tiktoken)도 측정합니다')
+@click.option('--raw', 'raw_path', type=click.Path(dir_okay=False, writable=True),
+              help='python -X importtime 원본 출력을 저장할 경로 (tuna 등으로 시각화)')
+def profile_startup(top, warmup, raw_path):
+    import json
+    import os
+    import subprocess
+    import sys
+    from flask import current_app
+
+    # 스케줄러/워밍업 스레드가 측정에 섞이지 않도록 끈다 (--warmup이면 동기로 따로 잰다)
+    env = dict(os.environ, SCHEDULER_ENABLED='False', WARMUP_ENABLED='False')
+    started_at = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_PROFILE_SCRIPT] + (['warmup'] if warmup else []),
+        cwd=os.path.dirname(current_app.root_path), env=env, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - started_at
+    if completed.returncode != 0:
+        raise click.ClickException(f"시작 측정에 실패했습니다:\n{completed.stderr[-2000:]}")
+    if raw_path:
+        with open(raw_path, 'w') as output:
+            output.write(completed.stderr)
+
+    # create_app이 끝난 뒤(--warmup)의 import는 시작 경로가 아니므로 표에서 뺀다
+    modules = _parse_importtime(completed.stderr.split('startup-profile: app created')[0])
+    packages = {}
+    for name, self_us, _ in modules:
+        package = name.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    click.echo(f"가장 느린 패키지 (self 합계, 상위 {top})")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        click.echo(f"  {self_us / 1000:>9.1f} ms  {package}")
+    click.echo(f"가장 느린 모듈 (cumulative, 상위 {top})")
+    for name, _, cumulative_us in sorted(modules, key=lambda module: module[2], reverse=True)[:top]:
+        click.echo(f"  {cumulative_us / 1000:>9.1f} ms  {name}")
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    click.echo("")
+    click.echo(f"import 합계: {sum(self_us for _, self_us, _ in modules) / 1000:.1f} ms ({len(modules)}개 모듈)")
+    click.echo(f"from app import create_app: {result['import_s'] * 1000:.1f} ms, "
+               f"create_app(): {result['create_app_s'] * 1000:.1f} ms, 프로세스 전체: {wall * 1000:.1f} ms")
+    for step, seconds in (result.get('warmup') or {}).items():
+        click.echo(f"워밍업 {step}: {seconds * 1000:.1f} ms")
+
+    eager = sorted({name.split('.')[0] for name, _, _ in modules} & set(LAZY_PACKAGES))
+    if eager:
+        click.echo(f"시작 시 불러온 지연 대상 패키지: {', '.join(eager)}")
+
+
+def register_commands(app):
+    app.cli.add_command(intent_cli)
+    app.cli.add_command(vector_cli)
+    app.cli.add_command(scheduler_cli)
+    app.cli.add_command(jobs_cli)
+    app.cli.add_command(usage_cli)
+    app.cli.add_command(startup_cli)
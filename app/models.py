@@ -73,6 +73,9 @@ class CleanedData(db.Model):
     user_id = db.Column(db.Integer, db.ForeignKey('users_user.id', ondelete='CASCADE'), nullable=False)
     select_date = db.Column(db.Date, nullable=False)
     cleaned_text = db.Column(db.Text, nullable=False)
+    # 정리할 때 읽은 원본(일기/할일/일정) 텍스트의 sha256과 정리한 시각 - 야간 작업이 원본이 바뀌었는지 확인한다
+    source_hash = db.Column(db.String(64), nullable=True)
+    built_at = db.Column(db.DateTime, nullable=True)
     
 
 class Summary(db.Model):
@@ -83,6 +86,8 @@ class Summary(db.Model):
     type = db.Column(db.String(50), nullable=False)  # monthly, weekly
     start_date = db.Column(db.Date, nullable=False)  # 요약 시작일
     end_date = db.Column(db.Date, nullable=False)    # 요약 종료일
+    is_final = db.Column(db.Boolean, nullable=False, default=True, server_default=sa.true())  # False: 이번 주 진행 중인 요약
+    updated_through = db.Column(db.Date, nullable=True)  # 진행 중인 요약에 반영된 마지막 날짜
     
     __table_args__ = (
         db.Index('idx_summary_user_type_dates', 'user_id', 'type', 'start_date', 'end_date'),
@@ -102,4 +107,70 @@ class Embedding(db.Model):
     
     __table_args__ = (
         db.Index('idx_embedding_user_type_dates', 'user_id', 'type', 'start_date', 'end_date'),
-    )
\ No newline at end of file
+    )
+
+
+class EmbeddingCacheEntry(db.Model):
+    __tablename__ = 'embedding_cache'
+
+    key = db.Column(db.String(64), primary_key=True)  # sha256(모델명 + 정규화된 텍스트)
+    model = db.Column(db.String(100), nullable=False)
+    embedding = db.Column(Vector(1536), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ResponseCache(db.Model):
+    __tablename__ = 'response_cache'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users_user.id', ondelete='CASCADE'), nullable=False)
+    endpoint = db.Column(db.String(50), nullable=False)  # feedback, recommend
+    select_date = db.Column(db.Date, nullable=False)
+    fingerprint = db.Column(db.String(64), nullable=False)  # 입력 데이터/프롬프트 버전/모델의 sha256
+    response = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'endpoint', 'select_date', name='uq_response_cache_user_endpoint_date'),
+    )
+
+
+class JobLedgerEntry(db.Model):
+    __tablename__ = 'job_ledger'
+
+    id = db.Column(db.Integer, primary_key=True)
+    job = db.Column(db.String(50), nullable=False)  # daily, weekly
+    user_id = db.Column(db.Integer, db.ForeignKey('users_user.id', ondelete='CASCADE'), nullable=False)
+    period_start = db.Column(db.Date, nullable=False)
+    period_end = db.Column(db.Date, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending, running, done, skipped, failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    claimed_by = db.Column(db.String(255), nullable=True)  # 호스트명:pid
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('job', 'user_id', 'period_start', name='uq_job_ledger_job_user_period'),
+        db.Index('idx_job_ledger_job_period_status', 'job', 'period_start', 'status'),
+    )
+
+
+class LLMUsageRecord(db.Model):
+    __tablename__ = 'llm_usage'
+
+    id = db.Column(db.BigInteger, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users_user.id', ondelete='CASCADE'), nullable=True)
+    endpoint = db.Column(db.String(50), nullable=False)  # chat, intent, feedback, recommend, preprocess, weekly_summary, ...
+    job = db.Column(db.String(50), nullable=True)  # daily_job, weekly_job, monthly_job, ingestion (API 요청은 NULL)
+    model = db.Column(db.String(100), nullable=False)
+    prompt_tokens = db.Column(db.Integer, nullable=False, default=0)
+    completion_tokens = db.Column(db.Integer, nullable=False, default=0)
+    latency_ms = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index('idx_llm_usage_created_at', 'created_at'),
+        db.Index('idx_llm_usage_user_created_at', 'user_id', 'created_at'),
+    )
@@ -1,9 +1,15 @@
 from .chatbot import chatbot_bp
 from .feedback import feedback_bp
 from .recommend import recommend_bp
+from .stats import stats_bp
+from .ingest import ingest_bp
+from .metrics import metrics_bp
 
 __all__ = [
     'chatbot_bp',
     'feedback_bp',
-    'recommend_bp'
+    'recommend_bp',
+    'stats_bp',
+    'ingest_bp',
+    'metrics_bp'
 ]
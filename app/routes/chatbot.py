@@ -1,22 +1,26 @@
 from flask import Blueprint, request, jsonify
 from app.utils.llm_service import LLMService
+from app.utils.streaming import sse_response
+from app.utils.validation import parse_chat_request
 
 chatbot_bp = Blueprint('chatbot', __name__)
 
 @chatbot_bp.route("/", methods=["POST"])
 def chatbot():
-    data = request.get_json()
-    user_id = data.get('user_id')
-    question = data.get('question')
+    params, error = parse_chat_request(request.get_json(silent=True))
     
-    if not user_id:
-        return jsonify({'success': False, 'message': '사용자 ID가 필요합니다.'}), 400
-    
-    if not question:
-        return jsonify({'success': False, 'message': '질문을 입력해주세요.'}), 400
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
     
     llm_service = LLMService()
-    success, response = llm_service.get_chat_response(user_id, question)
+    
+    if params.stream:
+        success, response = llm_service.stream_chat_response(params.user_id, params.question)
+        if not success:
+            return jsonify({'success': False, 'message': response}), 400
+        return sse_response(response)
+    
+    success, response = llm_service.get_chat_response(params.user_id, params.question)
     
     if not success:
         return jsonify({'success': False, 'message': response}), 400
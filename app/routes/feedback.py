@@ -1,28 +1,28 @@
 from flask import Blueprint, request, jsonify
 from app.utils.llm_service import LLMService
-from datetime import datetime
+from app.utils.streaming import sse_response
+from app.utils.validation import parse_feedback_request
 
 feedback_bp = Blueprint('feedback', __name__)
 
 @feedback_bp.route("/", methods=["POST"])
 def create_feedback():
-    data = request.get_json()
-    user_id = data.get('user_id')
-    date_str = data.get('select_date')  # YYYY-MM-DD 형식
+    params, error = parse_feedback_request(request.get_json(silent=True))
     
-    if not user_id:
-        return jsonify({'success': False, 'message': '사용자 ID가 필요합니다.'}), 400
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
     
-    try:
-        if date_str is None:
-            select_date = datetime.now().date()
-        else:
-            select_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-    except ValueError:
-        return jsonify({'success': False, 'message': '올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)'}), 400
-
     llm_service = LLMService()
-    success, response = llm_service.create_feedback(user_id, select_date)
+    
+    if params.stream:
+        success, response = llm_service.stream_feedback(params.user_id, params.select_date,
+                                                        force_refresh=params.force_refresh)
+        if not success:
+            return jsonify({'success': False, 'message': response}), 400
+        return sse_response(response)
+    
+    success, response = llm_service.create_feedback(params.user_id, params.select_date,
+                                                    force_refresh=params.force_refresh)
     
     if not success:
         return jsonify({'success': False, 'message': response}), 400
@@ -0,0 +1,39 @@
+from flask import Blueprint, request, jsonify, current_app
+from app.utils.ingestion import ingestion_queue
+from app.utils.validation import parse_ingest_event
+
+ingest_bp = Blueprint('ingest', __name__)
+
+@ingest_bp.route("/", methods=["POST"])
+def ingest_events():
+    # 백엔드가 일기/할일/일정을 쓴 뒤 호출: {"events": [{"user_id": 1, "created_date": "YYYY-MM-DD"}, ...]}
+    # 단일 이벤트는 {"user_id": 1, "created_date": "YYYY-MM-DD"}로도 보낼 수 있다
+    # created_date는 항목의 select_date가 아니라 항목이 작성된 날(created_at의 날짜)이다.
+    # CleanedData는 그날 작성된 항목으로 만들어지므로(get_daily_data) 미래 일정도 작성한 날을 보내야 한다.
+    # 이전 이름인 select_date도 같은 뜻으로 받는다
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'message': '잘못된 요청 형식입니다.'}), 400
+    
+    events = data.get('events', [data])
+    if not isinstance(events, list) or not events:
+        return jsonify({'success': False, 'message': '이벤트가 필요합니다.'}), 400
+    
+    parsed = []
+    for event in events:
+        params, error = parse_ingest_event(event)
+        if error:
+            return jsonify({'success': False, 'message': error}), 400
+        parsed.append(params)
+    
+    app = current_app._get_current_object()
+    for user_id, select_date in parsed:
+        ingestion_queue.submit(app, user_id, select_date)
+    
+    return jsonify({
+        'success': True,
+        'message': '이벤트가 접수되었습니다',
+        'data': {
+            'accepted': len(parsed)
+        }
+    }), 202
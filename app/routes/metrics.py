@@ -0,0 +1,10 @@
+from flask import Blueprint, Response
+from app.utils.metrics import metrics
+
+metrics_bp = Blueprint('metrics', __name__)
+
+@metrics_bp.route("/", methods=["GET"], strict_slashes=False)
+def get_metrics():
+    # /metrics/와 Prometheus 기본 경로인 /metrics 모두 리다이렉트 없이 응답
+    # Prometheus text exposition format (프로세스 단위 - 워커마다 따로 수집)
+    return Response(metrics.expose(), mimetype='text/plain; version=0.0.4; charset=utf-8')
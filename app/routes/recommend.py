@@ -1,18 +1,26 @@
 from flask import Blueprint, request, jsonify
 from app.utils.llm_service import LLMService
+from app.utils.streaming import sse_response
+from app.utils.validation import parse_recommend_request
 
 recommend_bp = Blueprint('recommend', __name__)
 
 @recommend_bp.route("/", methods=["POST"])
 def create_recommendation():
-    data = request.get_json()
-    user_id = data.get('user_id')
+    params, error = parse_recommend_request(request.get_json(silent=True))
     
-    if not user_id:
-        return jsonify({'success': False, 'message': '사용자 ID가 필요합니다.'}), 400
+    if error:
+        return jsonify({'success': False, 'message': error}), 400
     
     llm_service = LLMService()
-    success, response = llm_service.create_recommendation(user_id)
+    
+    if params.stream:
+        success, response = llm_service.stream_recommendation(params.user_id, force_refresh=params.force_refresh)
+        if not success:
+            return jsonify({'success': False, 'message': response}), 400
+        return sse_response(response)
+    
+    success, response = llm_service.create_recommendation(params.user_id, force_refresh=params.force_refresh)
     
     if not success:
         return jsonify({'success': False, 'message': response}), 400
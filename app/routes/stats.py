@@ -0,0 +1,30 @@
+from flask import Blueprint, jsonify
+from app.utils.intent import get_intent_stats
+from app.utils.embedding_cache import embedding_cache
+from app.utils.context_cache import context_cache
+from app.utils.response_cache import response_cache
+from app.utils.clients import clients
+from app.utils.leader import leader_lock
+from app.utils.ingestion import ingestion_queue
+from app.utils.usage_ledger import usage_ledger
+from app.utils.startup import startup
+
+stats_bp = Blueprint('stats', __name__)
+
+@stats_bp.route("/", methods=["GET"])
+def get_stats():
+    return jsonify({
+        'success': True,
+        'message': '통계 조회 성공',
+        'data': {
+            'intent': get_intent_stats(),
+            'embedding_cache': embedding_cache.stats(),
+            'context_cache': context_cache.stats(),
+            'response_cache': response_cache.stats(),
+            'clients': clients.stats(),
+            'scheduler_leader': leader_lock.stats(),
+            'ingestion': ingestion_queue.stats(),
+            'usage_ledger': usage_ledger.stats(),
+            'startup': startup.stats()
+        }
+    })
@@ -1,11 +1,18 @@
 from datetime import datetime, timedelta
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from flask import current_app
-from app.models import User, CleanedData, Summary
+from app.models import Todo, Diary, Schedule, CleanedData, Summary
+from sqlalchemy import and_, exists, select, union
 from app.utils.llm_service import LLMService
 from app.utils.embedding import EmbeddingService
+from app.utils.leader import leader_lock
+from app.utils.job_ledger import job_ledger
+from app.utils.metrics import metrics
+from functools import wraps
 import atexit
+import time
 
 flask_app = None
 
@@ -21,138 +28,439 @@ scheduler = BackgroundScheduler(
     }
 )
 
+def _with_retries(label, fn, max_retries=3):
+    # fn()은 ('processed' 또는 'skipped', 메시지)를, 실패하면 (None, 메시지)를 반환한다. 예외도 실패로 보고 다시 시도
+    message = None
+    for attempt in range(1, max_retries + 1):
+        try:
+            result, message = fn()
+            if result is not None:
+                return result, message
+            if attempt == max_retries:
+                flask_app.logger.error(f"{label} 최대 재시도 횟수 초과: {message}")
+            else:
+                flask_app.logger.warning(f"{label} 재시도 중 ({attempt}/{max_retries}): {message}")
+        except Exception as e:
+            message = str(e)
+            if attempt == max_retries:
+                flask_app.logger.error(f"{label} 중 오류 발생: {message}")
+            else:
+                flask_app.logger.warning(f"{label} 재시도 중 ({attempt}/{max_retries})")
+
+    return 'failed', message
+
+def _process_user_yesterday_data(user_id, yesterday):
+    # 워커마다 별도의 앱 컨텍스트(= 별도의 DB 세션)에서 처리
+    with flask_app.app_context():
+        llm_service = LLMService(job='daily_job')
+
+        def process():
+            existing_data = CleanedData.query.filter(
+                CleanedData.user_id == user_id,
+                CleanedData.select_date == yesterday
+            ).first()
+
+            if existing_data and llm_service.is_cleaned_data_current(user_id, yesterday, existing_data):
+                # 수집 이벤트(/ingest)로 정리된 뒤 원본이 바뀌지 않았으면 전처리 없이 피드백/주간 요약만 반영
+                flask_app.logger.info(f"사용자 {user_id}의 {yesterday} 데이터가 이미 정리되어 있습니다, 전처리를 건너뜁니다...")
+                success, message = True, None
+            elif existing_data:
+                # 수집 이벤트가 유실(재시작/배포)되어 정리 이후의 변경이 빠진 경우
+                success, message = llm_service.refresh_daily_data(user_id, yesterday)
+            else:
+                success, message = llm_service.clean_daily_data(user_id, yesterday)
+
+            if not success:
+                return None, message
+
+            flask_app.logger.info(f"사용자 {user_id}의 {yesterday} 데이터가 성공적으로 처리되었습니다")
+
+            success, message = llm_service.create_feedback(user_id, yesterday)
+            if success:
+                flask_app.logger.info(f"사용자 {user_id}의 {yesterday} 피드백이 성공적으로 생성되었습니다")
+            else:
+                flask_app.logger.error(f"사용자 {user_id}의 피드백 생성 실패: {message}")
+
+            if flask_app.config['WEEKLY_SUMMARY_INCREMENTAL']:
+                # 실패해도 월요일 확정 때 빠진 날을 마저 반영한다
+                success, message = EmbeddingService(job='daily_job').update_running_weekly_summary(user_id, yesterday)
+                if success:
+                    flask_app.logger.info(f"사용자 {user_id}의 이번 주 요약이 {yesterday}까지 갱신되었습니다")
+                else:
+                    flask_app.logger.warning(f"사용자 {user_id}의 이번 주 요약 갱신 실패: {message}")
+            return 'processed', None
+
+        return _with_retries(f"사용자 {user_id}의 데이터 처리", process)
+
+def _process_user_weekly_data(user_id, start_date):
+    with flask_app.app_context():
+        embedding_service = EmbeddingService(job='weekly_job')
+        start_date, end_date = embedding_service.get_week_dates(start_date)
+
+        def process():
+            existing_summary = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'weekly',
+                Summary.start_date == start_date,
+                Summary.end_date == end_date
+            ).first()
+
+            if existing_summary and existing_summary.is_final:
+                flask_app.logger.info(f"사용자 {user_id}의 {start_date}~{end_date} 주간 요약이 이미 존재합니다, 건너뜁니다...")
+                return 'skipped', None
+
+            if existing_summary:
+                # 일일 작업이 갱신해 온 요약을 확정만 한다
+                success, message = embedding_service.finalize_weekly_summary(user_id, start_date)
+                if success:
+                    flask_app.logger.info(f"사용자 {user_id}의 {start_date}~{end_date} 주간 요약이 확정되었습니다")
+                    return 'processed', None
+                return None, message
+
+            has_data = CleanedData.query.filter(
+                CleanedData.user_id == user_id,
+                CleanedData.select_date >= start_date,
+                CleanedData.select_date <= end_date
+            ).first()
+
+            if not has_data:
+                flask_app.logger.info(f"사용자 {user_id}의 {start_date}~{end_date} 기간 동안의 데이터가 없습니다, 건너뜁니다...")
+                return 'skipped', None
+
+            success, message = embedding_service.process_weekly_data(user_id, start_date)
+            if not success:
+                return None, message
+
+            flask_app.logger.info(f"사용자 {user_id}의 주간 데이터가 성공적으로 처리되었습니다")
+            return 'processed', None
+
+        return _with_retries(f"사용자 {user_id}의 주간 데이터 처리", process)
+
+def _process_user_monthly_data(user_id, start_date):
+    with flask_app.app_context():
+        embedding_service = EmbeddingService(job='monthly_job')
+        start_date, end_date = embedding_service.get_month_dates(start_date)
+
+        def process():
+            existing_summary = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'monthly',
+                Summary.start_date == start_date
+            ).first()
+
+            if existing_summary:
+                flask_app.logger.info(f"사용자 {user_id}의 {start_date}~{end_date} 월간 요약이 이미 존재합니다, 건너뜁니다...")
+                return 'skipped', None
+
+            has_weekly = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'weekly',
+                Summary.start_date >= start_date,
+                Summary.start_date <= end_date
+            ).first()
+
+            if not has_weekly:
+                flask_app.logger.info(f"사용자 {user_id}의 {start_date}~{end_date} 기간 동안의 주간 요약이 없습니다, 건너뜁니다...")
+                return 'skipped', None
+
+            success, message = embedding_service.process_monthly_data(user_id, start_date)
+            if not success:
+                return None, message
+
+            flask_app.logger.info(f"사용자 {user_id}의 월간 데이터가 성공적으로 처리되었습니다")
+            return 'processed', None
+
+        return _with_retries(f"사용자 {user_id}의 월간 데이터 처리", process)
+
+JOB_HANDLERS = {
+    'daily': _process_user_yesterday_data,
+    'weekly': _process_user_weekly_data,
+    'monthly': _process_user_monthly_data,
+}
+
+def _process_weekly_batch(user_ids, start_date):
+    # 진행 중인 요약은 EmbeddingService.finalize_weekly_batch로, 요약이 없는 사용자는 process_weekly_batch로 한 번에 처리
+    with flask_app.app_context():
+        embedding_service = EmbeddingService(job='weekly_job')
+        start_date, end_date = embedding_service.get_week_dates(start_date)
+
+        existing = dict(Summary.query.with_entities(Summary.user_id, Summary.is_final).filter(
+            Summary.user_id.in_(user_ids),
+            Summary.type == 'weekly',
+            Summary.start_date == start_date,
+            Summary.end_date == end_date
+        ).all())
+
+        results = {user_id: ('skipped', None) for user_id, is_final in existing.items() if is_final}
+        batches = (
+            (embedding_service.finalize_weekly_batch,
+             [user_id for user_id in user_ids if user_id in existing and not existing[user_id]]),
+            (embedding_service.process_weekly_batch, [user_id for user_id in user_ids if user_id not in existing]),
+        )
+
+        for handler, batch_user_ids in batches:
+            if not batch_user_ids:
+                continue
+            try:
+                batch_results = handler(batch_user_ids, start_date)
+            except Exception as e:
+                flask_app.logger.error(f"주간 데이터 일괄 처리 중 오류 발생, 사용자별로 처리합니다: {str(e)}")
+                continue
+
+            for user_id in batch_user_ids:
+                if user_id not in batch_results:
+                    results[user_id] = ('skipped', None)
+                elif batch_results[user_id][0]:
+                    results[user_id] = ('processed', None)
+
+    # 일괄 처리에서 실패한 사용자는 재시도가 있는 사용자별 경로로 (워커 수만큼 동시에)
+    retry_user_ids = [user_id for user_id in user_ids if user_id not in results]
+    max_workers = min(flask_app.config['SCHEDULER_MAX_WORKERS'], len(retry_user_ids))
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='weekly-retry') as executor:
+            results.update(zip(retry_user_ids, executor.map(
+                lambda user_id: _process_user_weekly_data(user_id, start_date), retry_user_ids
+            )))
+    else:
+        for user_id in retry_user_ids:
+            results[user_id] = _process_user_weekly_data(user_id, start_date)
+    return results
+
+BATCH_JOB_HANDLERS = {
+    'weekly': _process_weekly_batch,
+}
+
+def _process_ledger_batch(job, claimed, period_start):
+    started_at = time.perf_counter()
+    results = BATCH_JOB_HANDLERS[job]([user_id for _, user_id in claimed], period_start)
+    # 일괄 처리는 사용자별 시간을 나눌 수 없으므로 평균값으로 기록
+    per_user = (time.perf_counter() - started_at) / len(claimed)
+    for entry_id, user_id in claimed:
+        result, message = results[user_id]
+        metrics.job_user_duration.observe(per_user, job=job, result=result)
+        try:
+            job_ledger.complete(entry_id, result, message if result == 'failed' else None)
+        except Exception as e:
+            flask_app.logger.error(f"작업 원장 갱신 중 오류 발생 ({job}, 사용자 {user_id}): {str(e)}")
+    return [results[user_id][0] for _, user_id in claimed]
+
+def _process_ledger_entry(job, entry_id, user_id, period_start):
+    started_at = time.perf_counter()
+    result, message = JOB_HANDLERS[job](user_id, period_start)
+    metrics.job_user_duration.observe(time.perf_counter() - started_at, job=job, result=result)
+    with flask_app.app_context():
+        try:
+            job_ledger.complete(entry_id, result, message if result == 'failed' else None)
+        except Exception as e:
+            flask_app.logger.error(f"작업 원장 갱신 중 오류 발생 ({job}, 사용자 {user_id}): {str(e)}")
+    return result
+
+def drain_job(job, period_start):
+    # 원장에서 대기 중인 행을 가져가 처리 (다른 노드도 같은 기간을 동시에 처리할 수 있다)
+    # 앱 컨텍스트 안에서 호출
+    max_workers = flask_app.config['SCHEDULER_MAX_WORKERS']
+    batch_size = flask_app.config['WEEKLY_BATCH_SIZE'] if job in BATCH_JOB_HANDLERS else 0
+    results = []
+
+    if batch_size:
+        while True:
+            claimed = job_ledger.claim(job, period_start, limit=batch_size)
+            if not claimed:
+                break
+            results.extend(_process_ledger_batch(job, claimed, period_start))
+        return results
+
+    if max_workers <= 1:
+        while True:
+            claimed = job_ledger.claim(job, period_start, limit=1)
+            if not claimed:
+                break
+            results.extend(_process_ledger_entry(job, entry_id, user_id, period_start) for entry_id, user_id in claimed)
+        return results
+
+    # 항상 워커 수만큼 처리 중이도록, 하나가 끝날 때마다 빈 자리만큼 새로 가져온다
+    # (느린 사용자 하나가 같이 가져온 묶음 전체를 붙잡지 않는다)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f'{job}-worker') as executor:
+        in_flight = set()
+        exhausted = False
+        while True:
+            if not exhausted and len(in_flight) < max_workers:
+                claimed = job_ledger.claim(job, period_start, limit=max_workers - len(in_flight))
+                exhausted = not claimed
+                in_flight.update(
+                    executor.submit(_process_ledger_entry, job, entry_id, user_id, period_start)
+                    for entry_id, user_id in claimed
+                )
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            results.extend(future.result() for future in done)
+
+    return results
+
+def _log_job_result(job, period_start, results, elapsed):
+    max_workers = flask_app.config['SCHEDULER_MAX_WORKERS']
+    throughput = len(results) / elapsed * 60 if elapsed > 0 else 0.0
+    summary = job_ledger.summary(job, period_start)
+    flask_app.logger.info(
+        f"{job} 작업 {period_start} 처리가 완료되었습니다 "
+        f"(이 프로세스: 처리 {results.count('processed')}, 건너뜀 {results.count('skipped')}, 실패 {results.count('failed')}, "
+        f"워커 {max_workers}개, {elapsed:.2f}초, {throughput:.1f} users/min / 원장: {summary})"
+    )
+
+def _daily_candidates(yesterday):
+    # 어제 작성된 할일/일기/일정이 있는 사용자 (LLMService.get_daily_data와 같은 created_at 기준)
+    # 수집 이벤트로 CleanedData가 이미 있는 사용자도 피드백/주간 요약 반영을 위해 포함하고,
+    # 같은 실행에서 이미 처리된 사용자는 원장이 다시 넣지 않는다
+    start_datetime = datetime.combine(yesterday, datetime.min.time())
+    end_datetime = datetime.combine(yesterday, datetime.max.time())
+    sources = union(*(
+        select(model.user_id.label('user_id')).where(model.created_at.between(start_datetime, end_datetime))
+        for model in (Todo, Diary, Schedule)
+    )).subquery()
+    return select(sources.c.user_id).order_by(sources.c.user_id)
+
+def _weekly_candidates(start_date, end_date):
+    # 이번 주 CleanedData가 있고 확정된 주간 요약이 없는 사용자 (진행 중인 요약은 확정 대상)
+    return select(CleanedData.user_id).where(
+        CleanedData.select_date.between(start_date, end_date),
+        ~exists().where(and_(
+            Summary.user_id == CleanedData.user_id,
+            Summary.type == 'weekly',
+            Summary.start_date == start_date,
+            Summary.is_final.is_(True)
+        ))
+    ).distinct().order_by(CleanedData.user_id)
+
+def _monthly_candidates(start_date, end_date):
+    # 해당 월에 시작한 확정 주간 요약이 있고 월간 요약이 없는 사용자
+    weekly = Summary.__table__.alias('weekly')
+    monthly = Summary.__table__.alias('monthly')
+    return select(weekly.c.user_id).where(
+        weekly.c.type == 'weekly',
+        weekly.c.is_final.is_(True),
+        weekly.c.start_date.between(start_date, end_date),
+        ~exists().where(and_(
+            monthly.c.user_id == weekly.c.user_id,
+            monthly.c.type == 'monthly',
+            monthly.c.start_date == start_date
+        ))
+    ).distinct().order_by(weekly.c.user_id)
+
 def process_yesterday_data():
     if not flask_app:
         raise RuntimeError("Flask 앱이 초기화되지 않았습니다")
         
     with flask_app.app_context():
+        started_at = time.perf_counter()
+        yesterday = datetime.now().date() - timedelta(days=1)
+        
         try:
-            llm_service = LLMService()
-            
-            users = User.query.with_entities(User.id, User.username).all()
-            if not users:
-                flask_app.logger.warning("시스템에 사용자가 없습니다")
-                return
-                
-            for user in users:
-                retry_count = 0
-                max_retries = 3
-                
-                while retry_count < max_retries:
-                    try:
-                        yesterday = datetime.now().date() - timedelta(days=1)
-                        
-                        existing_data = CleanedData.query.filter(
-                            CleanedData.user_id == user.id,
-                            CleanedData.select_date == yesterday
-                        ).first()
-                        
-                        if existing_data:
-                            flask_app.logger.info(f"사용자 {user.id}의 {yesterday} 데이터가 이미 처리되었습니다, 건너뜁니다...")
-                            break
-                        
-                        success, message = llm_service.clean_daily_data(user.id, yesterday)
-                        
-                        if success:
-                            flask_app.logger.info(f"사용자 {user.id}의 {yesterday} 데이터가 성공적으로 처리되었습니다")
-                            
-                            success, message = llm_service.create_feedback(user.id, yesterday)
-                            if success:
-                                flask_app.logger.info(f"사용자 {user.id}의 {yesterday} 피드백이 성공적으로 생성되었습니다")
-                            else:
-                                flask_app.logger.error(f"사용자 {user.id}의 피드백 생성 실패: {message}")
-                            break
-                        else:
-                            retry_count += 1
-                            if retry_count == max_retries:
-                                flask_app.logger.error(f"사용자 {user.id}의 데이터 처리 최대 재시도 횟수 초과: {message}")
-                            else:
-                                flask_app.logger.warning(f"사용자 {user.id}의 데이터 처리 재시도 중 ({retry_count}/{max_retries}): {message}")
-                    except Exception as e:
-                        retry_count += 1
-                        if retry_count == max_retries:
-                            flask_app.logger.error(f"사용자 {user.id}의 데이터 처리 중 오류 발생: {str(e)}")
-                        else:
-                            flask_app.logger.warning(f"사용자 {user.id}의 데이터 처리 재시도 중 ({retry_count}/{max_retries})")
+            # 할 일이 있는 사용자만 한 번의 쿼리로 골라서 원장에 넣는다
+            # 이미 원장에 있는 사용자(이전 실행에서 완료된 행 포함)는 다시 넣지 않는다
+            enqueued = job_ledger.enqueue_query('daily', yesterday, yesterday, _daily_candidates(yesterday))
+            flask_app.logger.info(f"일일 작업 대상 사용자 {enqueued}명을 원장에 추가했습니다")
+            results = drain_job('daily', yesterday)
                             
         except Exception as e:
             flask_app.logger.error(f"일일 데이터 처리 중 오류 발생: {str(e)}")
             return
-            
-        flask_app.logger.info("일일 데이터 처리가 완료되었습니다")
+        
+        _log_job_result('daily', yesterday, results, time.perf_counter() - started_at)
 
 def process_weekly_data():
     if not flask_app:
         raise RuntimeError("Flask 앱이 초기화되지 않았습니다")
         
     with flask_app.app_context():
-        today = datetime.now().date()
+        started_at = time.perf_counter()
+        # 월요일 실행 시 어제(일요일)까지의 지난주를 처리
+        start_date, end_date = EmbeddingService().get_week_dates(datetime.now().date() - timedelta(days=1))
         
         try:
-            embedding_service = EmbeddingService()
-            
-            users = User.query.with_entities(User.id, User.username).all()
-            if not users:
-                flask_app.logger.warning("시스템에 사용자가 없습니다")
-                return
-                
-            for user in users:
-                retry_count = 0
-                max_retries = 3
-                
-                while retry_count < max_retries:
-                    try:
-                        start_date, end_date = embedding_service.get_week_dates(today)
-                        
-                        existing_summary = Summary.query.filter(
-                            Summary.user_id == user.id,
-                            Summary.type == 'weekly',
-                            Summary.start_date == start_date,
-                            Summary.end_date == end_date
-                        ).first()
-                        
-                        if existing_summary:
-                            flask_app.logger.info(f"사용자 {user.id}의 {start_date}~{end_date} 주간 요약이 이미 존재합니다, 건너뜁니다...")
-                            break
-                        
-                        has_data = CleanedData.query.filter(
-                            CleanedData.user_id == user.id,
-                            CleanedData.select_date >= start_date,
-                            CleanedData.select_date <= end_date
-                        ).first()
-                        
-                        if not has_data:
-                            flask_app.logger.info(f"사용자 {user.id}의 {start_date}~{end_date} 기간 동안의 데이터가 없습니다, 건너뜁니다...")
-                            break
-                            
-                        success, message = embedding_service.process_weekly_data(user.id, today)
-                        
-                        if success:
-                            flask_app.logger.info(f"사용자 {user.id}의 주간 데이터가 성공적으로 처리되었습니다")
-                            break
-                        else:
-                            retry_count += 1
-                            if retry_count == max_retries:
-                                flask_app.logger.error(f"사용자 {user.id}의 주간 데이터 처리 최대 재시도 횟수 초과: {message}")
-                            else:
-                                flask_app.logger.warning(f"사용자 {user.id}의 주간 데이터 처리 재시도 중 ({retry_count}/{max_retries}): {message}")
-                    except Exception as e:
-                        retry_count += 1
-                        if retry_count == max_retries:
-                            flask_app.logger.error(f"사용자 {user.id}의 주간 데이터 처리 중 오류 발생: {str(e)}")
-                        else:
-                            flask_app.logger.warning(f"사용자 {user.id}의 주간 데이터 처리 재시도 중 ({retry_count}/{max_retries})")
+            # 할 일이 있는 사용자만 한 번의 쿼리로 골라서 원장에 넣는다
+            enqueued = job_ledger.enqueue_query('weekly', start_date, end_date, _weekly_candidates(start_date, end_date))
+            flask_app.logger.info(f"주간 작업 대상 사용자 {enqueued}명을 원장에 추가했습니다")
+            results = drain_job('weekly', start_date)
                             
         except Exception as e:
             flask_app.logger.error(f"주간 데이터 처리 중 오류 발생: {str(e)}")
             return
             
-        flask_app.logger.info("주간 데이터 처리가 완료되었습니다")
+        _log_job_result('weekly', start_date, results, time.perf_counter() - started_at)
+
+def process_monthly_data():
+    # 지난달에 시작한 주간 요약을 월간 요약으로 압축
+    if not flask_app:
+        raise RuntimeError("Flask 앱이 초기화되지 않았습니다")
+        
+    with flask_app.app_context():
+        started_at = time.perf_counter()
+        last_month = datetime.now().date().replace(day=1) - timedelta(days=1)
+        start_date, end_date = EmbeddingService().get_month_dates(last_month)
+        
+        try:
+            # 할 일이 있는 사용자만 한 번의 쿼리로 골라서 원장에 넣는다
+            enqueued = job_ledger.enqueue_query('monthly', start_date, end_date, _monthly_candidates(start_date, end_date))
+            flask_app.logger.info(f"월간 작업 대상 사용자 {enqueued}명을 원장에 추가했습니다")
+            results = drain_job('monthly', start_date)
+                            
+        except Exception as e:
+            flask_app.logger.error(f"월간 데이터 처리 중 오류 발생: {str(e)}")
+            return
+            
+        _log_job_result('monthly', start_date, results, time.perf_counter() - started_at)
+
+def resume_unfinished_jobs():
+    # 재시작 전에 끝나지 않은 실행(대기/중단된 행)을 이어서 처리
+    if not flask_app:
+        raise RuntimeError("Flask 앱이 초기화되지 않았습니다")
+
+    with flask_app.app_context():
+        since = datetime.now().date() - timedelta(days=flask_app.config['JOB_LEDGER_RESUME_DAYS'])
+        try:
+            runs = job_ledger.unfinished_runs(since)
+        except Exception as e:
+            flask_app.logger.error(f"미완료 작업 조회 중 오류 발생: {str(e)}")
+            return
+
+        for job, period_start in runs:
+            if job not in JOB_HANDLERS:
+                continue
+            flask_app.logger.info(f"미완료 {job} 작업 {period_start}을 이어서 처리합니다")
+            started_at = time.perf_counter()
+            try:
+                results = drain_job(job, period_start)
+            except Exception as e:
+                flask_app.logger.error(f"{job} 작업 {period_start} 재개 중 오류 발생: {str(e)}")
+                continue
+            _log_job_result(job, period_start, results, time.perf_counter() - started_at)
+
+def _leader_only(job):
+    # 여러 워커/컨테이너가 같은 시각에 작업을 실행해도 리더 락을 가진 프로세스만 처리한다
+    @wraps(job)
+    def run():
+        if not flask_app:
+            raise RuntimeError("Flask 앱이 초기화되지 않았습니다")
+
+        with flask_app.app_context():
+            try:
+                is_leader = leader_lock.is_leader(flask_app)
+            except Exception as e:
+                flask_app.logger.error(f"리더 선출 중 오류 발생, {job.__name__}을 건너뜁니다: {str(e)}")
+                return
+
+        if not is_leader:
+            flask_app.logger.info(f"다른 프로세스가 스케줄러 리더입니다, {job.__name__}을 건너뜁니다...")
+            return
+        return job()
+
+    return run
 
 def init_scheduler():
     try:
         scheduler.add_job(
-            process_yesterday_data,
+            _leader_only(process_yesterday_data),
             'cron',
             hour=0,
             minute=1,
@@ -160,7 +468,7 @@ def init_scheduler():
         )
         
         scheduler.add_job(
-            process_weekly_data,
+            _leader_only(process_weekly_data),
             'cron',
             day_of_week='mon',
             hour=1,
@@ -168,9 +476,32 @@ def init_scheduler():
             id='process_weekly_data'
         )
         
+        # 지난달 마지막 주의 주간 요약이 만들어진 뒤 (매월 8일)
+        scheduler.add_job(
+            _leader_only(process_monthly_data),
+            'cron',
+            day=8,
+            hour=2,
+            minute=0,
+            id='process_monthly_data'
+        )
+        
+        # 시작 직후 한 번 실행 (run_date 생략 = 지금)
+        scheduler.add_job(
+            _leader_only(resume_unfinished_jobs),
+            'date',
+            id='resume_unfinished_jobs'
+        )
+        
         scheduler.start()
-        atexit.register(lambda: scheduler.shutdown())
+        atexit.register(shutdown_scheduler)
         
         return True, "스케줄러가 성공적으로 초기화되었습니다"
     except Exception as e:
-        return False, f"스케줄러 초기화 중 오류 발생: {str(e)}"
\ No newline at end of file
+        return False, f"스케줄러 초기화 중 오류 발생: {str(e)}"
+
+def shutdown_scheduler():
+    if scheduler.running:
+        scheduler.shutdown()
+    # 락을 바로 풀어서 다른 프로세스가 다음 작업 시각에 리더를 이어받게 한다
+    leader_lock.release()
@@ -1,2 +1,3 @@
 from .llm_service import LLMService
-from .embedding import EmbeddingService
\ No newline at end of file
+from .embedding import EmbeddingService
+from .async_llm_service import AsyncLLMService
@@ -0,0 +1,196 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple, Union
+from app.utils.llm_service import LLMService
+from app.utils.clients import clients
+from app.utils.concurrency import run_in_app_context
+from app.utils.embedding_cache import embedding_cache
+from app.utils.metrics import metrics, record_embedding_usage, record_llm_usage
+
+
+class AsyncLLMService:
+    """LLMService의 비동기 버전 (ASGI 경로용).
+
+    OpenAI 호출은 ainvoke/astream/aembed_query로 이벤트 루프에서 기다리고,
+    DB 작업은 LLMService의 동기 메서드를 그대로 asyncio.to_thread로 실행한다
+    (스레드마다 새 앱 컨텍스트 = 별도의 DB 세션). 프롬프트와 파싱은 LLMService와 공유한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.service = LLMService()
+        # 모든 요청이 같은 LLMService를 여러 스레드에서 쓰므로 지연 초기화하지 않고 여기서 만든다
+        self.service._init_model()
+        self.service._init_embedding_service()
+        self.service.embedding_service._init_model()
+
+    @property
+    def chat_model(self):
+        return clients.chat_model
+
+    async def _run_sync(self, func, *args, **kwargs):
+        return await asyncio.to_thread(run_in_app_context, self.app, func, *args, **kwargs)
+
+    async def get_chat_response(self, user_id: int, question: str) -> Tuple[bool, str]:
+        success, messages = await self._prepare_chat_messages(user_id, question)
+        if not success:
+            return False, messages
+
+        try:
+            response = await self._ainvoke('chat', messages, user_id=user_id)
+            return True, response.content
+        except Exception as e:
+            self.app.logger.error(f"챗봇 응답 생성 중 오류가 발생했습니다: {str(e)}")
+            return False, "챗봇 응답 생성 중 오류가 발생했습니다."
+
+    async def stream_chat_response(self, user_id: int, question: str) -> Tuple[bool, Union[AsyncIterator[str], str]]:
+        success, messages = await self._prepare_chat_messages(user_id, question)
+        if not success:
+            return False, messages
+
+        return True, self._stream_tokens('chat', messages, user_id)
+
+    async def _prepare_chat_messages(self, user_id: int, question: str) -> Tuple[bool, Union[List, str]]:
+        # 의도 분석 동안 유사 요약 검색과 스냅샷 조회를 동시에 진행
+        summaries_task = asyncio.create_task(self._get_similar_summaries(user_id, question))
+        snapshot_task = asyncio.create_task(self._run_sync(self.service._get_context_snapshot, user_id))
+
+        try:
+            intent = await self._analyze_user_intent(question, user_id)
+            success, result = await self._run_sync(self.service._execute_user_intent, user_id, question, intent)
+            similar_summaries, snapshot = await asyncio.gather(summaries_task, snapshot_task)
+        except BaseException:
+            summaries_task.cancel()
+            snapshot_task.cancel()
+            raise
+
+        if not success:
+            return False, result
+
+        if result[2] is not None:
+            # 할일/일정이 변경되었으면 변경 사항이 반영된 스냅샷을 다시 받는다
+            snapshot = await self._run_sync(self.service._get_context_snapshot, user_id)
+
+        with self.app.app_context():
+            messages = self.service._build_chat_messages(user_id, question, result, similar_summaries, snapshot)
+        return True, messages
+
+    async def _analyze_user_intent(self, question: str, user_id: Optional[int] = None) -> Tuple[str, str, dict]:
+        with self.app.app_context():
+            intent = self.service._classify_intent_by_rule(question)
+        if intent is not None:
+            return intent
+
+        response = await self._ainvoke('intent', self.service._intent_messages(question), stage='intent_llm', user_id=user_id)
+        with self.app.app_context():
+            return self.service._parse_intent_response(question, response.content)
+
+    async def _get_similar_summaries(self, user_id: int, query: str, limit: int = 3) -> List[str]:
+        try:
+            with metrics.timer('query_embedding'):
+                query_embedding = await self._create_embedding(query, user_id)
+            similar_summaries = await self._run_sync(self.service._search_similar_summaries, user_id, query_embedding, limit)
+
+            return [
+                self.service._format_summary(summary['start_date'], summary['end_date'], summary['summary_text'])
+                for summary in similar_summaries
+            ]
+        except Exception as e:
+            self.app.logger.error(f"유사한 주간 요약 검색 중 오류가 발생했습니다: {str(e)}")
+            return []
+
+    async def _create_embedding(self, text: str, user_id: Optional[int] = None) -> List[float]:
+        model = self.app.config['OPENAI_EMBEDDING_MODEL']
+        # 캐시는 DB 2차 캐시를 조회할 수 있으므로 스레드에서 실행
+        cached = await self._run_sync(embedding_cache.get, model, text)
+        if cached is not None:
+            return cached
+
+        started_at = time.perf_counter()
+        embedding = await clients.embedding_model.aembed_query(text)
+        record_embedding_usage('query_embedding', [text], time.perf_counter() - started_at, [user_id])
+        await self._run_sync(embedding_cache.set, model, text, embedding)
+        return embedding
+
+    async def _stream_tokens(self, endpoint: str, messages: List, user_id: Optional[int] = None) -> AsyncIterator[str]:
+        aggregate = None
+        with metrics.timer(f'{endpoint}_completion') as timer:
+            async for chunk in self.chat_model.astream(messages):
+                aggregate = chunk if aggregate is None else aggregate + chunk
+                if chunk.content:
+                    yield chunk.content
+        record_llm_usage(endpoint, aggregate, timer.elapsed, user_id)
+
+    async def _ainvoke(self, endpoint: str, messages: List, stage: str = None, user_id: Optional[int] = None):
+        with metrics.timer(stage or f'{endpoint}_completion') as timer:
+            response = await self.chat_model.ainvoke(messages)
+        record_llm_usage(endpoint, response, timer.elapsed, user_id)
+        return response
+
+    async def create_feedback(self, user_id: int, select_date: datetime.date, force_refresh: bool = False) -> Tuple[bool, str]:
+        messages, fingerprint = await self._run_sync(self.service._prepare_feedback_messages, user_id, select_date)
+
+        cached = await self._run_sync(self.service._get_cached_response, 'feedback', user_id, select_date, fingerprint, force_refresh)
+        if cached is not None:
+            return True, cached
+
+        try:
+            response = await self._ainvoke('feedback', messages, user_id=user_id)
+            feedback_text = response.content
+
+            await self._run_sync(self.service._save_feedback, user_id, select_date, feedback_text, fingerprint)
+
+            return True, feedback_text
+        except Exception as e:
+            self.app.logger.error(f"피드백 생성 중 오류가 발생했습니다: {str(e)}")
+            return False, "피드백 생성 중 오류가 발생했습니다."
+
+    async def stream_feedback(self, user_id: int, select_date: datetime.date, force_refresh: bool = False) -> Tuple[bool, Union[AsyncIterator[str], str]]:
+        messages, fingerprint = await self._run_sync(self.service._prepare_feedback_messages, user_id, select_date)
+
+        cached = await self._run_sync(self.service._get_cached_response, 'feedback', user_id, select_date, fingerprint, force_refresh)
+        if cached is not None:
+            return True, self._single(cached)
+
+        async def generate():
+            chunks = []
+            async for token in self._stream_tokens('feedback', messages, user_id):
+                chunks.append(token)
+                yield token
+            # 스트림이 끝까지 전송된 경우에만 한 번 저장
+            await self._run_sync(self.service._save_feedback, user_id, select_date, "".join(chunks), fingerprint)
+
+        return True, generate()
+
+    async def create_recommendation(self, user_id: int, force_refresh: bool = False) -> Tuple[bool, str]:
+        today = datetime.now().date()
+        messages, fingerprint = await self._run_sync(self.service._prepare_recommendation_messages, user_id)
+
+        cached = await self._run_sync(self.service._get_cached_response, 'recommend', user_id, today, fingerprint, force_refresh)
+        if cached is not None:
+            return True, cached
+
+        response = await self._ainvoke('recommend', messages, user_id=user_id)
+        await self._run_sync(self.service._save_recommendation, user_id, today, response.content, fingerprint)
+        return True, response.content
+
+    async def stream_recommendation(self, user_id: int, force_refresh: bool = False) -> Tuple[bool, Union[AsyncIterator[str], str]]:
+        today = datetime.now().date()
+        messages, fingerprint = await self._run_sync(self.service._prepare_recommendation_messages, user_id)
+
+        cached = await self._run_sync(self.service._get_cached_response, 'recommend', user_id, today, fingerprint, force_refresh)
+        if cached is not None:
+            return True, self._single(cached)
+
+        async def generate():
+            chunks = []
+            async for token in self._stream_tokens('recommend', messages, user_id):
+                chunks.append(token)
+                yield token
+            await self._run_sync(self.service._save_recommendation, user_id, today, "".join(chunks), fingerprint)
+
+        return True, generate()
+
+    async def _single(self, text: str) -> AsyncIterator[str]:
+        yield text
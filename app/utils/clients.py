@@ -0,0 +1,163 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+import httpx
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+
+class ClientRegistry:
+    # 프로세스 전체에서 공유하는 OpenAI 채팅/임베딩 클라이언트와 keep-alive HTTP 커넥션 풀
+    # OpenAI/httpx 클라이언트는 스레드 안전하므로 요청마다 새로 만들지 않는다.
+    # 비동기 풀(ainvoke/astream/aembed_query)은 이벤트 루프에 묶이므로 ASGI 서버의 루프 하나에서만 사용한다.
+    # langchain_openai(openai, tiktoken, pydantic 모델 포함)는 import가 무거워 첫 사용 시점에 불러온다.
+
+    def __init__(self, app=None):
+        self.config = None
+        self._lock = threading.Lock()
+        self._http_client = None
+        self._async_http_client = None
+        self._chat_model = None
+        self._embedding_model = None
+        self.requests = 0
+        self.connections_opened = 0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.config = app.config
+        app.extensions['clients'] = self
+
+    def _get_http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            with self._lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        limits=self._limits(),
+                        timeout=self.config['OPENAI_REQUEST_TIMEOUT'],
+                        event_hooks={'request': [self._on_request]}
+                    )
+        return self._http_client
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        if self._async_http_client is None:
+            with self._lock:
+                if self._async_http_client is None:
+                    self._async_http_client = httpx.AsyncClient(
+                        limits=self._limits(),
+                        timeout=self.config['OPENAI_REQUEST_TIMEOUT'],
+                        event_hooks={'request': [self._on_async_request]}
+                    )
+        return self._async_http_client
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config['OPENAI_HTTP_MAX_CONNECTIONS'],
+            max_keepalive_connections=self.config['OPENAI_HTTP_MAX_KEEPALIVE'],
+            keepalive_expiry=self.config['OPENAI_HTTP_KEEPALIVE_EXPIRY']
+        )
+
+    def _on_request(self, request: httpx.Request):
+        with self._lock:
+            self.requests += 1
+        # 새 TCP 연결이 열릴 때만 trace 이벤트가 발생 -> 재사용 횟수 = 요청 수 - 새 연결 수
+        request.extensions['trace'] = self._trace
+
+    def _trace(self, event_name: str, info: Dict):
+        if event_name == 'connection.connect_tcp.complete':
+            with self._lock:
+                self.connections_opened += 1
+
+    async def _on_async_request(self, request: httpx.Request):
+        with self._lock:
+            self.requests += 1
+        request.extensions['trace'] = self._async_trace
+
+    async def _async_trace(self, event_name: str, info: Dict):
+        self._trace(event_name, info)
+
+    @property
+    def chat_model(self) -> 'ChatOpenAI':
+        if self._chat_model is None:
+            from langchain_openai import ChatOpenAI
+            http_client = self._get_http_client()
+            http_async_client = self._get_async_http_client()
+            with self._lock:
+                if self._chat_model is None:
+                    self._chat_model = ChatOpenAI(
+                        model=self.config['OPENAI_MODEL'],
+                        temperature=self.config['OPENAI_TEMPERATURE'],
+                        api_key=self.config['OPENAI_API_KEY'],
+                        base_url=self.config['OPENAI_BASE_URL'],
+                        max_retries=self.config['OPENAI_MAX_RETRIES'],
+                        stream_usage=True,  # 스트리밍 응답에도 토큰 사용량 포함
+                        http_client=http_client,
+                        http_async_client=http_async_client
+                    )
+        return self._chat_model
+
+    @property
+    def embedding_model(self) -> 'OpenAIEmbeddings':
+        if self._embedding_model is None:
+            from langchain_openai import OpenAIEmbeddings
+            http_client = self._get_http_client()
+            http_async_client = self._get_async_http_client()
+            with self._lock:
+                if self._embedding_model is None:
+                    self._embedding_model = OpenAIEmbeddings(
+                        model=self.config['OPENAI_EMBEDDING_MODEL'],
+                        api_key=self.config['OPENAI_API_KEY'],
+                        base_url=self.config['OPENAI_BASE_URL'],
+                        max_retries=self.config['OPENAI_MAX_RETRIES'],
+                        http_client=http_client,
+                        http_async_client=http_async_client
+                    )
+        return self._embedding_model
+
+    def override(self, chat_model=None, embedding_model=None):
+        # 벤치마크 등에서 OpenAI 클라이언트 대신 같은 인터페이스의 대역을 쓴다
+        with self._lock:
+            if chat_model is not None:
+                self._chat_model = chat_model
+            if embedding_model is not None:
+                self._embedding_model = embedding_model
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = {
+                'requests': self.requests,
+                'connections_opened': self.connections_opened,
+                'connections_reused': max(self.requests - self.connections_opened, 0),
+            }
+
+        max_connections = self.config['OPENAI_HTTP_MAX_CONNECTIONS'] if self.config else None
+        stats['pool'] = self._pool_stats(self._http_client, max_connections)
+        stats['async_pool'] = self._pool_stats(self._async_http_client, max_connections)
+        return stats
+
+    def _pool_stats(self, client, max_connections: Optional[int]) -> Dict:
+        pool = getattr(getattr(client, '_transport', None), '_pool', None)
+        connections = list(getattr(pool, 'connections', []))
+        return {
+            'max_connections': max_connections,
+            'open': len(connections),
+            'idle': sum(1 for connection in connections if connection.is_idle()),
+        }
+
+    async def aclose(self):
+        # ASGI lifespan 종료 시 호출 (비동기 풀은 자신의 이벤트 루프에서 닫아야 한다)
+        if self._async_http_client is not None:
+            await self._async_http_client.aclose()
+        self.close()
+
+    def close(self):
+        with self._lock:
+            if self._http_client is not None:
+                self._http_client.close()
+            self._http_client = None
+            self._async_http_client = None
+            self._chat_model = None
+            self._embedding_model = None
+
+
+clients = ClientRegistry()
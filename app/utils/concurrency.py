@@ -0,0 +1,4 @@
+def run_in_app_context(app, func, *args, **kwargs):
+    # 다른 스레드에서 실행할 때는 새 앱 컨텍스트(= 별도의 DB 세션)를 연다
+    with app.app_context():
+        return func(*args, **kwargs)
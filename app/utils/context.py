@@ -0,0 +1,103 @@
+from functools import lru_cache
+import logging
+from typing import Dict, Iterable, List, Optional
+
+# 잘린 항목이라도 이보다 적은 토큰만 남으면 넣지 않는다
+MIN_TRUNCATED_TOKENS = 32
+TRUNCATION_MARKER = "..."
+
+
+class _ApproximateEncoding:
+    # tiktoken 인코딩 파일을 받을 수 없는 환경(오프라인 등)을 위한 근사치: 약 2글자 = 1토큰
+    chars_per_token = 2
+
+    def encode(self, text: str) -> List[str]:
+        return [text[i:i + self.chars_per_token] for i in range(0, len(text), self.chars_per_token)]
+
+    def decode(self, tokens: List[str]) -> str:
+        return "".join(tokens)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    try:
+        import tiktoken  # 첫 토큰 계산 때 불러온다 (시작 시간 단축)
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"tiktoken 인코딩을 불러오지 못해 근사치를 사용합니다: {str(e)}")
+        return _ApproximateEncoding()
+
+
+def count_tokens(model: str, text: str) -> int:
+    return len(_get_encoding(model).encode(text))
+
+
+class ContextAssembler:
+    """토큰 예산 안에서 섹션별로 컨텍스트를 채운다.
+
+    섹션은 add_section을 호출한 순서가 곧 우선순위이며, 각 섹션의 항목은
+    이미 중요도 순으로 정렬되어 있다고 가정한다. 예산을 넘는 항목은 잘라서
+    넣고, 그 뒤의 항목은 더 이상 읽지 않는다 (지연 이터러블을 넘기면 DB 조회도 멈춘다).
+    """
+
+    def __init__(self, model: str, budget: int):
+        self.budget = budget
+        self.used = 0
+        self.usage: Dict[str, int] = {}
+        self._encoding = _get_encoding(model)
+
+    @property
+    def remaining(self) -> int:
+        return max(self.budget - self.used, 0)
+
+    def count_tokens(self, text: str) -> int:
+        return len(self._encoding.encode(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self._encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        marker_tokens = self.count_tokens(TRUNCATION_MARKER)
+        return self._encoding.decode(tokens[:max(max_tokens - marker_tokens, 0)]) + TRUNCATION_MARKER
+
+    def add_section(self, name: str, items: Iterable[str], header: Optional[str] = None,
+                    max_tokens: Optional[int] = None) -> List[str]:
+        limit = self.remaining if max_tokens is None else min(max_tokens, self.remaining)
+        lines = []
+        section_used = 0
+
+        if header:
+            header_tokens = self.count_tokens(header)
+            if header_tokens >= limit:
+                self.usage[name] = 0
+                return []
+            lines.append(header)
+            section_used += header_tokens
+
+        for item in items:
+            available = limit - section_used
+            if available <= 0:
+                break
+
+            item_tokens = self.count_tokens(item)
+            if item_tokens > available:
+                if available >= MIN_TRUNCATED_TOKENS:
+                    item = self.truncate(item, available)
+                    lines.append(item)
+                    section_used += self.count_tokens(item)
+                break
+
+            lines.append(item)
+            section_used += item_tokens
+
+        # 헤더만 남은 섹션은 버린다
+        if header and len(lines) == 1:
+            lines = []
+            section_used = 0
+
+        self.used += section_used
+        self.usage[name] = section_used
+        return lines
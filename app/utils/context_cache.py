@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+from flask import current_app
+from app.utils.cache import TTLCache
+
+
+class ContextSnapshotCache:
+    # 사용자별 컨텍스트 스냅샷 (최근 요약, 오늘 데이터, 과거 일일 데이터)
+    # 같은 프로세스의 쓰기 경로는 invalidate()로 즉시 무효화하고,
+    # 다른 워커/백엔드에서 들어온 변경은 CONTEXT_CACHE_TTL 이내에 반영된다.
+
+    def __init__(self):
+        self._cache = None
+        self._lock = threading.Lock()
+        # 로딩 중인 사용자만 추적한다 (로딩이 모두 끝나면 지우므로 동시에 로딩 중인 사용자 수를 넘지 않는다)
+        self._loading: Dict[int, int] = {}
+        self._versions: Dict[int, int] = {}
+        self.invalidations = 0
+        self.db_time_spent = 0.0
+        self.db_time_saved = 0.0
+        # 적중한 스냅샷이 현재 상태인지 확인하는 쿼리(_get_current_context_snapshot)에 쓴 시간
+        self.validation_time = 0.0
+        self.stale_hits = 0
+
+    def _get_cache(self) -> TTLCache:
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = TTLCache(
+                        maxsize=current_app.config['CONTEXT_CACHE_SIZE'],
+                        ttl=current_app.config['CONTEXT_CACHE_TTL']
+                    )
+        return self._cache
+
+    def get_or_load(self, user_id: int, today, loader: Callable[[], Dict]) -> Dict:
+        cache = self._get_cache()
+        snapshot = cache.get(user_id)
+        if snapshot is not None and snapshot['date'] == today:
+            with self._lock:
+                self.db_time_saved += snapshot['db_time']
+            return snapshot
+
+        with self._lock:
+            self._loading[user_id] = self._loading.get(user_id, 0) + 1
+            version = self._versions.get(user_id, 0)
+
+        try:
+            started_at = time.perf_counter()
+            snapshot = loader()
+            snapshot['date'] = today
+            snapshot['db_time'] = time.perf_counter() - started_at
+
+            with self._lock:
+                self.db_time_spent += snapshot['db_time']
+                # 로딩 중에 무효화되었다면 오래된 스냅샷을 저장하지 않는다
+                if self._versions.get(user_id, 0) == version:
+                    cache.set(user_id, snapshot)
+            return snapshot
+        finally:
+            with self._lock:
+                self._loading[user_id] -= 1
+                if not self._loading[user_id]:
+                    del self._loading[user_id]
+                    self._versions.pop(user_id, None)
+
+    def invalidate(self, user_id: int):
+        with self._lock:
+            if user_id in self._loading:
+                self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self.invalidations += 1
+        if self._cache is not None:
+            self._cache.pop(user_id)
+
+    def record_validation(self, seconds: float, stale_snapshot: Optional[Dict] = None):
+        # 확인 비용은 아낀 시간에서 빼고, 상태가 달라 다시 읽었다면 그 적중으로 아꼈다고 센 시간도 되돌린다
+        with self._lock:
+            self.validation_time += seconds
+            if stale_snapshot is not None:
+                self.stale_hits += 1
+                self.db_time_saved -= stale_snapshot['db_time']
+
+    def stats(self) -> Dict:
+        stats = self._cache.stats() if self._cache else {'hits': 0}
+        with self._lock:
+            stats['invalidations'] = self.invalidations
+            stats['db_time_spent'] = round(self.db_time_spent, 4)
+            stats['stale_hits'] = self.stale_hits
+            stats['validation_time'] = round(self.validation_time, 4)
+            # 확인 쿼리 비용을 뺀 순수 절약 시간
+            saved = self.db_time_saved - self.validation_time
+            stats['db_time_saved'] = round(saved, 4)
+            stats['avg_db_time_saved_per_hit'] = round(saved / stats['hits'], 4) if stats['hits'] else 0.0
+        return stats
+
+
+context_cache = ContextSnapshotCache()
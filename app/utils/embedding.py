@@ -1,30 +1,30 @@
+import time
 from datetime import datetime, timedelta
-from typing import List, Tuple
-from langchain_community.chat_models import ChatOpenAI
-from langchain_openai import OpenAIEmbeddings
-from langchain.schema import SystemMessage, HumanMessage
+from typing import Dict, List, Optional, Sequence, Tuple
 from app.models import CleanedData, Summary, Embedding
 from app.extensions import db
+from app.utils.clients import clients
+from app.utils.embedding_cache import embedding_cache
+from app.utils.context_cache import context_cache
+from app.utils.metrics import metrics, record_embedding_usage, record_llm_usage
 from flask import current_app
+from sqlalchemy import bindparam, delete, func, or_, text, update
+from sqlalchemy.dialects.postgresql import insert
+
+VECTOR_ITERATIVE_SCAN_MODES = ('strict_order', 'relaxed_order')
 
 
 class EmbeddingService:
-    def __init__(self):
+    def __init__(self, job: Optional[str] = None):
+        self.job = job  # 토큰 사용량에 기록할 작업 이름 (LLMService와 같음)
         self.llm = None
         self.embedding_model = None
         
     def _init_model(self):
         if not self.llm:
-            self.llm = ChatOpenAI(
-                model=current_app.config['OPENAI_MODEL'],
-                temperature=current_app.config['OPENAI_TEMPERATURE'],
-                api_key=current_app.config['OPENAI_API_KEY']
-            )
+            self.llm = clients.chat_model
         if not self.embedding_model:
-            self.embedding_model = OpenAIEmbeddings(
-                model="text-embedding-3-small",
-                api_key=current_app.config['OPENAI_API_KEY']
-            )
+            self.embedding_model = clients.embedding_model
 
     def get_week_dates(self, date: datetime.date) -> Tuple[datetime.date, datetime.date]:
         start_date = date - timedelta(days=date.weekday())  # 월요일
@@ -52,7 +52,7 @@ class EmbeddingService:
             ])
             
             try:
-                summary_text = self._create_weekly_summary(combined_text)
+                summary_text = self._create_weekly_summary(combined_text, user_id)
                 
                 summary = Summary(
                     user_id=user_id,
@@ -62,8 +62,9 @@ class EmbeddingService:
                     end_date=end_date
                 )
                 db.session.add(summary)
+                db.session.flush()  # summary.id 할당
                 
-                embedding_vector = self._create_embedding(summary_text)
+                embedding_vector = self._create_embedding(summary_text, user_id)
                 embedding = Embedding(
                     user_id=user_id,
                     summary_id=summary.id,
@@ -74,10 +75,12 @@ class EmbeddingService:
                 )
                 db.session.add(embedding)
                 
-                for data in cleaned_data:
-                    db.session.delete(data)
+                db.session.execute(delete(CleanedData).where(
+                    CleanedData.id.in_([data.id for data in cleaned_data])
+                ))
                 
                 db.session.commit()
+                context_cache.invalidate(user_id)
                 return True, "주간 데이터 처리 완료"
             except Exception as e:
                 db.session.rollback()
@@ -88,40 +91,645 @@ class EmbeddingService:
             current_app.logger.error(f"주간 데이터 처리 중 오류가 발생했습니다.: {str(e)}")
             return False, "주간 데이터 처리 중 오류가 발생했습니다."
 
-    def _create_weekly_summary(self, text: str) -> str:
+    def process_weekly_batch(self, user_ids: Sequence[int], date: datetime.date) -> Dict[int, Tuple[bool, str]]:
+        # 여러 사용자의 주간 요약을 한 번에 처리: LLM 요약은 동시 실행, 임베딩은 embed_documents로 묶어서,
+        # Summary/Embedding은 bulk insert, CleanedData는 한 번의 DELETE로 처리한다.
+        # 해당 주의 데이터가 없는 사용자는 결과에 포함하지 않는다.
+        self._init_model()
+        start_date, end_date = self.get_week_dates(date)
+        
+        rows = CleanedData.query.with_entities(
+            CleanedData.user_id,
+            CleanedData.select_date,
+            CleanedData.cleaned_text
+        ).filter(
+            CleanedData.user_id.in_(user_ids),
+            CleanedData.select_date >= start_date,
+            CleanedData.select_date <= end_date
+        ).order_by(CleanedData.user_id, CleanedData.select_date).all()
+        
+        texts_by_user: Dict[int, List[str]] = {}
+        for row in rows:
+            texts_by_user.setdefault(row.user_id, []).append(
+                f"{row.select_date.strftime('%Y-%m-%d')}:\n{row.cleaned_text}"
+            )
+        if not texts_by_user:
+            return {}
+        
+        results = {}
+        users = list(texts_by_user)
+        with metrics.timer('weekly_summary_batch') as timer:
+            responses = self.llm.batch(
+                [self._weekly_summary_messages("\n\n".join(texts_by_user[user_id])) for user_id in users],
+                config={'max_concurrency': current_app.config['SCHEDULER_MAX_WORKERS']},
+                return_exceptions=True
+            )
+        
+        summaries = []
+        for user_id, response in zip(users, responses):
+            if isinstance(response, Exception):
+                current_app.logger.error(f"사용자 {user_id}의 주간 데이터 요약 생성 중 오류가 발생했습니다.: {str(response)}")
+                results[user_id] = (False, "주간 데이터 요약 생성 중 오류가 발생했습니다.")
+            else:
+                # 호출별 지연은 알 수 없으므로 동시 실행된 배치 전체 시간을 기록 (상한값)
+                record_llm_usage('weekly_summary', response, timer.elapsed, user_id, self.job)
+                summaries.append((user_id, response.content))
+        if not summaries:
+            return results
+        
+        try:
+            vectors = self._create_embeddings(
+                [summary_text for _, summary_text in summaries],
+                user_ids=[user_id for user_id, _ in summaries]
+            )
+            
+            summary_rows = db.session.execute(
+                insert(Summary).values([{
+                    'user_id': user_id,
+                    'summary_text': summary_text,
+                    'type': 'weekly',
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'is_final': True
+                } for user_id, summary_text in summaries]).returning(Summary.id, Summary.user_id)
+            ).all()
+            # (사용자, 주)마다 요약은 하나이므로 user_id로 반환된 id를 연결
+            summary_ids = {row.user_id: row.id for row in summary_rows}
+            
+            db.session.execute(insert(Embedding).values([{
+                'user_id': user_id,
+                'summary_id': summary_ids[user_id],
+                'type': 'weekly',
+                'embedding': vector,
+                'start_date': start_date,
+                'end_date': end_date
+            } for (user_id, _), vector in zip(summaries, vectors)]))
+            
+            db.session.execute(delete(CleanedData).where(
+                CleanedData.user_id.in_(list(summary_ids)),
+                CleanedData.select_date >= start_date,
+                CleanedData.select_date <= end_date
+            ))
+            
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"주간 데이터 일괄 저장 중 오류가 발생했습니다.: {str(e)}")
+            for user_id, _ in summaries:
+                results[user_id] = (False, "주간 데이터 처리 중 오류가 발생했습니다.")
+            return results
+        
+        for user_id, _ in summaries:
+            context_cache.invalidate(user_id)
+            results[user_id] = (True, "주간 데이터 처리 완료")
+        return results
+
+    def update_running_weekly_summary(self, user_id: int, select_date: datetime.date) -> Tuple[bool, str]:
+        # 하루치 CleanedData가 만들어질 때마다 이번 주 진행 중인 요약과 임베딩을 갱신 (CleanedData는 확정 시 삭제)
+        self._init_model()
+        
+        try:
+            start_date, end_date = self.get_week_dates(select_date)
+            
+            summary = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'weekly',
+                Summary.start_date == start_date,
+                Summary.end_date == end_date
+            ).first()
+            
+            if summary and summary.is_final:
+                return False, "이미 확정된 주간 요약입니다."
+            
+            success, message = self._fold_into_weekly_summary(user_id, summary, start_date, end_date, until=select_date)
+            if success:
+                db.session.commit()
+                context_cache.invalidate(user_id)
+            return success, message
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"주간 요약 갱신 중 오류가 발생했습니다.: {str(e)}")
+            return False, "주간 요약 갱신 중 오류가 발생했습니다."
+
+    def refold_running_weekly_summary(self, user_id: int, select_date: datetime.date) -> Tuple[bool, str]:
+        # 이미 반영된 날(updated_through 이하)의 CleanedData가 다시 만들어지면 진행 중인 요약은 이전 내용을 담고 있으므로
+        # 그 주의 CleanedData로 처음부터 다시 만든다 (남은 데이터가 없으면 요약과 임베딩을 지운다)
+        self._init_model()
+        
+        try:
+            start_date, end_date = self.get_week_dates(select_date)
+            
+            summary = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'weekly',
+                Summary.start_date == start_date,
+                Summary.end_date == end_date,
+                Summary.is_final.is_(False)
+            ).first()
+            
+            if not summary or summary.updated_through is None or select_date > summary.updated_through:
+                return True, "다시 반영할 요약이 없습니다."
+            
+            until = summary.updated_through
+            summary.updated_through = None
+            success, message = self._fold_into_weekly_summary(user_id, summary, start_date, end_date, until=until)
+            if not success:
+                Embedding.query.filter_by(summary_id=summary.id).delete(synchronize_session=False)
+                db.session.delete(summary)
+            db.session.commit()
+            context_cache.invalidate(user_id)
+            return True, "주간 요약 재반영 완료"
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"주간 요약 재반영 중 오류가 발생했습니다.: {str(e)}")
+            return False, "주간 요약 재반영 중 오류가 발생했습니다."
+
+    def discard_day_in_final_week(self, user_id: int, select_date: datetime.date) -> bool:
+        # select_date가 속한 주의 요약이 이미 확정되었으면 True - 그 주의 CleanedData는 확정 때 삭제되었고 다시 반영할 요약도 없으므로
+        # 늦게 들어온 수정으로 만들어진(또는 남아 있던) 그날의 행을 지운다
+        start_date, end_date = self.get_week_dates(select_date)
+        finalized = db.session.query(Summary.query.filter(
+            Summary.user_id == user_id,
+            Summary.type == 'weekly',
+            Summary.start_date == start_date,
+            Summary.end_date == end_date,
+            Summary.is_final.is_(True)
+        ).exists()).scalar()
+        if not finalized:
+            return False
+        
+        deleted = CleanedData.query.filter(
+            CleanedData.user_id == user_id,
+            CleanedData.select_date == select_date
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        if deleted:
+            context_cache.invalidate(user_id)
+        return True
+
+    def finalize_weekly_summary(self, user_id: int, date: datetime.date) -> Tuple[bool, str]:
+        # 진행 중인 요약에 아직 반영되지 않은 날을 마저 반영하고 확정한다
+        self._init_model()
+        
+        try:
+            start_date, end_date = self.get_week_dates(date)
+            
+            summary = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'weekly',
+                Summary.start_date == start_date,
+                Summary.end_date == end_date,
+                Summary.is_final.is_(False)
+            ).first()
+            
+            if not summary:
+                return False, "진행 중인 주간 요약이 없습니다."
+            
+            success, message = self._fold_into_weekly_summary(user_id, summary, start_date, end_date, until=end_date)
+            if not success and summary.updated_through is None:
+                return False, message
+            
+            summary.is_final = True
+            CleanedData.query.filter(
+                CleanedData.user_id == user_id,
+                CleanedData.select_date >= start_date,
+                CleanedData.select_date <= end_date
+            ).delete(synchronize_session=False)
+            
+            db.session.commit()
+            context_cache.invalidate(user_id)
+            return True, "주간 요약 확정 완료"
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"주간 요약 확정 중 오류가 발생했습니다.: {str(e)}")
+            return False, "주간 요약 확정 중 오류가 발생했습니다."
+
+    def finalize_weekly_batch(self, user_ids: Sequence[int], date: datetime.date) -> Dict[int, Tuple[bool, str]]:
+        # 여러 사용자의 진행 중인 요약을 한 번에 확정: 아직 반영되지 않은 날이 있는 요약만 LLM 갱신을 동시 실행하고,
+        # 임베딩은 embed_documents로 묶어서, Summary/Embedding 갱신과 CleanedData 삭제는 한 트랜잭션으로 처리한다.
+        # 진행 중인 요약이 없는 사용자는 결과에 포함하지 않는다.
+        self._init_model()
+        start_date, end_date = self.get_week_dates(date)
+        
+        running = {summary.user_id: summary for summary in Summary.query.filter(
+            Summary.user_id.in_(user_ids),
+            Summary.type == 'weekly',
+            Summary.start_date == start_date,
+            Summary.end_date == end_date,
+            Summary.is_final.is_(False)
+        ).all()}
+        if not running:
+            return {}
+        
+        rows = CleanedData.query.with_entities(
+            CleanedData.user_id,
+            CleanedData.select_date,
+            CleanedData.cleaned_text
+        ).filter(
+            CleanedData.user_id.in_(list(running)),
+            CleanedData.select_date >= start_date,
+            CleanedData.select_date <= end_date
+        ).order_by(CleanedData.user_id, CleanedData.select_date).all()
+        
+        # updated_through 다음 날부터의 데이터만 반영 (updated_through가 없으면 그 주 전체로 새로 만든다)
+        texts_by_user: Dict[int, List[str]] = {}
+        updated_through: Dict[int, datetime.date] = {}
+        for row in rows:
+            through = running[row.user_id].updated_through
+            if through and row.select_date <= through:
+                continue
+            texts_by_user.setdefault(row.user_id, []).append(
+                f"{row.select_date.strftime('%Y-%m-%d')}:\n{row.cleaned_text}"
+            )
+            updated_through[row.user_id] = row.select_date
+        
+        results = {}
+        for user_id, summary in running.items():
+            if user_id not in texts_by_user and summary.updated_through is None:
+                results[user_id] = (False, "새로 반영할 데이터가 없습니다.")
+        
+        updates = []
+        users = list(texts_by_user)
+        if users:
+            messages = []
+            for user_id in users:
+                summary, new_text = running[user_id], "\n\n".join(texts_by_user[user_id])
+                messages.append(self._weekly_summary_messages(new_text) if summary.updated_through is None
+                                else self._update_weekly_summary_messages(summary.summary_text, new_text))
+            with metrics.timer('weekly_summary_batch') as timer:
+                responses = self.llm.batch(
+                    messages,
+                    config={'max_concurrency': current_app.config['SCHEDULER_MAX_WORKERS']},
+                    return_exceptions=True
+                )
+            
+            for user_id, response in zip(users, responses):
+                if isinstance(response, Exception):
+                    current_app.logger.error(f"사용자 {user_id}의 주간 요약 갱신 생성 중 오류가 발생했습니다.: {str(response)}")
+                    results[user_id] = (False, "주간 요약 갱신 생성 중 오류가 발생했습니다.")
+                else:
+                    # 호출별 지연은 알 수 없으므로 동시 실행된 배치 전체 시간을 기록 (상한값)
+                    record_llm_usage('weekly_summary', response, timer.elapsed, user_id, self.job)
+                    updates.append((user_id, response.content))
+        
+        finalized = [user_id for user_id in running if user_id not in results]
+        if not finalized:
+            return results
+        
+        try:
+            if updates:
+                vectors = self._create_embeddings(
+                    [summary_text for _, summary_text in updates],
+                    user_ids=[user_id for user_id, _ in updates]
+                )
+                db.session.execute(update(Summary), [{
+                    'id': running[user_id].id,
+                    'summary_text': summary_text,
+                    'updated_through': updated_through[user_id]
+                } for user_id, summary_text in updates])
+                
+                embeddings = Embedding.__table__
+                db.session.execute(
+                    update(embeddings).where(embeddings.c.summary_id == bindparam('b_summary_id'))
+                    .values(embedding=bindparam('b_embedding')),
+                    [{'b_summary_id': running[user_id].id, 'b_embedding': vector}
+                     for (user_id, _), vector in zip(updates, vectors)]
+                )
+            
+            db.session.execute(update(Summary).where(
+                Summary.id.in_([running[user_id].id for user_id in finalized])
+            ).values(is_final=True))
+            
+            db.session.execute(delete(CleanedData).where(
+                CleanedData.user_id.in_(finalized),
+                CleanedData.select_date >= start_date,
+                CleanedData.select_date <= end_date
+            ))
+            
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"주간 요약 일괄 확정 중 오류가 발생했습니다.: {str(e)}")
+            for user_id in finalized:
+                results[user_id] = (False, "주간 요약 확정 중 오류가 발생했습니다.")
+            return results
+        
+        for user_id in finalized:
+            context_cache.invalidate(user_id)
+            results[user_id] = (True, "주간 요약 확정 완료")
+        return results
+
+    def _fold_into_weekly_summary(self, user_id: int, summary: Optional[Summary], start_date: datetime.date,
+                                  end_date: datetime.date, until: datetime.date) -> Tuple[bool, str]:
+        # updated_through 다음 날부터 until까지의 CleanedData를 요약에 반영 (커밋은 호출 측에서)
+        # updated_through가 없으면 기존 요약 문장을 버리고 새로 만든다
+        query = CleanedData.query.filter(
+            CleanedData.user_id == user_id,
+            CleanedData.select_date >= start_date,
+            CleanedData.select_date <= until
+        )
+        if summary and summary.updated_through:
+            query = query.filter(CleanedData.select_date > summary.updated_through)
+        new_data = query.order_by(CleanedData.select_date).all()
+        
+        if not new_data:
+            return False, "새로 반영할 데이터가 없습니다."
+        
+        new_text = "\n\n".join([
+            f"{data.select_date.strftime('%Y-%m-%d')}:\n{data.cleaned_text}"
+            for data in new_data
+        ])
+        
+        if summary is not None and summary.updated_through is None:
+            summary.summary_text = self._create_weekly_summary(new_text, user_id)
+            Embedding.query.filter_by(summary_id=summary.id).update(
+                {'embedding': self._create_embedding(summary.summary_text, user_id)},
+                synchronize_session=False
+            )
+        elif summary is None:
+            summary_text = self._create_weekly_summary(new_text, user_id)
+            summary = Summary(
+                user_id=user_id,
+                summary_text=summary_text,
+                type='weekly',
+                start_date=start_date,
+                end_date=end_date,
+                is_final=False
+            )
+            db.session.add(summary)
+            db.session.flush()  # summary.id 할당
+            db.session.add(Embedding(
+                user_id=user_id,
+                summary_id=summary.id,
+                type='weekly',
+                embedding=self._create_embedding(summary_text, user_id),
+                start_date=start_date,
+                end_date=end_date
+            ))
+        else:
+            summary.summary_text = self._update_weekly_summary(summary.summary_text, new_text, user_id)
+            Embedding.query.filter_by(summary_id=summary.id).update(
+                {'embedding': self._create_embedding(summary.summary_text, user_id)},
+                synchronize_session=False
+            )
+        
+        summary.updated_through = new_data[-1].select_date
+        return True, "주간 요약 갱신 완료"
+
+    def get_month_dates(self, date: datetime.date) -> Tuple[datetime.date, datetime.date]:
+        start_date = date.replace(day=1)
+        end_date = (start_date + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+        return start_date, end_date
+
+    def get_monthly_cutoff(self, user_id: int) -> Optional[datetime.date]:
+        # 월간 요약이 덮는 마지막 날짜 - 이 날짜 이전에 시작한 주간 요약은 월간 요약으로 대체된다
+        return Summary.query.with_entities(func.max(Summary.end_date)).filter(
+            Summary.user_id == user_id,
+            Summary.type == 'monthly'
+        ).scalar()
+
+    def process_monthly_data(self, user_id: int, date: datetime.date) -> Tuple[bool, str]:
+        # 해당 월에 시작한 주간 요약들을 하나의 월간 요약/임베딩으로 압축 (주간 요약은 그대로 둔다)
+        self._init_model()
+        
+        try:
+            start_date, end_date = self.get_month_dates(date)
+            
+            weekly_summaries = Summary.query.filter(
+                Summary.user_id == user_id,
+                Summary.type == 'weekly',
+                Summary.is_final.is_(True),
+                Summary.start_date >= start_date,
+                Summary.start_date <= end_date
+            ).order_by(Summary.start_date).all()
+            
+            if not weekly_summaries:
+                return False, "해당 월의 주간 요약이 없습니다."
+            
+            combined_text = "\n\n".join([
+                f"{summary.start_date.strftime('%Y-%m-%d')}~{summary.end_date.strftime('%Y-%m-%d')}:\n{summary.summary_text}"
+                for summary in weekly_summaries
+            ])
+            
+            try:
+                summary_text = self._create_monthly_summary(combined_text, user_id)
+                
+                summary = Summary(
+                    user_id=user_id,
+                    summary_text=summary_text,
+                    type='monthly',
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                db.session.add(summary)
+                db.session.flush()  # summary.id 할당
+                
+                embedding = Embedding(
+                    user_id=user_id,
+                    summary_id=summary.id,
+                    type='monthly',
+                    embedding=self._create_embedding(summary_text, user_id),
+                    start_date=start_date,
+                    end_date=end_date
+                )
+                db.session.add(embedding)
+                
+                db.session.commit()
+                context_cache.invalidate(user_id)
+                return True, "월간 데이터 처리 완료"
+            except Exception as e:
+                db.session.rollback()
+                current_app.logger.error(f"월간 데이터 처리 중 오류가 발생했습니다.: {str(e)}")
+                return False, "월간 데이터 처리 중 오류가 발생했습니다."
+            
+        except Exception as e:
+            current_app.logger.error(f"월간 데이터 처리 중 오류가 발생했습니다.: {str(e)}")
+            return False, "월간 데이터 처리 중 오류가 발생했습니다."
+
+    def _apply_vector_search_settings(self, ef_search: Optional[int] = None, probes: Optional[int] = None):
+        # 현재 트랜잭션에만 적용 (SET LOCAL)
+        index_type = current_app.config['VECTOR_INDEX_TYPE']
+        
+        if index_type == 'hnsw':
+            ef_search = ef_search or current_app.config['VECTOR_HNSW_EF_SEARCH']
+            db.session.execute(text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}"))
+            
+            # 사용자 필터 때문에 k개보다 적게 나오는 문제 방지 (pgvector 0.8+)
+            iterative_scan = current_app.config['VECTOR_HNSW_ITERATIVE_SCAN']
+            if iterative_scan:
+                if iterative_scan not in VECTOR_ITERATIVE_SCAN_MODES:
+                    raise ValueError(f"지원하지 않는 iterative_scan 값입니다: {iterative_scan}")
+                db.session.execute(text(f"SET LOCAL hnsw.iterative_scan = {iterative_scan}"))
+        elif index_type == 'ivfflat':
+            probes = probes or current_app.config['VECTOR_IVFFLAT_PROBES']
+            db.session.execute(text(f"SET LOCAL ivfflat.probes = {int(probes)}"))
+
+    def search_similar_summaries(self, user_id: int, query_embedding: List[float], limit: int = 3,
+                                 types: Sequence[str] = ('weekly',), start_date: Optional[datetime.date] = None,
+                                 end_date: Optional[datetime.date] = None, weekly_after: Optional[datetime.date] = None,
+                                 ef_search: Optional[int] = None, probes: Optional[int] = None) -> List[Dict]:
+        self._apply_vector_search_settings(ef_search=ef_search, probes=probes)
+        
+        # 임베딩 거리 정렬과 요약 본문을 한 번의 조인 쿼리로 가져온다
+        distance = Embedding.embedding.cosine_distance(query_embedding).label('distance')
+        
+        query = db.session.query(
+            Summary.id,
+            Summary.type,
+            Summary.summary_text,
+            Summary.start_date,
+            Summary.end_date,
+            distance
+        ).join(
+            Embedding, Embedding.summary_id == Summary.id
+        ).filter(
+            Embedding.user_id == user_id,
+            Embedding.type.in_(types)
+        )
+        
+        # 기간이 겹치는 요약만
+        if start_date:
+            query = query.filter(Embedding.end_date >= start_date)
+        if end_date:
+            query = query.filter(Embedding.start_date <= end_date)
+        # 월간 요약으로 압축된 기간의 주간 요약은 제외
+        if weekly_after:
+            query = query.filter(or_(Embedding.type != 'weekly', Embedding.start_date > weekly_after))
+        
+        with metrics.timer('vector_search'):
+            rows = query.order_by(distance).limit(limit).all()
+        
+        return [{
+            'summary_id': row.id,
+            'type': row.type,
+            'summary_text': row.summary_text,
+            'start_date': row.start_date,
+            'end_date': row.end_date,
+            'distance': float(row.distance)
+        } for row in rows]
+
+    def _weekly_summary_messages(self, text: str) -> List:
+        system_prompt = """
+        일주일간의 데이터를 다음 기준으로 요약해주세요:
+        1. 중요한 사건과 활동을 시간순으로 정리
+        2. 주요 성과와 진행 상황
+        3. 반복되는 패턴이나 특이사항
+        4. 감정과 컨디션의 변화
+        
+        요약은 최대한 압축하되, 중요한 정보는 모두 포함해야 합니다.
+        데이터의 select_date는 해당날짜를 의미합니다.
+        """
+        
+        from langchain_core.messages import SystemMessage, HumanMessage
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=text)
+        ]
+
+    def _create_weekly_summary(self, text: str, user_id: Optional[int] = None) -> str:
+        try:
+            return self._invoke('weekly_summary', self._weekly_summary_messages(text), user_id)
+        except Exception as e:
+            current_app.logger.error(f"주간 데이터 요약 생성 중 오류가 발생했습니다.: {str(e)}")
+            raise
+
+    def _update_weekly_summary_messages(self, summary_text: str, new_text: str) -> List:
+        system_prompt = """
+        이번 주의 기존 요약에 새로 추가된 날의 데이터를 반영하여 주간 요약을 갱신해주세요.
+        요약 기준은 다음과 같습니다:
+        1. 중요한 사건과 활동을 시간순으로 정리
+        2. 주요 성과와 진행 상황
+        3. 반복되는 패턴이나 특이사항
+        4. 감정과 컨디션의 변화
+        
+        기존 요약의 중요한 정보는 유지하고, 갱신된 요약 하나만 반환해야 합니다.
+        새 데이터 앞의 날짜는 해당날짜를 의미합니다.
+        """
+        
+        from langchain_core.messages import SystemMessage, HumanMessage
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=f"기존 요약:\n{summary_text}\n\n새 데이터:\n{new_text}")
+        ]
+
+    def _update_weekly_summary(self, summary_text: str, new_text: str, user_id: Optional[int] = None) -> str:
+        try:
+            return self._invoke('weekly_summary', self._update_weekly_summary_messages(summary_text, new_text), user_id)
+        except Exception as e:
+            current_app.logger.error(f"주간 요약 갱신 생성 중 오류가 발생했습니다.: {str(e)}")
+            raise
+
+    def _create_monthly_summary(self, text: str, user_id: Optional[int] = None) -> str:
         try:
             system_prompt = """
-            일주일간의 데이터를 다음 기준으로 요약해주세요:
-            1. 중요한 사건과 활동을 시간순으로 정리
-            2. 주요 성과와 진행 상황
-            3. 반복되는 패턴이나 특이사항
-            4. 감정과 컨디션의 변화
-            
-            요약은 최대한 압축하되, 중요한 정보는 모두 포함해야 합니다.
-            데이터의 select_date는 해당날짜를 의미합니다.
+            한 달 동안의 주간 요약들을 다음 기준으로 하나의 월간 요약으로 압축해주세요:
+            1. 이 달의 핵심 사건과 활동
+            2. 주요 성과와 목표의 진행 상황
+            3. 여러 주에 걸쳐 반복된 패턴과 습관
+            4. 감정과 컨디션의 전반적인 흐름
+            
+            주간 요약보다 짧게, 다음 달 이후에도 참고할 가치가 있는 정보 위주로 정리해야 합니다.
+            각 주간 요약 앞의 날짜는 해당 주의 기간을 의미합니다.
             """
             
+            from langchain_core.messages import SystemMessage, HumanMessage
             messages = [
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=text)
             ]
             
-            response = self.llm.invoke(messages)
-            return response.content
+            return self._invoke('monthly_summary', messages, user_id)
         except Exception as e:
-            current_app.logger.error(f"주간 데이터 요약 생성 중 오류가 발생했습니다.: {str(e)}")
+            current_app.logger.error(f"월간 데이터 요약 생성 중 오류가 발생했습니다.: {str(e)}")
             raise
 
-    def _create_embedding(self, text: str) -> List[float]:
+    def _invoke(self, endpoint: str, messages: List, user_id: Optional[int] = None) -> str:
+        with metrics.timer(endpoint) as timer:
+            response = self.llm.invoke(messages)
+        record_llm_usage(endpoint, response, timer.elapsed, user_id, self.job)
+        return response.content
+
+    def _create_embedding(self, text: str, user_id: Optional[int] = None, endpoint: str = 'summary_embedding') -> List[float]:
         try:
+            model = current_app.config['OPENAI_EMBEDDING_MODEL']
+            cached = embedding_cache.get(model, text)
+            if cached is not None:
+                return cached
+            
             if not self.embedding_model:
                 self._init_model()
                 
             if not self.embedding_model:
                 raise ValueError("임베딩 모델 초기화 실패")
                 
+            started_at = time.perf_counter()
             embedding = self.embedding_model.embed_query(text)
+            record_embedding_usage(endpoint, [text], time.perf_counter() - started_at, [user_id], self.job)
+            embedding_cache.set(model, text, embedding)
             return embedding
         except Exception as e:
             current_app.logger.error(f"임베딩 생성 중 오류가 발생했습니다.: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def _create_embeddings(self, texts: List[str], user_ids: Optional[List[int]] = None,
+                           endpoint: str = 'summary_embedding') -> List[List[float]]:
+        # 캐시에 없는 텍스트만 EMBEDDING_BATCH_SIZE개씩 embed_documents로 생성
+        model = current_app.config['OPENAI_EMBEDDING_MODEL']
+        embeddings = [embedding_cache.get(model, text) for text in texts]
+        missing = [index for index, embedding in enumerate(embeddings) if embedding is None]
+        
+        if missing:
+            self._init_model()
+            chunk_size = current_app.config['EMBEDDING_BATCH_SIZE']
+            for offset in range(0, len(missing), chunk_size):
+                chunk = missing[offset:offset + chunk_size]
+                chunk_texts = [texts[index] for index in chunk]
+                with metrics.timer('embed_documents') as timer:
+                    vectors = self.embedding_model.embed_documents(chunk_texts)
+                record_embedding_usage(endpoint, chunk_texts, timer.elapsed,
+                                       [user_ids[index] for index in chunk] if user_ids else None, self.job)
+                for index, vector in zip(chunk, vectors):
+                    embeddings[index] = vector
+                    embedding_cache.set(model, texts[index], vector)
+        
+        return embeddings
@@ -0,0 +1,100 @@
+import hashlib
+import threading
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from flask import current_app
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from app.extensions import db
+from app.models import EmbeddingCacheEntry
+from app.utils.cache import TTLCache
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(unicodedata.normalize('NFC', text).split())
+
+
+def make_cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\x00{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    # 메모리 LRU가 1차, EMBEDDING_CACHE_PERSIST가 켜져 있으면 embedding_cache 테이블이 2차 캐시
+
+    def __init__(self):
+        self._memory = None
+        self._lock = threading.Lock()
+        self.db_hits = 0
+        self.db_misses = 0
+
+    def _get_memory(self) -> TTLCache:
+        if self._memory is None:
+            with self._lock:
+                if self._memory is None:
+                    self._memory = TTLCache(
+                        maxsize=current_app.config['EMBEDDING_CACHE_SIZE'],
+                        ttl=current_app.config['EMBEDDING_CACHE_TTL']
+                    )
+        return self._memory
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        key = make_cache_key(model, text)
+        embedding = self._get_memory().get(key)
+        if embedding is not None or not current_app.config['EMBEDDING_CACHE_PERSIST']:
+            return embedding
+
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=current_app.config['EMBEDDING_CACHE_DB_TTL_DAYS'])
+            # 요청 트랜잭션과 분리된 커넥션 사용
+            with db.engine.connect() as connection:
+                stored = connection.execute(
+                    select(EmbeddingCacheEntry.embedding).where(
+                        EmbeddingCacheEntry.key == key,
+                        EmbeddingCacheEntry.created_at >= cutoff
+                    )
+                ).scalar()
+        except Exception as e:
+            current_app.logger.warning(f"임베딩 캐시 조회 중 오류가 발생했습니다: {str(e)}")
+            return None
+
+        if stored is None:
+            self.db_misses += 1
+            return None
+
+        self.db_hits += 1
+        embedding = [float(value) for value in stored]
+        self._get_memory().set(key, embedding)
+        return embedding
+
+    def set(self, model: str, text: str, embedding: List[float]):
+        key = make_cache_key(model, text)
+        self._get_memory().set(key, embedding)
+
+        if not current_app.config['EMBEDDING_CACHE_PERSIST']:
+            return
+
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(
+                    insert(EmbeddingCacheEntry).values(
+                        key=key,
+                        model=model,
+                        embedding=embedding,
+                        created_at=datetime.utcnow()
+                    ).on_conflict_do_update(
+                        index_elements=[EmbeddingCacheEntry.key],
+                        set_={'embedding': embedding, 'created_at': datetime.utcnow()}
+                    )
+                )
+        except Exception as e:
+            current_app.logger.warning(f"임베딩 캐시 저장 중 오류가 발생했습니다: {str(e)}")
+
+    def stats(self) -> Dict:
+        stats = self._memory.stats() if self._memory else {}
+        stats['db_hits'] = self.db_hits
+        stats['db_misses'] = self.db_misses
+        return stats
+
+
+embedding_cache = EmbeddingCache()
@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Dict, Tuple
+from app.utils.concurrency import run_in_app_context
+from app.utils.llm_service import LLMService
+
+
+class IngestionQueue:
+    # 백엔드의 변경 이벤트를 (사용자, 날짜)별로 모았다가 INGEST_DEBOUNCE_SECONDS 동안 추가 변경이 없으면
+    # 백그라운드 워커에서 해당 날짜의 CleanedData와 컨텍스트 캐시를 갱신한다.
+    # 계속 변경이 들어와도 첫 이벤트부터 INGEST_MAX_DELAY_SECONDS 안에는 처리한다.
+
+    def __init__(self):
+        self.app = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: Dict[Tuple[int, date], Tuple[float, float]] = {}  # key -> (첫 이벤트 시각, 처리 예정 시각)
+        self._in_flight = set()
+        self._thread = None
+        self._executor = None
+        self.received = 0
+        self.coalesced = 0
+        self.processed = 0
+        self.failed = 0
+
+    def _start(self, app):
+        if self._thread is None:
+            self.app = app
+            self._executor = ThreadPoolExecutor(
+                max_workers=app.config['INGEST_MAX_WORKERS'],
+                thread_name_prefix='ingest-worker'
+            )
+            self._thread = threading.Thread(target=self._run, name='ingest-debouncer', daemon=True)
+            self._thread.start()
+
+    def submit(self, app, user_id: int, select_date: date):
+        now = time.monotonic()
+        key = (user_id, select_date)
+        with self._lock:
+            self._start(app)
+            self.received += 1
+            first_seen, _ = self._pending.get(key, (now, None))
+            if key in self._pending:
+                self.coalesced += 1
+            due = min(now + app.config['INGEST_DEBOUNCE_SECONDS'], first_seen + app.config['INGEST_MAX_DELAY_SECONDS'])
+            self._pending[key] = (first_seen, due)
+            self._wakeup.notify()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                # 처리 중인 키는 끝날 때까지 기다렸다가 다시 처리 (같은 사용자-날짜를 동시에 갱신하지 않음)
+                ready = [key for key, (_, due) in self._pending.items() if key not in self._in_flight]
+                if not ready:
+                    self._wakeup.wait()
+                    continue
+
+                now = time.monotonic()
+                next_due = min(self._pending[key][1] for key in ready)
+                if next_due > now:
+                    self._wakeup.wait(next_due - now)
+                    continue
+
+                due_keys = [key for key in ready if self._pending[key][1] <= now]
+                for key in due_keys:
+                    del self._pending[key]
+                    self._in_flight.add(key)
+
+            for key in due_keys:
+                self._executor.submit(self._process, key)
+
+    def _process(self, key: Tuple[int, date]):
+        user_id, select_date = key
+        try:
+            success, message = run_in_app_context(self.app, LLMService(job='ingestion').refresh_daily_data, user_id, select_date)
+        except Exception as e:
+            success, message = False, str(e)
+
+        with self._lock:
+            self._in_flight.discard(key)
+            if success:
+                self.processed += 1
+            else:
+                self.failed += 1
+            self._wakeup.notify()
+
+        if success:
+            self.app.logger.info(f"사용자 {user_id}의 {select_date} 데이터가 수집 이벤트로 갱신되었습니다")
+        else:
+            self.app.logger.warning(f"사용자 {user_id}의 {select_date} 수집 이벤트 처리 실패: {message}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'received': self.received,
+                'coalesced': self.coalesced,
+                'processed': self.processed,
+                'failed': self.failed,
+                'pending': len(self._pending),
+                'in_flight': len(self._in_flight),
+            }
+
+
+ingestion_queue = IngestionQueue()
@@ -0,0 +1,178 @@
+import re
+import threading
+from typing import Dict, NamedTuple, Optional
+
+DATE_PATTERN = re.compile(
+    r'(?P<relative>오늘|내일|모레)'
+    r'|(?P<iso>\d{4}-\d{1,2}-\d{1,2})'
+    r'|(?P<month>\d{1,2})\s*월\s*(?P<day>\d{1,2})\s*일'
+)
+TIME_PATTERN = re.compile(
+    r'(?P<hh>\d{1,2}):(?P<mm>\d{2})'
+    r'|(?:(?P<meridiem>오전|오후|아침|저녁|밤)\s*)?(?P<hour>\d{1,2})\s*시(?:\s*(?P<minute>\d{1,2})\s*분|\s*(?P<half>반))?'
+)
+SCHEDULE_PATTERN = re.compile(r'일정|스케줄')
+TODO_PATTERN = re.compile(r'할\s*일|투두|todo', re.IGNORECASE)
+
+ACTION_PATTERNS = {
+    'add': re.compile(r'추가|등록|넣어|잡아|만들어'),
+    'update': re.compile(r'수정|변경|바꿔|옮겨|미뤄|완료'),
+    'delete': re.compile(r'삭제|지워|취소|없애|빼\s*줘|빼\s*주세요'),
+}
+QUESTION_PATTERN = re.compile(r'\?|뭐|어때|어땠|알려|있어|있나|몇|언제|어떻게|왜')
+# 동작 동사가 있어도 명령이 아닌 경우: 이미 일어난 일("취소됐어"), 바람("취소하고 싶다"), 방법("추가하는 법")
+NON_COMMAND_PATTERN = re.compile(
+    r'(?:추가|등록|삭제|수정|변경|취소|완료)\s*(?:됐|되었|됬|했|하였)'
+    r'|넣었|잡았|만들었|지웠|없앴|바꿨|바꾸었|옮겼|미뤘|뺐'
+    r'|고\s*싶'
+    r'|는\s*(?:법|방법)'
+)
+
+# 제목/내용 추출 시 지울 부분
+DATE_STRIP_PATTERN = re.compile(r'(?:' + DATE_PATTERN.pattern + r')(?:에|의)?')
+TIME_STRIP_PATTERN = re.compile(r'(?:' + TIME_PATTERN.pattern + r')(?:에|까지|부터)?')
+TARGET_STRIP_PATTERN = re.compile(
+    r'(?:할\s*일|투두|todo|일정|스케줄)\s*(?:목록|리스트)?\s*(?:중에서|중에|에서|에|을|를|으로|로|은|는|중)?',
+    re.IGNORECASE
+)
+ACTION_STRIP_PATTERN = re.compile(
+    r'(?:추가|등록|삭제|수정|변경|취소|완료)\s*(?:해\s*줘요?|해\s*주세요|해\s*줄래|하기|해|좀)?'
+    r'|(?:넣어|잡아|만들어|지워|없애|바꿔|옮겨|미뤄|빼)\s*(?:줘요?|주세요|줄래)?'
+)
+FILLER_PATTERN = re.compile(r'(?:^|\s)(?:좀|나|내|제|다)(?=\s|$)')
+TRAILING_PARTICLE_PATTERN = re.compile(r'(?:을|를|은|는|에서|에)$')
+
+# 시간대 표기가 없는 1~7시는 오후로 본다 ("2시에 미팅" -> 14:00)
+AFTERNOON_DEFAULT_HOURS = range(1, 8)
+
+
+class IntentResult(NamedTuple):
+    type: str
+    action: str
+    content: Dict
+    confidence: float
+
+
+def _parse_date(question: str) -> Optional[str]:
+    match = DATE_PATTERN.search(question)
+    if not match:
+        return None
+    if match.group('relative'):
+        return match.group('relative')
+    if match.group('iso'):
+        return match.group('iso')
+    return f"{int(match.group('month'))}월 {int(match.group('day'))}일"
+
+
+def _parse_time(question: str) -> Optional[str]:
+    match = TIME_PATTERN.search(question)
+    if not match:
+        return None
+
+    if match.group('hh'):
+        hour, minute = int(match.group('hh')), int(match.group('mm'))
+    else:
+        hour = int(match.group('hour'))
+        minute = 30 if match.group('half') else int(match.group('minute') or 0)
+        meridiem = match.group('meridiem')
+
+        if meridiem == '밤':
+            # "밤 12시"는 자정, "밤 1~5시"는 새벽
+            if hour == 12:
+                hour = 0
+            elif hour >= 6:
+                hour += 12
+        elif meridiem in ('오후', '저녁'):
+            if hour < 12:
+                hour += 12
+        elif meridiem in ('오전', '아침'):
+            if hour == 12:
+                hour = 0
+        elif hour in AFTERNOON_DEFAULT_HOURS:
+            hour += 12
+
+    if hour > 23 or minute > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+def _extract_subject(question: str) -> str:
+    text = DATE_STRIP_PATTERN.sub(' ', question)
+    text = TIME_STRIP_PATTERN.sub(' ', text)
+    text = TARGET_STRIP_PATTERN.sub(' ', text)
+    text = ACTION_STRIP_PATTERN.sub(' ', text)
+    text = re.sub(r'[?!.,~]', ' ', text)
+    text = FILLER_PATTERN.sub(' ', text)
+    text = " ".join(text.split())
+    return TRAILING_PARTICLE_PATTERN.sub('', text).strip()
+
+
+def classify_intent(question: str) -> IntentResult:
+    # 확신이 낮으면 confidence를 낮게 돌려주고, 호출 측에서 LLM으로 넘긴다
+    question = question.strip()
+    actions = [action for action, pattern in ACTION_PATTERNS.items() if pattern.search(question)]
+    has_schedule = bool(SCHEDULE_PATTERN.search(question))
+    has_todo = bool(TODO_PATTERN.search(question))
+    date = _parse_date(question)
+    time = _parse_time(question)
+
+    if not actions:
+        if time and not QUESTION_PATTERN.search(question):
+            # "오늘 오후 3시에 보고서 작성하기" 처럼 동사 없이 일정을 적은 경우
+            return IntentResult('chat', 'chat', {}, 0.4)
+        if has_schedule or has_todo:
+            return IntentResult('chat', 'chat', {}, 0.85)
+        return IntentResult('chat', 'chat', {}, 0.95)
+
+    if len(actions) > 1 or not (has_schedule or has_todo or time):
+        return IntentResult('chat', 'chat', {}, 0.3)
+    if QUESTION_PATTERN.search(question) or NON_COMMAND_PATTERN.search(question):
+        # 질문이나 서술에 동사가 섞인 경우 데이터를 바꾸지 않도록 LLM에 맡긴다
+        return IntentResult('chat', 'chat', {}, 0.3)
+
+    action = actions[0]
+    intent_type = 'schedule' if (has_schedule or time) else 'todo'
+    subject = _extract_subject(question)
+    confidence = 0.9
+
+    if action == 'update':
+        # 무엇을 어떻게 바꿀지는 LLM이 더 정확하다
+        confidence = 0.5
+    if not subject and not (action == 'delete' and time):
+        confidence = 0.3
+
+    content = {}
+    if intent_type == 'schedule':
+        if subject:
+            content['title'] = subject
+        if time:
+            content['time'] = time
+        elif action == 'add':
+            confidence -= 0.1
+    elif subject:
+        content['content'] = subject
+
+    if date:
+        content['date'] = date
+    elif action == 'add':
+        content['date'] = '오늘'
+        confidence -= 0.05
+
+    return IntentResult(intent_type, action, content, round(confidence, 2))
+
+
+_stats_lock = threading.Lock()
+_stats = {'rule': 0, 'llm': 0}
+
+
+def record_intent_path(path: str):
+    with _stats_lock:
+        _stats[path] = _stats.get(path, 0) + 1
+
+
+def get_intent_stats() -> Dict:
+    with _stats_lock:
+        stats = dict(_stats)
+    total = sum(stats.values())
+    stats['rule_ratio'] = round(stats['rule'] / total, 4) if total else 0.0
+    return stats
@@ -0,0 +1,51 @@
+# 의도 분석 평가용 라벨 데이터 (flask intent eval)
+# type/action은 _analyze_user_intent의 기대 결과
+INTENT_CORPUS = [
+    # 일정 추가
+    {'question': "내일 2시에 미팅 일정 추가해줘", 'type': 'schedule', 'action': 'add'},
+    {'question': "오늘 오후 3시에 보고서 작성 일정 잡아줘", 'type': 'schedule', 'action': 'add'},
+    {'question': "모레 오전 10시 치과 일정 등록해줘", 'type': 'schedule', 'action': 'add'},
+    {'question': "3월 5일 14:00에 팀 회의 일정 추가", 'type': 'schedule', 'action': 'add'},
+    {'question': "내일 저녁 7시 반에 친구랑 저녁 약속 일정 넣어줘", 'type': 'schedule', 'action': 'add'},
+    {'question': "오늘 할일에 6시에 운동 추가해줘", 'type': 'schedule', 'action': 'add'},
+    {'question': "12월 24일 오후 6시 크리스마스 파티 추가해줘", 'type': 'schedule', 'action': 'add'},
+    # 일정 삭제/수정
+    {'question': "오늘 17시 운동 일정 삭제해줘", 'type': 'schedule', 'action': 'delete'},
+    {'question': "내일 2시 미팅 일정 취소해줘", 'type': 'schedule', 'action': 'delete'},
+    {'question': "모레 치과 일정 지워줘", 'type': 'schedule', 'action': 'delete'},
+    {'question': "내일 2시 미팅 일정을 4시로 옮겨줘", 'type': 'schedule', 'action': 'update'},
+    {'question': "오늘 회의 일정 제목을 주간 회의로 변경해줘", 'type': 'schedule', 'action': 'update'},
+    # 할일 추가
+    {'question': "오늘 할일에 보고서 작성 추가해줘", 'type': 'todo', 'action': 'add'},
+    {'question': "내일 할일로 장보기 추가", 'type': 'todo', 'action': 'add'},
+    {'question': "할일 목록에 책 읽기 넣어줘", 'type': 'todo', 'action': 'add'},
+    {'question': "모레 할 일에 빨래하기 등록해줘", 'type': 'todo', 'action': 'add'},
+    # 할일 삭제/수정
+    {'question': "오늘 할일 중에서 보고서 작성 삭제해줘", 'type': 'todo', 'action': 'delete'},
+    {'question': "할일에서 장보기 지워줘", 'type': 'todo', 'action': 'delete'},
+    {'question': "오늘 할일 보고서 작성 완료로 바꿔줘", 'type': 'todo', 'action': 'update'},
+    {'question': "내일 할일 장보기를 마트 가기로 수정해줘", 'type': 'todo', 'action': 'update'},
+    # 일반 대화
+    {'question': "안녕!", 'type': 'chat', 'action': 'chat'},
+    {'question': "오늘 기분이 너무 좋아", 'type': 'chat', 'action': 'chat'},
+    {'question': "요즘 잠을 잘 못 자는데 어떻게 하면 좋을까?", 'type': 'chat', 'action': 'chat'},
+    {'question': "오늘 일정 뭐 있어?", 'type': 'chat', 'action': 'chat'},
+    {'question': "이번 주 할일 얼마나 했는지 알려줘", 'type': 'chat', 'action': 'chat'},
+    {'question': "어제 일기 내용 요약해줘", 'type': 'chat', 'action': 'chat'},
+    {'question': "고마워", 'type': 'chat', 'action': 'chat'},
+    {'question': "내일 날씨 어때?", 'type': 'chat', 'action': 'chat'},
+    {'question': "운동 루틴 추천해줘", 'type': 'chat', 'action': 'chat'},
+    {'question': "지난주에 내가 뭐 했었지?", 'type': 'chat', 'action': 'chat'},
+    # 동작 동사가 있지만 명령이 아닌 질문/서술 (규칙 경로에서 처리하면 안 됨)
+    {'question': "오늘 할 일 추가하는 법 알려줘", 'type': 'chat', 'action': 'chat'},
+    {'question': "내일 일정 취소됐어", 'type': 'chat', 'action': 'chat'},
+    {'question': "오늘 3시에 회의 일정 삭제됐어?", 'type': 'chat', 'action': 'chat'},
+    {'question': "오늘 일정 다 취소하고 싶다", 'type': 'chat', 'action': 'chat'},
+    {'question': "어제 할일에 운동 추가했었나?", 'type': 'chat', 'action': 'chat'},
+    {'question': "일정 수정하는 방법이 뭐야", 'type': 'chat', 'action': 'chat'},
+    {'question': "내일 미팅 일정 누가 옮겼어", 'type': 'chat', 'action': 'chat'},
+    {'question': "오늘 할일 다 완료했어", 'type': 'chat', 'action': 'chat'},
+    # 애매한 경우 (LLM으로 넘어가야 함)
+    {'question': "오늘 오후 3시에 보고서 작성하기", 'type': 'schedule', 'action': 'add'},
+    {'question': "내일 미팅 추가해줘", 'type': 'schedule', 'action': 'add'},
+]
@@ -0,0 +1,128 @@
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Tuple
+from flask import current_app
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from app.extensions import db
+from app.models import JobLedgerEntry
+
+# 사용자 처리 결과 -> 원장 상태
+RESULT_STATUSES = {
+    'processed': 'done',
+    'skipped': 'skipped',
+    'failed': 'failed',
+}
+FINISHED_STATUSES = ('done', 'skipped')
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobLedger:
+    # (작업, 사용자, 기간)마다 한 행을 두는 Postgres 작업 원장
+    # 행은 SELECT ... FOR UPDATE SKIP LOCKED로 가져가므로 여러 노드가 같은 실행을 나눠 처리할 수 있고,
+    # 중간에 프로세스가 죽어도 완료된 행은 다시 처리하지 않는다 (running으로 남은 행은 JOB_LEDGER_STALE_AFTER 뒤 회수).
+
+    def enqueue(self, job: str, period_start, period_end, user_ids: Iterable[int]) -> int:
+        rows = [
+            {'job': job, 'user_id': user_id, 'period_start': period_start, 'period_end': period_end,
+             'status': 'pending', 'attempts': 0, 'created_at': datetime.utcnow()}
+            for user_id in user_ids
+        ]
+        if not rows:
+            return 0
+
+        # 이미 있는 행(이전 실행에서 완료/진행 중)은 그대로 둔다
+        result = db.session.execute(
+            insert(JobLedgerEntry).values(rows).on_conflict_do_nothing(
+                index_elements=['job', 'user_id', 'period_start']
+            )
+        )
+        db.session.commit()
+        return result.rowcount
+
+    def enqueue_query(self, job: str, period_start, period_end, user_ids_query) -> int:
+        # 대상 사용자 쿼리를 서버 측 커서로 읽으면서 청크 단위로 원장에 넣는다 (사용자 수와 무관하게 메모리 일정)
+        chunk_size = current_app.config['SCHEDULER_CANDIDATE_CHUNK']
+        enqueued = 0
+        # 세션 커밋이 커서를 닫지 않도록 별도 커넥션에서 읽는다
+        with db.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(user_ids_query)
+            for partition in result.scalars().partitions():
+                enqueued += self.enqueue(job, period_start, period_end, partition)
+        return enqueued
+
+    def claim(self, job: str, period_start, limit: int) -> List[Tuple[int, int]]:
+        stale_before = datetime.utcnow() - timedelta(seconds=current_app.config['JOB_LEDGER_STALE_AFTER'])
+        entries = JobLedgerEntry.query.filter(
+            JobLedgerEntry.job == job,
+            JobLedgerEntry.period_start == period_start,
+            or_(
+                JobLedgerEntry.status == 'pending',
+                and_(JobLedgerEntry.status == 'running', JobLedgerEntry.started_at < stale_before)
+            ),
+            JobLedgerEntry.attempts < current_app.config['JOB_LEDGER_MAX_ATTEMPTS']
+        ).order_by(JobLedgerEntry.id).limit(limit).with_for_update(skip_locked=True).all()
+
+        now = datetime.utcnow()
+        claimed_by = worker_id()
+        for entry in entries:
+            entry.status = 'running'
+            entry.attempts += 1
+            entry.claimed_by = claimed_by
+            entry.started_at = now
+            entry.finished_at = None
+        claimed = [(entry.id, entry.user_id) for entry in entries]
+        db.session.commit()
+        return claimed
+
+    def complete(self, entry_id: int, result: str, error: str = None):
+        JobLedgerEntry.query.filter_by(id=entry_id).update({
+            'status': RESULT_STATUSES.get(result, 'failed'),
+            'last_error': error,
+            'finished_at': datetime.utcnow()
+        })
+        db.session.commit()
+
+    def retry_failed(self, job: str, period_start) -> int:
+        # 최대 시도 횟수가 남은 실패 행을 다시 대기 상태로
+        updated = JobLedgerEntry.query.filter(
+            JobLedgerEntry.job == job,
+            JobLedgerEntry.period_start == period_start,
+            JobLedgerEntry.status == 'failed',
+            JobLedgerEntry.attempts < current_app.config['JOB_LEDGER_MAX_ATTEMPTS']
+        ).update({'status': 'pending'}, synchronize_session=False)
+        db.session.commit()
+        return updated
+
+    def unfinished_runs(self, since) -> List[Tuple[str, datetime.date]]:
+        rows = db.session.query(JobLedgerEntry.job, JobLedgerEntry.period_start).filter(
+            JobLedgerEntry.period_start >= since,
+            JobLedgerEntry.status.in_(('pending', 'running')),
+            JobLedgerEntry.attempts < current_app.config['JOB_LEDGER_MAX_ATTEMPTS']
+        ).distinct().order_by(JobLedgerEntry.period_start).all()
+        return [(row.job, row.period_start) for row in rows]
+
+    def summary(self, job: str, period_start) -> Dict:
+        rows = db.session.query(
+            JobLedgerEntry.status,
+            func.count(JobLedgerEntry.id),
+            func.avg(func.extract('epoch', JobLedgerEntry.finished_at - JobLedgerEntry.started_at))
+        ).filter(
+            JobLedgerEntry.job == job,
+            JobLedgerEntry.period_start == period_start
+        ).group_by(JobLedgerEntry.status).all()
+
+        summary = {'job': job, 'period_start': period_start.isoformat(), 'total': 0}
+        for status, count, avg_seconds in rows:
+            summary[status] = count
+            summary['total'] += count
+            if status in FINISHED_STATUSES and avg_seconds is not None:
+                summary[f'{status}_avg_seconds'] = round(float(avg_seconds), 2)
+        return summary
+
+
+job_ledger = JobLedger()
@@ -0,0 +1,86 @@
+import threading
+from typing import Dict
+from sqlalchemy import text
+from app.extensions import db
+
+
+class LeaderLock:
+    # Postgres 세션 advisory lock 기반 리더 선출
+    # 락을 잡은 프로세스만 스케줄 작업을 실행하고, 락은 전용 커넥션이 살아 있는 동안 유지된다.
+    # 리더 프로세스가 죽으면 커넥션이 끊기면서 락이 풀리고, 다음 작업 시각에 다른 프로세스가 이어받는다.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connection = None
+        self.key = None
+        self.acquired = 0
+        self.skipped = 0
+        self.lost = 0
+
+    def is_leader(self, app) -> bool:
+        with self._lock:
+            if self._connection is not None:
+                if self._alive():
+                    return True
+                self.lost += 1
+                app.logger.warning("리더 락 커넥션이 끊어졌습니다, 다시 선출합니다...")
+                self._discard()
+
+            self.key = app.config['SCHEDULER_LEADER_LOCK_KEY']
+            # 트랜잭션이 열린 채로 유휴 상태가 되지 않도록 AUTOCOMMIT 커넥션을 점유한다
+            connection = db.engine.connect().execution_options(isolation_level='AUTOCOMMIT')
+            try:
+                acquired = connection.execute(
+                    text("SELECT pg_try_advisory_lock(:key)"), {'key': self.key}
+                ).scalar()
+            except Exception:
+                connection.close()
+                raise
+
+            if not acquired:
+                connection.close()
+                self.skipped += 1
+                return False
+
+            self._connection = connection
+            self.acquired += 1
+            app.logger.info(f"스케줄러 리더로 선출되었습니다 (advisory lock {self.key})")
+            return True
+
+    def _alive(self) -> bool:
+        try:
+            self._connection.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    def _discard(self):
+        try:
+            self._connection.invalidate()
+        except Exception:
+            pass
+        self._connection = None
+
+    def release(self):
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': self.key})
+                self._connection.close()
+            except Exception:
+                self._discard()
+            self._connection = None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'is_leader': self._connection is not None,
+                'lock_key': self.key,
+                'acquired': self.acquired,
+                'skipped': self.skipped,
+                'lost': self.lost,
+            }
+
+
+leader_lock = LeaderLock()
@@ -1,64 +1,84 @@
 from datetime import datetime, timedelta
-from typing import Dict, Tuple, List, Optional
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import SystemMessage, HumanMessage
-from app.models import Todo, Diary, Schedule, CleanedData, Feedback, Summary, Embedding
+from typing import Dict, Tuple, List, Optional, Iterator, Union
+from app.models import Todo, Diary, Schedule, CleanedData, Feedback, Summary
 from app.extensions import db
+from app.utils.clients import clients
 from flask import current_app
 from app.utils.embedding import EmbeddingService
+from app.utils.context import ContextAssembler
+from app.utils.concurrency import run_in_app_context
+from app.utils.intent import classify_intent, record_intent_path
+from app.utils.context_cache import context_cache
+from app.utils.response_cache import response_cache
+from app.utils.metrics import metrics, record_llm_usage
+from itertools import islice
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import and_, func, or_, select, text, true
 
-from datetime import datetime, timedelta
-from typing import Dict, Tuple, List, Optional
-from langchain_community.chat_models import ChatOpenAI
-from langchain.schema import SystemMessage, HumanMessage
-from app.models import Todo, Diary, Schedule, CleanedData, Feedback, Summary, Embedding
-from app.extensions import db
-from flask import current_app
-from app.utils.embedding import EmbeddingService
+CONTEXT_TOKEN_BUDGETS = {
+    'chat': 'CHAT_CONTEXT_TOKEN_BUDGET',
+    'feedback': 'FEEDBACK_CONTEXT_TOKEN_BUDGET',
+    'recommend': 'RECOMMEND_CONTEXT_TOKEN_BUDGET',
+}
+# 요약 섹션이 전체 예산에서 차지할 수 있는 최대 비율
+SUMMARY_BUDGET_RATIO = 0.4
+# 프롬프트를 바꾸면 올려서 이전 응답 캐시를 무효화
+PROMPT_VERSIONS = {
+    'feedback': 2,
+    'recommend': 2,
+}
 
 class LLMService:
-    def __init__(self):
+    def __init__(self, job: Optional[str] = None):
+        # job: 스케줄러/수집 이벤트 경로에서 만들 때의 작업 이름 - 토큰 사용량을 API 요청과 구분해 기록한다
+        self.job = job
         self.chat_model = None
         self.embedding_service = None
         
     def _init_model(self):
         if not self.chat_model:
-            self.chat_model = ChatOpenAI(
-                model=current_app.config['OPENAI_MODEL'],
-                temperature=current_app.config['OPENAI_TEMPERATURE'],
-                api_key=current_app.config['OPENAI_API_KEY']
-            )
+            self.chat_model = clients.chat_model
            
     def _init_embedding_service(self):
         if not self.embedding_service:
-            self.embedding_service = EmbeddingService()
+            self.embedding_service = EmbeddingService(job=self.job)
 
     def _get_similar_summaries(self, user_id: int, query: str, limit: int = 3) -> List[str]:
         self._init_embedding_service()
         self.embedding_service._init_model()
         
         try:
-            query_embedding = self.embedding_service._create_embedding(query)
+            with metrics.timer('query_embedding'):
+                query_embedding = self.embedding_service._create_embedding(query, user_id=user_id, endpoint='query_embedding')
+            similar_summaries = self._search_similar_summaries(user_id, query_embedding, limit)
             
-            similar_summaries = Embedding.query.filter_by(
-                user_id=user_id,
-                type='weekly'
-            ).order_by(
-                Embedding.embedding.cosine_distance(query_embedding)
-            ).limit(limit).all()
-            
-            summary_texts = []
-            for emb in similar_summaries:
-                summary = Summary.query.get(emb.summary_id)
-                if summary:
-                    summary_texts.append(f"{summary.start_date.strftime('%Y-%m-%d')}~{summary.end_date.strftime('%Y-%m-%d')}: {summary.summary_text}")
-            
-            return summary_texts
+            return [
+                self._format_summary(summary['start_date'], summary['end_date'], summary['summary_text'])
+                for summary in similar_summaries
+            ]
         except Exception as e:
             current_app.logger.error(f"유사한 주간 요약 검색 중 오류가 발생했습니다: {str(e)}")
             return []
 
+    def _search_similar_summaries(self, user_id: int, query_embedding: List[float], limit: int) -> List[Dict]:
+        # 월간 요약이 있는 기간은 월간 요약으로, 그 이후는 주간 요약으로 검색
+        self._init_embedding_service()
+        return self.embedding_service.search_similar_summaries(
+            user_id,
+            query_embedding,
+            limit=limit,
+            types=('weekly', 'monthly'),
+            weekly_after=self.embedding_service.get_monthly_cutoff(user_id)
+        )
+
     def get_daily_data(self, user_id: int, select_date: datetime.date) -> Tuple[bool, Optional[Dict], str]:
+        with metrics.timer('get_daily_data'):
+            return self._get_daily_data(user_id, select_date)
+
+    def _get_daily_data(self, user_id: int, select_date: datetime.date) -> Tuple[bool, Optional[Dict], str]:
         try:
             # 해당 날짜의 시작과 끝 datetime 구하기
             start_datetime = datetime.combine(select_date, datetime.min.time())
@@ -84,7 +104,7 @@ class LLMService:
             
             data = {
                 'todos': [{'content': todo.content, 'is_completed': todo.is_completed, 'select_date': todo.select_date} for todo in todos],
-                'diary': [{'content': diary.content, 'select_date': diary.select_date}],
+                'diary': [{'content': diary.content, 'select_date': diary.select_date}] if diary else [],
                 'schedules': [{'title': schedule.title, 'content': schedule.content, 'select_date': schedule.select_date} for schedule in schedules]
             }
                 
@@ -102,22 +122,10 @@ class LLMService:
             if not success:
                 return False, message
             
-            text_content = []
-
-            text_content.append(f"일기 ({daily_data['diary'][0]['select_date']}): {daily_data['diary'][0]['diary']}" if daily_data['diary'] else "")
-
-            todo_texts = [f"- {todo['content']} ({'완료' if todo['is_completed'] else '미완료'})" 
-                        for todo in daily_data['todos']]
-            text_content.append("할 일 목록:\n" + "\n".join(todo_texts))
-
-            schedule_texts = [f"- {schedule['title']} ({schedule['select_date']}): {schedule['content']}" 
-                            for schedule in daily_data['schedules']]
-            text_content.append("일정 목록:\n" + "\n".join(schedule_texts))
-
-            combined_text = "\n\n".join(text_content)       
+            combined_text = self._daily_data_text(daily_data)
             
             try:
-                cleaned_text = self._preprocess_text(combined_text)
+                cleaned_text = self._preprocess_text(combined_text, user_id)
             except Exception as e:
                 current_app.logger.error(f"OpenAI API 호출 중 오류가 발생했습니다: {str(e)}")
                 return False, "텍스트 전처리 중 오류가 발생했습니다."
@@ -126,10 +134,13 @@ class LLMService:
                 cleaned_data = CleanedData(
                     user_id=user_id,
                     select_date=select_date,
-                    cleaned_text=cleaned_text
+                    cleaned_text=cleaned_text,
+                    source_hash=self._source_hash(combined_text),
+                    built_at=datetime.utcnow()
                 )
                 db.session.add(cleaned_data)
                 db.session.commit()
+                context_cache.invalidate(user_id)
             except Exception as e:
                 db.session.rollback()
                 current_app.logger.error(f"데이터베이스 저장 중 오류가 발생했습니다: {str(e)}")
@@ -141,69 +152,140 @@ class LLMService:
             current_app.logger.error(f"일일 데이터 전처리 중 오류가 발생했습니다: {str(e)}")
             return False, "데이터 전처리 중 오류가 발생했습니다."
 
-    def get_chat_response(self, user_id: int, question: str) -> Tuple[bool, str]:
-        self._init_model()  
-
-        intent_type, action, content = self._analyze_user_intent(question)
-        
-        original_type = "todo" if "시에" in question and "할일" in question else None
+    def refresh_daily_data(self, user_id: int, select_date: datetime.date) -> Tuple[bool, str]:
+        # 수집 이벤트로 호출: 해당 날짜의 CleanedData를 최신 원본 데이터로 다시 만든다 (원본이 모두 지워졌으면 삭제)
+        self._init_model()
+        self._init_embedding_service()
         
-        if intent_type in ["schedule", "todo"] and action in ["add", "update", "delete"]:
-            if intent_type == "schedule":
-                success, message = self._manage_schedule(user_id, action, content)
-                if original_type == "todo":
-                    message = f"시간이 포함되어 있어서 할일이 아닌 일정으로 추가했습니다. {message}"
-            else: 
-                success, message = self._manage_todo(user_id, action, content)
-                
-            if not success:
+        try:
+            # 이미 확정된 주의 날짜는 다시 만들어도 반영할 요약이 없어 행만 남으므로 건너뛴다
+            if self.embedding_service.discard_day_in_final_week(user_id, select_date):
+                current_app.logger.info(f"사용자 {user_id}의 {select_date}가 속한 주간 요약이 이미 확정되어 있습니다, 갱신을 건너뜁니다...")
+                return True, "이미 확정된 주간 요약에 속한 날짜입니다."
+            
+            success, daily_data, message = self.get_daily_data(user_id, select_date)
+            if daily_data is None:
                 return False, message
-
-        contexts = []
-        todaydata = []
-
-        similar_summaries = self._get_similar_summaries(user_id, question)
-        if similar_summaries:
-            contexts.append("관련된 과거 주간 요약:")
-            contexts.extend(similar_summaries)
-
-        today = datetime.now().date()
-        success, daily_data, message = self.get_daily_data(user_id, today)
-        if success:
-            current_app.logger.info(f"Retrieved daily data: {daily_data}")  # 데이터 로깅 추가
             
-            if daily_data.get('diary'):
-                diary_texts = [f"{diary['select_date']}: {diary['content']}" for diary in daily_data['diary']]
-                todaydata.append(f"\n오늘의 일기:\n" + "\n".join(diary_texts))
+            source_text = self._daily_data_text(daily_data) if success else None
+            cleaned_text = self._preprocess_text(source_text, user_id) if success else None
             
-            if daily_data.get('todos'):
-                todo_texts = [f"- {todo['select_date']}: {todo['content']} (완료: {'예' if todo['is_completed'] else '아니오'})" for todo in daily_data['todos']]
-                todaydata.append(f"\n오늘의 할 일:\n" + "\n".join(todo_texts))
-                current_app.logger.info(f"Added todos to context: {todo_texts}")  # todo 로깅 추가
+            # 여러 워커가 같은 사용자-날짜를 동시에 갱신하지 않도록 트랜잭션 advisory lock
+            db.session.execute(
+                text("SELECT pg_advisory_xact_lock(:user_id, :day)"),
+                {'user_id': user_id, 'day': select_date.toordinal()}
+            )
+            CleanedData.query.filter(
+                CleanedData.user_id == user_id,
+                CleanedData.select_date == select_date
+            ).delete(synchronize_session=False)
+            if cleaned_text is not None:
+                db.session.add(CleanedData(
+                    user_id=user_id,
+                    select_date=select_date,
+                    cleaned_text=cleaned_text,
+                    source_hash=self._source_hash(source_text),
+                    built_at=datetime.utcnow()
+                ))
+            db.session.commit()
+            context_cache.invalidate(user_id)
             
-            if daily_data.get('schedules'):
-                schedule_texts = [f"- {schedule['content']} ({schedule['select_date']})" for schedule in daily_data['schedules']]
-                todaydata.append(f"\n오늘의 일정:\n" + "\n".join(schedule_texts))
-                current_app.logger.info(f"Added schedules to context: {schedule_texts}")  # schedule 로깅 추가
+            if current_app.config['WEEKLY_SUMMARY_INCREMENTAL']:
+                # 이번 주 진행 중인 요약에 이미 반영된 날이면 요약을 다시 만든다
+                refolded, refold_message = self.embedding_service.refold_running_weekly_summary(user_id, select_date)
+                if not refolded:
+                    current_app.logger.warning(f"사용자 {user_id}의 이번 주 요약 재반영 실패: {refold_message}")
             
-            current_app.logger.info(f"Final todaydata: {todaydata}")  # 최종 데이터 로깅 추가
-        else:
-            contexts.append(f"일일 데이터가 없습니다. 최소 하루의 데이터를 추가하여야 결과를 얻을 수 있습니다.")
+            return True, cleaned_text or message
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"일일 데이터 갱신 중 오류가 발생했습니다: {str(e)}")
+            return False, "일일 데이터 갱신 중 오류가 발생했습니다."
+
+    def is_cleaned_data_current(self, user_id: int, select_date: datetime.date, cleaned_data: CleanedData) -> bool:
+        # 원본을 다시 읽어(LLM 호출 없이) 정리할 때와 같은지 비교한다. 해시가 없는 이전 행은 다시 만든다
+        success, daily_data, _ = self.get_daily_data(user_id, select_date)
+        if not success or not cleaned_data.source_hash:
+            return False
+        return cleaned_data.source_hash == self._source_hash(self._daily_data_text(daily_data))
+
+    def _source_hash(self, source_text: str) -> str:
+        return hashlib.sha256(source_text.encode('utf-8')).hexdigest()
+
+    def _daily_data_text(self, daily_data: Dict) -> str:
+        text_content = []
+
+        text_content.append(f"일기 ({daily_data['diary'][0]['select_date']}): {daily_data['diary'][0]['content']}" if daily_data['diary'] else "")
+
+        todo_texts = [f"- {todo['content']} ({'완료' if todo['is_completed'] else '미완료'})" 
+                    for todo in daily_data['todos']]
+        text_content.append("할 일 목록:\n" + "\n".join(todo_texts))
+
+        schedule_texts = [f"- {schedule['title']} ({schedule['select_date']}): {schedule['content']}" 
+                        for schedule in daily_data['schedules']]
+        text_content.append("일정 목록:\n" + "\n".join(schedule_texts))
+
+        return "\n\n".join(text_content)
+
+    def get_chat_response(self, user_id: int, question: str) -> Tuple[bool, str]:
+        success, messages = self._prepare_chat_messages(user_id, question)
+        if not success:
+            return False, messages
+
+        try:
+            response = self._invoke('chat', messages, user_id=user_id)
+            return True, response.content
+        except Exception as e:
+            current_app.logger.error(f"챗봇 응답 생성 중 오류가 발생했습니다: {str(e)}")
+            return False, "챗봇 응답 생성 중 오류가 발생했습니다."
 
-        all_data = CleanedData.query.filter_by(
-            user_id=user_id
-        ).order_by(CleanedData.select_date.desc()).all()
+    def stream_chat_response(self, user_id: int, question: str) -> Tuple[bool, Union[Iterator[str], str]]:
+        # 할일/일정 변경은 스트림 시작 전에 한 번만 커밋된다
+        success, messages = self._prepare_chat_messages(user_id, question)
+        if not success:
+            return False, messages
 
-        if all_data:
-            contexts.append("\n과거 데이터:")
-            for data in all_data:
-                if data.select_date != today:  # 오늘 데이터는임시 제외
-                    contexts.append(data.cleaned_text)
+        return True, self._stream_tokens('chat', messages, user_id)
+
+    def _prepare_chat_messages(self, user_id: int, question: str) -> Tuple[bool, Union[List, str]]:
+        self._init_model()  
+        
+        if current_app.config['CHAT_PARALLEL_PREFETCH']:
+            # 의도 분석(LLM) 호출 동안 임베딩/벡터 검색과 오늘 데이터 조회를 미리 시작
+            app = current_app._get_current_object()
+            # 두 스레드가 지연 초기화를 동시에 하지 않도록 임베딩 서비스를 미리 만든다
+            self._init_embedding_service()
+            self.embedding_service._init_model()
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix='chat-prefetch') as executor:
+                summaries_future = executor.submit(run_in_app_context, app, self._get_similar_summaries, user_id, question)
+                snapshot_future = executor.submit(run_in_app_context, app, self._get_context_snapshot, user_id)
+                
+                success, result = self._apply_user_intent(user_id, question)
+                similar_summaries = summaries_future.result()
+                snapshot = snapshot_future.result()
+        else:
+            success, result = self._apply_user_intent(user_id, question)
+            similar_summaries = self._get_similar_summaries(user_id, question)
+            snapshot = None
+        
+        if not success:
+            return False, result
+        
+        if result[2] is not None or snapshot is None:
+            # 할일/일정이 변경되었으면 캐시가 무효화되었으므로 변경 사항이 반영된 스냅샷을 다시 받는다
+            snapshot = self._get_context_snapshot(user_id)
+        
+        return True, self._build_chat_messages(user_id, question, result, similar_summaries, snapshot)
+
+    def _build_chat_messages(self, user_id: int, question: str, intent_result: Tuple[str, str, Optional[str]],
+                             similar_summaries: List[str], snapshot: Dict) -> List:
+        intent_type, action, action_message = intent_result
+        contexts, todaydata = self._build_context('chat', user_id, similar_summaries, "관련된 과거 주간/월간 요약:", snapshot)
 
         if intent_type in ["schedule", "todo"] and action in ["add", "update", "delete"]:
             system_prompt = f"""
             당신은 사용자의 일상을 관리해주는 AI 비서입니다.
-            방금 다음과 같은 작업을 수행했습니다: {message}
+            방금 다음과 같은 작업을 수행했습니다: {action_message}
             
             사용자의 일기, 할 일, 일정 데이터를 기반으로 자연스럽게 대화하며 도움을 제공해주세요.
             항상 친절하고 공감적인 태도를 유지하면서, 실질적인 도움이 되는 답변을 제공해주세요.
@@ -236,28 +318,249 @@ class LLMService:
             오늘 생성된 데이터: {todaydata}
             """
 
+        if not contexts:
+            contexts = ["데이터가 없습니다."]
+
         # 메시지 구성
+        from langchain_core.messages import SystemMessage, HumanMessage
         messages = [
             SystemMessage(content=system_prompt),
             SystemMessage(content="\n".join(contexts)),
             HumanMessage(content=question)
         ]
 
-        if todaydata:
-            contexts.extend(todaydata)
-            current_app.logger.info(f"Final contexts after adding todaydata: {contexts}")  # contexts 로깅 추가
-        else:
-            contexts.append(f"일일 데이터가 없습니다. 최소 하루의 데이터를 추가하여야 결과를 얻을 수 있습니다.")
+        return messages
 
-        if not contexts:
-            contexts = ["데이터가 없습니다."]
+    def _apply_user_intent(self, user_id: int, question: str) -> Tuple[bool, Union[Tuple[str, str, Optional[str]], str]]:
+        intent = self._analyze_user_intent(question, user_id)
+        return self._execute_user_intent(user_id, question, intent)
 
-        try:
+    def _execute_user_intent(self, user_id: int, question: str,
+                             intent: Tuple[str, str, dict]) -> Tuple[bool, Union[Tuple[str, str, Optional[str]], str]]:
+        intent_type, action, content = intent
+        
+        original_type = "todo" if "시에" in question and "할일" in question else None
+        
+        if intent_type in ["schedule", "todo"] and action in ["add", "update", "delete"]:
+            if intent_type == "schedule":
+                success, action_message = self._manage_schedule(user_id, action, content)
+                if original_type == "todo":
+                    action_message = f"시간이 포함되어 있어서 할일이 아닌 일정으로 추가했습니다. {action_message}"
+            else: 
+                success, action_message = self._manage_todo(user_id, action, content)
+                
+            if not success:
+                return False, action_message
+            
+            return True, (intent_type, action, action_message)
+        
+        return True, (intent_type, action, None)
+
+    def _stream_tokens(self, endpoint: str, messages: List, user_id: Optional[int] = None) -> Iterator[str]:
+        self._init_model()
+
+        aggregate = None
+        with metrics.timer(f'{endpoint}_completion') as timer:
+            for chunk in self.chat_model.stream(messages):
+                # 마지막 청크에 usage가 실려 오므로 합쳐서 기록 (stream_usage=True)
+                aggregate = chunk if aggregate is None else aggregate + chunk
+                if chunk.content:
+                    yield chunk.content
+        record_llm_usage(endpoint, aggregate, timer.elapsed, user_id, self.job)
+
+    def _invoke(self, endpoint: str, messages: List, stage: Optional[str] = None, user_id: Optional[int] = None):
+        self._init_model()
+
+        with metrics.timer(stage or f'{endpoint}_completion') as timer:
             response = self.chat_model.invoke(messages)
-            return True, response.content
-        except Exception as e:
-            current_app.logger.error(f"챗봇 응답 생성 중 오류가 발생했습니다: {str(e)}")
-            return False, "챗봇 응답 생성 중 오류가 발생했습니다."
+        record_llm_usage(endpoint, response, timer.elapsed, user_id, self.job)
+        return response
+
+    def _build_context(self, endpoint: str, user_id: int, summary_texts: List[str], summary_header: str,
+                       snapshot: Dict) -> Tuple[List[str], List[str]]:
+        assembler = ContextAssembler(
+            current_app.config['OPENAI_MODEL'],
+            current_app.config[CONTEXT_TOKEN_BUDGETS[endpoint]]
+        )
+
+        # 우선순위: 오늘 데이터 > 주간/월간 요약 > 과거 일일 데이터
+        todaydata = []
+        no_data_message = []
+        success, daily_data, message = snapshot['daily_result']
+        if success:
+            todaydata = assembler.add_section('today', self._format_daily_data(daily_data))
+        else:
+            no_data_message.append("일일 데이터가 없습니다. 최소 하루의 데이터를 추가하여야 결과를 얻을 수 있습니다.")
+
+        summary_lines = assembler.add_section(
+            'summaries',
+            summary_texts,
+            header=summary_header,
+            max_tokens=int(assembler.budget * SUMMARY_BUDGET_RATIO)
+        )
+        past_lines = assembler.add_section(
+            'past',
+            (f"{entry['select_date'].strftime('%Y-%m-%d')}의 데이터:\n{entry['cleaned_text']}" for entry in snapshot['past_entries']),
+            header="\n과거 데이터:"
+        )
+
+        current_app.logger.info(f"[{endpoint}] 컨텍스트 토큰 사용량: {assembler.usage} (합계 {assembler.used}/{assembler.budget})")
+        return summary_lines + no_data_message + past_lines, todaydata
+
+    def _get_context_snapshot(self, user_id: int) -> Dict:
+        today = datetime.now().date()
+        return context_cache.get_or_load(user_id, today, lambda: self._load_context_snapshot(user_id, today))
+
+    def _get_current_context_snapshot(self, user_id: int) -> Dict:
+        # 응답 캐시를 쓰는 경로용: 캐시된 스냅샷이 현재 데이터 상태와 다르면(다른 워커/백엔드의 변경) 다시 읽는다
+        today = datetime.now().date()
+        loaded = False
+
+        def load():
+            nonlocal loaded
+            loaded = True
+            return self._load_context_snapshot(user_id, today)
+
+        snapshot = context_cache.get_or_load(user_id, today, load)
+        if loaded:
+            # 방금 읽은 스냅샷은 이미 현재 상태 - 다시 확인하지 않는다
+            return snapshot
+
+        # 확인 쿼리 비용은 캐시 적중으로 아낀 시간에서 뺀다
+        started_at = time.perf_counter()
+        data_state = self._get_data_state(user_id, today)
+        stale = snapshot['data_state'] != data_state
+        context_cache.record_validation(time.perf_counter() - started_at, snapshot if stale else None)
+        if stale:
+            context_cache.invalidate(user_id)
+            snapshot = context_cache.get_or_load(user_id, today, load)
+        return snapshot
+
+    def _get_data_state(self, user_id: int, today: datetime.date) -> Dict:
+        # 스냅샷에 들어가는 데이터가 바뀌었는지 판단하는 가벼운 집계 (캐시하지 않고 한 번의 쿼리로 매번 읽는다)
+        # 원본 테이블에는 updated_at이 없으므로 오늘 행의 개수/최신 created_at/본문 길이 합과 완료한 할 일 수로 수정을 감지한다
+        # 테이블마다 집계 하나씩(GROUP BY 없는 집계라 항상 한 행)을 묶어 사용자 인덱스를 테이블당 한 번만 읽는다
+        start_datetime = datetime.combine(today, datetime.min.time())
+        end_datetime = datetime.combine(today, datetime.max.time())
+
+        def aggregate(model, *columns, today_only=False):
+            criteria = [model.user_id == user_id]
+            if today_only:
+                criteria.append(model.created_at.between(start_datetime, end_datetime))
+            return select(*columns).where(*criteria).subquery()
+
+        tables = []
+        for name, model, content in (('diary', Diary, Diary.content), ('todo', Todo, Todo.content),
+                                     ('schedule', Schedule, Schedule.title + func.coalesce(Schedule.content, ''))):
+            columns = [
+                func.count(model.id).label(f'{name}_count'),
+                func.max(model.created_at).label(f'{name}_created_at'),
+                func.sum(func.length(content)).label(f'{name}_length'),
+            ]
+            if model is Todo:
+                columns.append(func.count(Todo.id).filter(Todo.is_completed.is_(True)).label('todo_completed'))
+            tables.append(aggregate(model, *columns, today_only=True))
+        tables.append(aggregate(
+            CleanedData,
+            func.count(CleanedData.id).label('cleaned_data_count'),
+            func.max(CleanedData.id).label('cleaned_data_max_id'),
+            func.max(CleanedData.built_at).label('cleaned_data_built_at')
+        ))
+        tables.append(aggregate(
+            Summary,
+            func.count(Summary.id).label('summary_count'),
+            func.max(Summary.id).label('summary_max_id'),
+            func.max(Summary.updated_through).label('summary_updated_through')
+        ))
+
+        joined = tables[0]
+        for table in tables[1:]:
+            joined = joined.join(table, true())
+
+        with metrics.timer('data_state'):
+            row = db.session.execute(select(*[column for table in tables for column in table.c]).select_from(joined)).one()
+        return dict(row._mapping)
+
+    def _load_context_snapshot(self, user_id: int, today: datetime.date) -> Dict:
+        # 상태를 먼저 읽는다 - 로딩 중에 바뀐 내용은 다음 요청에서 상태가 달라 다시 읽힌다
+        data_state = self._get_data_state(user_id, today)
+
+        # 월간 요약으로 압축되지 않은 최근 주간 요약 + 그 이전의 월간 요약 (최신순)
+        self._init_embedding_service()
+        monthly_cutoff = self.embedding_service.get_monthly_cutoff(user_id)
+        
+        summary_columns = (Summary.id, Summary.start_date, Summary.end_date, Summary.summary_text)
+        weekly_query = Summary.query.with_entities(*summary_columns).filter_by(
+            user_id=user_id,
+            type='weekly'
+        )
+        if monthly_cutoff:
+            weekly_query = weekly_query.filter(Summary.start_date > monthly_cutoff)
+        summaries = weekly_query.order_by(Summary.end_date.desc()).limit(3).all()
+        
+        if monthly_cutoff:
+            summaries += Summary.query.with_entities(*summary_columns).filter_by(
+                user_id=user_id,
+                type='monthly'
+            ).order_by(Summary.end_date.desc()).limit(current_app.config['CONTEXT_MONTHLY_SUMMARIES']).all()
+
+        with metrics.timer('cleaned_data_scan'):
+            past_entries = [
+                dict(entry._mapping)
+                for entry in islice(self._iter_past_daily_data(user_id, today), current_app.config['CONTEXT_SNAPSHOT_PAST_ENTRIES'])
+            ]
+
+        return {
+            'summaries': [dict(summary._mapping) for summary in summaries],
+            'daily_result': self.get_daily_data(user_id, today),
+            'past_entries': past_entries,
+            'data_state': data_state,
+        }
+
+    def _format_summary(self, start_date: datetime.date, end_date: datetime.date, summary_text: str) -> str:
+        return f"{start_date.strftime('%Y-%m-%d')}~{end_date.strftime('%Y-%m-%d')}: {summary_text}"
+
+    def _format_daily_data(self, daily_data: Dict) -> List[str]:
+        todaydata = []
+
+        if daily_data.get('diary'):
+            diary_texts = [f"{diary['select_date']}: {diary['content']}" for diary in daily_data['diary']]
+            todaydata.append(f"\n오늘의 일기:\n" + "\n".join(diary_texts))
+
+        if daily_data.get('todos'):
+            todo_texts = [f"- {todo['select_date']}: {todo['content']} (완료: {'예' if todo['is_completed'] else '아니오'})" for todo in daily_data['todos']]
+            todaydata.append(f"\n오늘의 할 일:\n" + "\n".join(todo_texts))
+
+        if daily_data.get('schedules'):
+            schedule_texts = [f"- {schedule['content']} ({schedule['select_date']})" for schedule in daily_data['schedules']]
+            todaydata.append(f"\n오늘의 일정:\n" + "\n".join(schedule_texts))
+
+        return todaydata
+
+    def _iter_past_daily_data(self, user_id: int, exclude_date: datetime.date, page_size: int = 20) -> Iterator:
+        # 최신순으로 페이지 단위 조회 - 예산이 차면 더 이상 읽지 않는다
+        last_row = None
+        while True:
+            query = CleanedData.query.with_entities(
+                CleanedData.id,
+                CleanedData.select_date,
+                CleanedData.cleaned_text
+            ).filter(
+                CleanedData.user_id == user_id,
+                CleanedData.select_date != exclude_date  # 오늘 데이터는 제외
+            )
+            if last_row:
+                query = query.filter(or_(
+                    CleanedData.select_date < last_row.select_date,
+                    and_(CleanedData.select_date == last_row.select_date, CleanedData.id < last_row.id)
+                ))
+
+            rows = query.order_by(CleanedData.select_date.desc(), CleanedData.id.desc()).limit(page_size).all()
+            yield from rows
+
+            if len(rows) < page_size:
+                return
+            last_row = rows[-1]
 
     def _parse_date(self, date_str: str) -> datetime.date:
         try:
@@ -406,6 +709,7 @@ class LLMService:
                 message = "일정이 삭제되었습니다."
             
             db.session.commit()
+            context_cache.invalidate(user_id)
             return True, message
             
         except Exception as e:
@@ -446,15 +750,36 @@ class LLMService:
                 message = "할일이 삭제되었습니다."
             
             db.session.commit()
+            context_cache.invalidate(user_id)
             return True, message
             
         except Exception as e:
             db.session.rollback()
             return False, f"할일 관리 중 오류가 발생했습니다: {str(e)}"
 
-    def _analyze_user_intent(self, question: str) -> Tuple[str, str, dict]:
+    def _analyze_user_intent(self, question: str, user_id: Optional[int] = None) -> Tuple[str, str, dict]:
+        intent = self._classify_intent_by_rule(question)
+        if intent is not None:
+            return intent
+        return self._analyze_user_intent_with_llm(question, user_id)
+
+    def _classify_intent_by_rule(self, question: str) -> Optional[Tuple[str, str, dict]]:
+        # 규칙 기반 분류가 충분히 확실하면 LLM 호출 없이 결정
+        intent = classify_intent(question)
+        if intent.confidence >= current_app.config['INTENT_RULE_CONFIDENCE_THRESHOLD']:
+            record_intent_path('rule')
+            return intent.type, intent.action, intent.content
+        
+        record_intent_path('llm')
+        return None
+
+    def _analyze_user_intent_with_llm(self, question: str, user_id: Optional[int] = None) -> Tuple[str, str, dict]:
         self._init_model()
         
+        response = self._invoke('intent', self._intent_messages(question), stage='intent_llm', user_id=user_id)
+        return self._parse_intent_response(question, response.content)
+
+    def _intent_messages(self, question: str) -> List:
         system_prompt = """
         당신은 사용자의 의도를 분석하는 AI 비서입니다.
         사용자의 메시지를 분석하여 다음 정보를 JSON 형식으로 반환해주세요:
@@ -477,16 +802,15 @@ class LLMService:
         - "오늘 할일 중에서 보고서 작성 삭제해줘" -> {"type": "todo", "action": "delete", "content": {"content": "보고서 작성", "date": "오늘"}}
         """
         
-        messages = [
+        from langchain_core.messages import SystemMessage, HumanMessage
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=question)
         ]
-        
-        response = self.chat_model.invoke(messages)
-        
+
+    def _parse_intent_response(self, question: str, response_text: str) -> Tuple[str, str, dict]:
         try:
-            import json
-            result = json.loads(response.content)
+            result = json.loads(response_text)
             
             # 시간이 포함된 경우 schedule로 변환
             if result["type"] == "todo" and ("time" in result["content"] or 
@@ -503,56 +827,97 @@ class LLMService:
             current_app.logger.error(f"의도 분석 중 오류 발생: {str(e)}")
             return "chat", "chat", {}
 
-    def create_feedback(self, user_id: int, select_date: datetime.date) -> Tuple[bool, str]:
-        self._init_model()
-        
-        # 컨텍스트 수집
-        contexts = []
-        todaydata = []
-        
-        # 1. 모든 주간 요약 가져오기
-        summaries = Summary.query.filter_by(
-            user_id=user_id,
-            type='weekly'
-        ).order_by(Summary.end_date.desc()).limit(3).all()
-        
-        if summaries:
-            contexts.append("주간 요약:")
-            for summary in summaries:
-                contexts.append(f"{summary.start_date.strftime('%Y-%m-%d')}~{summary.end_date.strftime('%Y-%m-%d')}: {summary.summary_text}")
-        
-        # 2. 일일 데이터 조회
-        today = datetime.now().date()
-        success, daily_data, message = self.get_daily_data(user_id, today)
-        if success:
-            # 일일 데이터를 컨텍스트에 추가
-            if daily_data.get('diary'):
-                diary_texts = [f"{diary['select_date']}: {diary['content']}" for diary in daily_data['diary']]
-                todaydata.append(f"\n오늘의 일기:\n" + "\n".join(diary_texts))
-            
-            if daily_data.get('todos'):
-                todo_texts = [f"- {todo['select_date']}: {todo['content']} (완료: {'예' if todo['is_completed'] else '아니오'})" for todo in daily_data['todos']]
-                todaydata.append(f"\n오늘의 할 일:\n" + "\n".join(todo_texts))
-            
-            if daily_data.get('schedules'):
-                schedule_texts = [f"- {schedule['content']} ({schedule['select_date']})" for schedule in daily_data['schedules']]
-                todaydata.append(f"\n오늘의 일정:\n" + "\n".join(schedule_texts))
+    def create_feedback(self, user_id: int, select_date: datetime.date, force_refresh: bool = False) -> Tuple[bool, str]:
+        messages, fingerprint = self._prepare_feedback_messages(user_id, select_date)
 
-        else:
-            contexts.append(f"일일 데이터가 없습니다. 최소 하루의 데이터를 추가하여야 결과를 얻을 수 있습니다.")
+        cached = self._get_cached_response('feedback', user_id, select_date, fingerprint, force_refresh)
+        if cached is not None:
+            return True, cached
 
+        try:
+            response = self._invoke('feedback', messages, user_id=user_id)
+            feedback_text = response.content
+
+            self._save_feedback(user_id, select_date, feedback_text, fingerprint)
+
+            return True, feedback_text
+        except Exception as e:
+            current_app.logger.error(f"피드백 생성 중 오류가 발생했습니다: {str(e)}")
+            return False, "피드백 생성 중 오류가 발생했습니다."
+
+    def stream_feedback(self, user_id: int, select_date: datetime.date, force_refresh: bool = False) -> Tuple[bool, Union[Iterator[str], str]]:
+        messages, fingerprint = self._prepare_feedback_messages(user_id, select_date)
+
+        cached = self._get_cached_response('feedback', user_id, select_date, fingerprint, force_refresh)
+        if cached is not None:
+            return True, iter([cached])
+
+        def generate():
+            chunks = []
+            for token in self._stream_tokens('feedback', messages, user_id):
+                chunks.append(token)
+                yield token
+            # 스트림이 끝까지 전송된 경우에만 한 번 저장
+            self._save_feedback(user_id, select_date, "".join(chunks), fingerprint)
+
+        return True, generate()
+
+    def _save_feedback(self, user_id: int, select_date: datetime.date, feedback_text: str, fingerprint: str):
+        try:
+            feedback = Feedback(
+                user_id=user_id,
+                feedback=feedback_text,
+                select_date=select_date
+            )
+            db.session.add(feedback)
+            self._store_cached_response('feedback', user_id, select_date, fingerprint, feedback_text)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+    def _fingerprint(self, endpoint: str, snapshot: Dict, select_date: datetime.date) -> str:
+        # 응답을 결정하는 입력 전체: 오늘 데이터, 과거 데이터/요약 id, 데이터 상태, 프롬프트 버전, 모델 설정
+        # 스냅샷은 _get_current_context_snapshot으로 현재 데이터 상태와 맞춘 것이어야 한다
+        success, daily_data, _ = snapshot['daily_result']
+        payload = {
+            'endpoint': endpoint,
+            'select_date': select_date,
+            'today': snapshot['date'],
+            'prompt_version': PROMPT_VERSIONS[endpoint],
+            'model': current_app.config['OPENAI_MODEL'],
+            'temperature': current_app.config['OPENAI_TEMPERATURE'],
+            'token_budget': current_app.config[CONTEXT_TOKEN_BUDGETS[endpoint]],
+            'daily_data': daily_data if success else None,
+            'summary_ids': [summary['id'] for summary in snapshot['summaries']],
+            'cleaned_data_ids': [entry['id'] for entry in snapshot['past_entries']],
+            'data_state': snapshot['data_state'],
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    def _get_cached_response(self, endpoint: str, user_id: int, select_date: datetime.date,
+                             fingerprint: str, force_refresh: bool) -> Optional[str]:
+        if not current_app.config['RESPONSE_CACHE_ENABLED']:
+            return None
+        if force_refresh:
+            response_cache.record_refresh()
+            return None
+        return response_cache.get(user_id, endpoint, select_date, fingerprint)
+
+    def _store_cached_response(self, endpoint: str, user_id: int, select_date: datetime.date,
+                               fingerprint: str, response_text: str):
+        if current_app.config['RESPONSE_CACHE_ENABLED']:
+            response_cache.set(user_id, endpoint, select_date, fingerprint, response_text)
+
+    def _prepare_feedback_messages(self, user_id: int, select_date: datetime.date) -> Tuple[List, str]:
+        self._init_model()
         
-        # 3. 모든 일일 데이터 가져오기
-        all_data = CleanedData.query.filter_by(
-            user_id=user_id
-        ).order_by(CleanedData.select_date.desc()).all()
-
-        if all_data:
-            contexts.append("\n과거 데이터:")
-            for data in all_data:
-                if data.select_date != today:  # 오늘 데이터는임시 제외
-                    contexts.append(f"{data.select_date.strftime('%Y-%m-%d')}의 데이터:\n{data.cleaned_text}")
-        
+        snapshot = self._get_current_context_snapshot(user_id)
+        fingerprint = self._fingerprint('feedback', snapshot, select_date)
+        summary_texts = [self._format_summary(summary['start_date'], summary['end_date'], summary['summary_text'])
+                         for summary in snapshot['summaries']]
+        contexts, todaydata = self._build_context('feedback', user_id, summary_texts, "주간/월간 요약:", snapshot)
 
         # 유저 테스트용
         system_prompt = f"""
@@ -583,80 +948,62 @@ class LLMService:
             """
         
         # 메시지 구성: 시스템 프롬프트와 컨텍스트
+        from langchain_core.messages import SystemMessage, HumanMessage
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content="\n".join(contexts))
         ]
+        return messages, fingerprint
 
-        try:
-            response = self.chat_model.invoke(messages)
-            feedback_text = response.content
+    def create_recommendation(self, user_id: int, force_refresh: bool = False) -> Tuple[bool, str]:
+        today = datetime.now().date()
+        messages, fingerprint = self._prepare_recommendation_messages(user_id)
 
-            # Feedback 모델에 저장
-            feedback = Feedback(
-                user_id=user_id,
-                feedback=feedback_text,
-                select_date=select_date
-            )
-            db.session.add(feedback)
-            db.session.commit()
+        cached = self._get_cached_response('recommend', user_id, today, fingerprint, force_refresh)
+        if cached is not None:
+            return True, cached
 
-            return True, feedback_text
-        except Exception as e:
-            current_app.logger.error(f"피드백 생성 중 오류가 발생했습니다: {str(e)}")
-            return False, "피드백 생성 중 오류가 발생했습니다."
-
-    def create_recommendation(self, user_id: int) -> Tuple[bool, str]:
-        self._init_model()
-        
-        # 컨텍스트 수집
-        contexts = []
-        todaydata = []
-        
-        # 1. 모든 주간 요약 가져오기
-        summaries = Summary.query.filter_by(
-            user_id=user_id,
-            type='weekly'
-        ).order_by(Summary.end_date.desc()).limit(3).all()
-        
-        if summaries:
-            contexts.append("주간 요약:")
-            for summary in summaries:
-                contexts.append(f"{summary.start_date.strftime('%Y-%m-%d')}~{summary.end_date.strftime('%Y-%m-%d')}: {summary.summary_text}")
-        
+        response = self._invoke('recommend', messages, user_id=user_id)
+        self._save_recommendation(user_id, today, response.content, fingerprint)
+        return True, response.content
 
-        # 2. 일일 데이터 조회
+    def stream_recommendation(self, user_id: int, force_refresh: bool = False) -> Tuple[bool, Union[Iterator[str], str]]:
         today = datetime.now().date()
-        success, daily_data, message = self.get_daily_data(user_id, today)
-        if success:
-            # 일일 데이터를 컨텍스트에 추가
-            if daily_data.get('diary'):
-                diary_texts = [f"{diary['select_date']}: {diary['content']}" for diary in daily_data['diary']]
-                todaydata.append(f"\n오늘의 일기:\n" + "\n".join(diary_texts))
-            
-            if daily_data.get('todos'):  # 'todo'가 아닌 'todos'
-                todo_texts = [f"- {todo['select_date']}: {todo['content']} (완료: {'예' if todo['is_completed'] else '아니오'})" for todo in daily_data['todos']]
-                todaydata.append(f"\n오늘의 할 일:\n" + "\n".join(todo_texts))
-            
-            if daily_data.get('schedules'):  # 'schedule'이 아닌 'schedules'
-                schedule_texts = [f"- {schedule['content']} ({schedule['select_date']})" for schedule in daily_data['schedules']]
-                todaydata.append(f"\n오늘의 일정:\n" + "\n".join(schedule_texts))
+        messages, fingerprint = self._prepare_recommendation_messages(user_id)
 
-        else:
-            contexts.append(f"일일 데이터가 없습니다. 최소 하루의 데이터를 추가하여야 결과를 얻을 수 있습니다.")
+        cached = self._get_cached_response('recommend', user_id, today, fingerprint, force_refresh)
+        if cached is not None:
+            return True, iter([cached])
 
+        def generate():
+            chunks = []
+            for token in self._stream_tokens('recommend', messages, user_id):
+                chunks.append(token)
+                yield token
+            self._save_recommendation(user_id, today, "".join(chunks), fingerprint)
+
+        return True, generate()
+
+    def _save_recommendation(self, user_id: int, select_date: datetime.date, recommendation_text: str, fingerprint: str):
+        if not current_app.config['RESPONSE_CACHE_ENABLED']:
+            return
+
+        try:
+            self._store_cached_response('recommend', user_id, select_date, fingerprint, recommendation_text)
+            db.session.commit()
+        except Exception as e:
+            # 캐시 저장 실패는 응답에 영향을 주지 않는다
+            db.session.rollback()
+            current_app.logger.warning(f"추천 캐시 저장 중 오류가 발생했습니다: {str(e)}")
+
+    def _prepare_recommendation_messages(self, user_id: int) -> Tuple[List, str]:
+        self._init_model()
         
-        # 3. 모든 일일 데이터 가져오기
-        all_data = CleanedData.query.filter_by(
-            user_id=user_id
-        ).order_by(CleanedData.select_date.desc()).all()
-        
-        if all_data:
-            contexts.append("\n과거 데이터:")
-            for data in all_data:
-                if data.select_date != today:  # 오늘 데이터는임시 제외
-                    contexts.append(f"{data.select_date.strftime('%Y-%m-%d')}의 데이터:\n{data.cleaned_text}")
-        
+        snapshot = self._get_current_context_snapshot(user_id)
+        fingerprint = self._fingerprint('recommend', snapshot, snapshot['date'])
+        summary_texts = [self._format_summary(summary['start_date'], summary['end_date'], summary['summary_text'])
+                         for summary in snapshot['summaries']]
+        contexts, todaydata = self._build_context('recommend', user_id, summary_texts, "주간/월간 요약:", snapshot)
 
         # 유저 테스트용
         system_prompt = f"""
@@ -685,24 +1032,24 @@ class LLMService:
         """
         
         # 메시지 구성: 시스템 프롬프트와 컨텍스트
+        from langchain_core.messages import SystemMessage, HumanMessage
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content="\n".join(contexts))
         ]
-        
-        response = self.chat_model.invoke(messages)
-        return True, response.content
+        return messages, fingerprint
 
-    def _preprocess_text(self, text: str) -> str:
+    def _preprocess_text(self, text: str, user_id: Optional[int] = None) -> str:
         system_prompt = """
         입력된 텍스트를 자연스럽게 정리해주세요. 
         중요한 내용은 유지하면서, 불필요한 부분은 제거하고 문장을 매끄럽게 다듬어주세요.
         """
         
+        from langchain_core.messages import SystemMessage, HumanMessage
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content=text)
         ]
         
-        response = self.chat_model.invoke(messages)
+        response = self._invoke('preprocess', messages, user_id=user_id)
         return response.content
\ No newline at end of file
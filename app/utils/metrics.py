@@ -0,0 +1,212 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from app.utils.clients import clients
+from app.utils.context import count_tokens
+from app.utils.usage_ledger import usage_ledger
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+JOB_LATENCY_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+TOKEN_BUCKETS = (16, 64, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+
+def _label_text(names: Sequence[str], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def expose(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_label_text(self.labelnames, key)} {value}"
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+    def expose(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_label_text(self.labelnames, key)} {value}"
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Tuple[list, float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def expose(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            values = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _label_text(self.labelnames, key, 'le="%s"' % bound)
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            cumulative += counts[-1]
+            labels = _label_text(self.labelnames, key, 'le="+Inf"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+            yield f"{self.name}_sum{_label_text(self.labelnames, key)} {total}"
+            yield f"{self.name}_count{_label_text(self.labelnames, key)} {cumulative}"
+
+
+class StageTimer:
+    def __init__(self):
+        self.elapsed: Optional[float] = None  # with 블록이 끝난 뒤 채워진다
+
+
+class MetricsRegistry:
+    # 프로세스 단위 Prometheus 지표 (GET /metrics 에서 text format으로 노출)
+
+    def __init__(self):
+        self.stage_duration = Histogram(
+            'maiddy_stage_duration_seconds',
+            '요청/작업 단계별 소요 시간',
+            ('stage',)
+        )
+        self.llm_prompt_tokens = Histogram(
+            'maiddy_llm_prompt_tokens',
+            'LLM 호출당 프롬프트 토큰 수',
+            ('endpoint', 'model'),
+            buckets=TOKEN_BUCKETS
+        )
+        self.llm_completion_tokens = Histogram(
+            'maiddy_llm_completion_tokens',
+            'LLM 호출당 응답 토큰 수',
+            ('endpoint', 'model'),
+            buckets=TOKEN_BUCKETS
+        )
+        self.llm_tokens = Counter(
+            'maiddy_llm_tokens_total',
+            '누적 LLM 토큰 수',
+            ('endpoint', 'model', 'type')
+        )
+        self.job_user_duration = Histogram(
+            'maiddy_job_user_duration_seconds',
+            '스케줄러 작업의 사용자별 처리 시간',
+            ('job', 'result'),
+            buckets=JOB_LATENCY_BUCKETS
+        )
+        self.startup_seconds = Gauge(
+            'maiddy_startup_seconds',
+            '프로세스 시작부터 각 시작 단계(create_app, warmup, ready)가 끝날 때까지 걸린 시간',
+            ('phase',)
+        )
+        self._metrics = (
+            self.stage_duration,
+            self.llm_prompt_tokens,
+            self.llm_completion_tokens,
+            self.llm_tokens,
+            self.job_user_duration,
+            self.startup_seconds,
+        )
+
+    @contextmanager
+    def timer(self, stage: str):
+        timer = StageTimer()
+        started_at = time.perf_counter()
+        try:
+            yield timer
+        finally:
+            timer.elapsed = time.perf_counter() - started_at
+            self.stage_duration.observe(timer.elapsed, stage=stage)
+
+    def record_usage(self, endpoint: str, model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]):
+        if prompt_tokens is None and completion_tokens is None:
+            return
+        prompt_tokens = prompt_tokens or 0
+        completion_tokens = completion_tokens or 0
+        self.llm_prompt_tokens.observe(prompt_tokens, endpoint=endpoint, model=model)
+        self.llm_completion_tokens.observe(completion_tokens, endpoint=endpoint, model=model)
+        self.llm_tokens.inc(prompt_tokens, endpoint=endpoint, model=model, type='prompt')
+        self.llm_tokens.inc(completion_tokens, endpoint=endpoint, model=model, type='completion')
+
+    def expose(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.expose())
+        return "\n".join(lines) + "\n"
+
+
+def usage_from_message(message) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    # LangChain AIMessage(또는 합쳐진 스트림 청크)에서 (프롬프트 토큰, 응답 토큰, 모델명)
+    usage = getattr(message, 'usage_metadata', None) or {}
+    model = (getattr(message, 'response_metadata', None) or {}).get('model_name')
+    return usage.get('input_tokens'), usage.get('output_tokens'), model
+
+
+metrics = MetricsRegistry()
+
+
+def record_llm_usage(endpoint: str, message, latency: Optional[float] = None, user_id: Optional[int] = None,
+                     job: Optional[str] = None):
+    # job: 스케줄러/수집 이벤트에서 호출했을 때의 작업 이름 (daily_job, ingestion 등), API 요청은 None
+    prompt_tokens, completion_tokens, model = usage_from_message(message)
+    model = model or clients.config['OPENAI_MODEL']
+    metrics.record_usage(endpoint, model, prompt_tokens, completion_tokens)
+    usage_ledger.record(endpoint, model, prompt_tokens, completion_tokens, latency, user_id, job)
+
+
+def record_embedding_usage(endpoint: str, texts: List[str], latency: Optional[float] = None,
+                           user_ids: Optional[Sequence[Optional[int]]] = None, job: Optional[str] = None):
+    # 임베딩 응답에는 사용량이 없으므로 tiktoken으로 센다 (한 번의 호출은 텍스트 수로 나눠 사용자별로 기록)
+    model = clients.config['OPENAI_EMBEDDING_MODEL']
+    user_ids = user_ids or [None] * len(texts)
+    share = latency / len(texts) if latency is not None and texts else latency
+    for text, user_id in zip(texts, user_ids):
+        tokens = count_tokens(model, text)
+        metrics.llm_tokens.inc(tokens, endpoint=endpoint, model=model, type='prompt')
+        usage_ledger.record(endpoint, model, tokens, 0, share, user_id, job)
@@ -0,0 +1,65 @@
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy.dialects.postgresql import insert
+from app.extensions import db
+from app.models import ResponseCache as ResponseCacheEntry
+
+
+class ResponseCache:
+    # (사용자, 엔드포인트, 날짜)별로 마지막 응답과 입력 지문을 저장하고, 지문이 같으면 LLM 호출 없이 재사용
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def get(self, user_id: int, endpoint: str, select_date, fingerprint: str) -> Optional[str]:
+        entry = ResponseCacheEntry.query.with_entities(ResponseCacheEntry.response).filter_by(
+            user_id=user_id,
+            endpoint=endpoint,
+            select_date=select_date,
+            fingerprint=fingerprint
+        ).first()
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry.response
+
+    def set(self, user_id: int, endpoint: str, select_date, fingerprint: str, response: str):
+        # 호출 측 트랜잭션에 포함 (커밋은 호출 측에서)
+        now = datetime.utcnow()
+        db.session.execute(
+            insert(ResponseCacheEntry).values(
+                user_id=user_id,
+                endpoint=endpoint,
+                select_date=select_date,
+                fingerprint=fingerprint,
+                response=response,
+                created_at=now
+            ).on_conflict_do_update(
+                index_elements=['user_id', 'endpoint', 'select_date'],
+                set_={'fingerprint': fingerprint, 'response': response, 'created_at': now}
+            )
+        )
+
+    def record_refresh(self):
+        with self._lock:
+            self.refreshes += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'refreshes': self.refreshes,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,124 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from app.utils.clients import clients
+from app.utils.context import count_tokens
+from app.utils.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def _process_started_at() -> float:
+    # /proc/self/stat의 starttime(부팅 후 clock tick)과 /proc/uptime으로 프로세스가 시작된 시각(epoch)을 구한다.
+    # gunicorn 워커는 fork된 시각이 기준이 된다. /proc가 없으면 이 모듈을 불러온 시각으로 대신한다
+    try:
+        with open('/proc/self/stat') as stat:
+            start_ticks = int(stat.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime') as uptime:
+            system_uptime = float(uptime.read().split()[0])
+        return time.time() - (system_uptime - start_ticks / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return time.time()
+
+
+def _import_langchain():
+    import langchain_core.messages  # noqa: F401
+    import langchain_openai  # noqa: F401
+
+
+def _create_clients():
+    clients.chat_model
+    clients.embedding_model
+
+
+def _load_tokenizers():
+    count_tokens(clients.config['OPENAI_MODEL'], '')
+    count_tokens(clients.config['OPENAI_EMBEDDING_MODEL'], '')
+
+
+# 첫 요청이 대신 치르던 비용: 무거운 import, OpenAI 클라이언트 생성, tiktoken 인코딩 로드.
+# DB 커넥션은 gunicorn --preload에서 fork 전에 열리면 워커끼리 소켓을 공유하게 되므로 미리 열지 않는다
+WARMUP_STEPS = (
+    ('imports', _import_langchain),
+    ('clients', _create_clients),
+    ('tokenizers', _load_tokenizers),
+)
+
+
+class StartupTracker:
+    # 프로세스 시작부터 요청을 받을 준비가 될 때까지의 시간(time-to-ready)을 단계별로 기록한다.
+    #   imports     create_app이 호출될 때까지 (인터프리터, Flask, 라우트/모델 import)
+    #   create_app  create_app이 끝날 때까지
+    #   warmup      WARMUP_ENABLED일 때 백그라운드 워밍업이 끝날 때까지
+    #   ready       워밍업이 끝났거나(켠 경우) create_app이 끝난 시점
+    # 값은 /metrics의 maiddy_startup_seconds와 /stats/의 startup에서 볼 수 있다.
+
+    def __init__(self):
+        self.app = None
+        self.process_started_at = _process_started_at()
+        self.phases: Dict[str, float] = {}
+        self.warmup_steps: Dict[str, float] = {}
+        self.warmup_error: Optional[str] = None
+        self._ready = threading.Event()
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['startup'] = self
+
+    def mark(self, phase: str) -> float:
+        elapsed = time.time() - self.process_started_at
+        self.phases[phase] = round(elapsed, 3)
+        metrics.startup_seconds.set(elapsed, phase=phase)
+        return elapsed
+
+    def app_created(self):
+        # create_app 마지막에 호출: 워밍업을 켰으면 백그라운드에서 시작하고, 아니면 바로 준비 완료
+        self.mark('create_app')
+        if self.app.config['WARMUP_ENABLED']:
+            threading.Thread(target=self._run_warmup, name='startup-warmup', daemon=True).start()
+        else:
+            self._set_ready()
+
+    def warm_up(self) -> Dict[str, float]:
+        for name, step in WARMUP_STEPS:
+            started_at = time.perf_counter()
+            step()
+            self.warmup_steps[name] = round(time.perf_counter() - started_at, 3)
+        return dict(self.warmup_steps)
+
+    def _run_warmup(self):
+        try:
+            self.warm_up()
+            self.mark('warmup')
+        except Exception as e:
+            # 워밍업 실패는 첫 요청이 느려질 뿐이므로 기록만 한다
+            self.warmup_error = str(e)
+            logger.warning(f"시작 워밍업 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            self._set_ready()
+
+    def _set_ready(self):
+        self.mark('ready')
+        self._ready.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def stats(self) -> Dict:
+        return {
+            'process_started_at': datetime.fromtimestamp(self.process_started_at).isoformat(),
+            'ready': self._ready.is_set(),
+            'time_to_ready_s': self.phases.get('ready'),
+            'phases': dict(self.phases),
+            'warmup': {
+                'enabled': bool(self.app and self.app.config['WARMUP_ENABLED']),
+                'steps': dict(self.warmup_steps),
+                'error': self.warmup_error,
+            },
+        }
+
+
+startup = StartupTracker()
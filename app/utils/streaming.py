@@ -0,0 +1,42 @@
+import json
+from typing import Iterable, Mapping, Optional
+from flask import Response, current_app, request, stream_with_context
+
+
+def wants_stream(data: dict, args: Optional[Mapping] = None) -> bool:
+    # body의 "stream": true 또는 ?stream=1 로 스트리밍 모드를 선택 (args가 없으면 현재 Flask 요청의 쿼리 문자열)
+    if data and data.get('stream') is True:
+        return True
+    if args is None:
+        args = request.args
+    return (args.get('stream') or '').lower() in ('1', 'true', 'yes')
+
+
+def sse_event(payload: dict, event: str = None) -> str:
+    lines = []
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(payload, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def sse_response(tokens: Iterable[str]) -> Response:
+    def generate():
+        try:
+            for token in tokens:
+                yield sse_event({'token': token})
+        except Exception as e:
+            current_app.logger.error(f"스트리밍 응답 생성 중 오류가 발생했습니다: {str(e)}")
+            yield sse_event({'success': False, 'message': '응답 생성 중 오류가 발생했습니다.'}, event='error')
+            return
+
+        yield sse_event({'success': True}, event='done')
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'  # 프록시 버퍼링 방지 (첫 바이트 지연 최소화)
+        }
+    )
@@ -0,0 +1,166 @@
+import atexit
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import func, insert
+from app.extensions import db
+from app.models import LLMUsageRecord
+from app.utils.concurrency import run_in_app_context
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력) - 리포트의 비용 추정에만 사용
+MODEL_PRICES = {
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'text-embedding-3-small': (0.02, 0.0),
+    'text-embedding-3-large': (0.13, 0.0),
+}
+REPORT_GROUPS = ('day', 'user', 'endpoint', 'job')
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+    # 스냅샷 모델명(gpt-4o-mini-2024-07-18 등)은 가장 긴 접두어로 찾는다
+    matches = [name for name in MODEL_PRICES if model.startswith(name)]
+    if not matches:
+        return None
+    prompt_price, completion_price = MODEL_PRICES[max(matches, key=len)]
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+class UsageLedger:
+    # LLM/임베딩 호출마다 토큰 수와 지연 시간을 llm_usage 테이블에 남긴다.
+    # 요청 경로에서는 메모리 버퍼에 넣기만 하고, 백그라운드 스레드가 USAGE_LEDGER_FLUSH_INTERVAL마다
+    # (또는 USAGE_LEDGER_BATCH_SIZE만큼 쌓이면) 한 번의 INSERT로 기록하므로 요청에 DB 왕복이 늘지 않는다.
+
+    def __init__(self):
+        self.app = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._buffer = deque()
+        self._thread = None
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['usage_ledger'] = self
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='usage-ledger', daemon=True)
+            self._thread.start()
+            # 종료 시 남은 기록을 비운다
+            atexit.register(self.flush)
+
+    def record(self, endpoint: str, model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int],
+               latency: Optional[float] = None, user_id: Optional[int] = None, job: Optional[str] = None):
+        if self.app is None or not self.app.config['USAGE_LEDGER_ENABLED']:
+            return
+
+        row = {
+            'user_id': user_id,
+            'endpoint': endpoint,
+            'job': job,
+            'model': model,
+            'prompt_tokens': prompt_tokens or 0,
+            'completion_tokens': completion_tokens or 0,
+            'latency_ms': round(latency * 1000) if latency is not None else None,
+            'created_at': datetime.utcnow(),
+        }
+        with self._lock:
+            self._start()
+            if len(self._buffer) >= self.app.config['USAGE_LEDGER_MAX_PENDING']:
+                self.dropped += 1
+                return
+            self._buffer.append(row)
+            self.recorded += 1
+            if len(self._buffer) >= self.app.config['USAGE_LEDGER_BATCH_SIZE']:
+                self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.app.config['USAGE_LEDGER_FLUSH_INTERVAL'])
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        batch_size = self.app.config['USAGE_LEDGER_BATCH_SIZE'] if self.app else 0
+        written = 0
+        while True:
+            with self._lock:
+                rows = [self._buffer.popleft() for _ in range(min(batch_size, len(self._buffer)))]
+            if not rows:
+                return written
+            try:
+                run_in_app_context(self.app, self._write, rows)
+                written += len(rows)
+            except Exception as e:
+                # 사용량 기록 실패가 서비스에 영향을 주지 않도록 버린다
+                with self._lock:
+                    self.failed += len(rows)
+                self.app.logger.error(f"토큰 사용량 기록 실패 ({len(rows)}건): {str(e)}")
+                return written
+
+    def _write(self, rows: List[Dict]):
+        try:
+            db.session.execute(insert(LLMUsageRecord), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        with self._lock:
+            self.written += len(rows)
+
+    def report(self, since: datetime, until: datetime, group_by=REPORT_GROUPS,
+               user_id: Optional[int] = None) -> List[Dict]:
+        # 기간 내 사용량을 (일, 사용자, 엔드포인트, 작업) 중 고른 기준과 모델별로 집계 (작업이 없으면 API 요청)
+        columns = {
+            'day': func.date(LLMUsageRecord.created_at).label('day'),
+            'user': LLMUsageRecord.user_id.label('user'),
+            'endpoint': LLMUsageRecord.endpoint.label('endpoint'),
+            'job': LLMUsageRecord.job.label('job'),
+        }
+        keys = [columns[name] for name in group_by]
+        query = db.session.query(
+            *keys,
+            LLMUsageRecord.model,
+            func.count(LLMUsageRecord.id).label('calls'),
+            func.sum(LLMUsageRecord.prompt_tokens).label('prompt_tokens'),
+            func.sum(LLMUsageRecord.completion_tokens).label('completion_tokens'),
+            func.avg(LLMUsageRecord.latency_ms).label('avg_latency_ms')
+        ).filter(
+            LLMUsageRecord.created_at >= since,
+            LLMUsageRecord.created_at < until
+        )
+        if user_id is not None:
+            query = query.filter(LLMUsageRecord.user_id == user_id)
+        rows = query.group_by(*keys, LLMUsageRecord.model).order_by(*keys, LLMUsageRecord.model).all()
+
+        report = []
+        for row in rows:
+            entry = {name: getattr(row, name) for name in group_by}
+            entry.update({
+                'model': row.model,
+                'calls': row.calls,
+                'prompt_tokens': int(row.prompt_tokens or 0),
+                'completion_tokens': int(row.completion_tokens or 0),
+                'avg_latency_ms': round(float(row.avg_latency_ms)) if row.avg_latency_ms is not None else None,
+            })
+            entry['cost_usd'] = estimate_cost(row.model, entry['prompt_tokens'], entry['completion_tokens'])
+            report.append(entry)
+        return report
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'recorded': self.recorded,
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'pending': len(self._buffer),
+            }
+
+
+usage_ledger = UsageLedger()
@@ -0,0 +1,110 @@
+from datetime import datetime
+from typing import Mapping, NamedTuple, Optional, Tuple
+from app.utils.streaming import wants_stream
+
+# 요청 검증. Flask 라우트(app/routes)와 ASGI 핸들러(app/asgi.py)가 같이 쓴다.
+# 각 함수는 (요청 값, None) 또는 (None, 400으로 돌려줄 오류 메시지)를 반환한다.
+# args는 쿼리 문자열 (?stream=1), 없으면 현재 Flask 요청의 request.args
+
+# users_user.id는 integer - advisory lock 키(pg_advisory_xact_lock(int, int))로도 쓰인다
+MAX_USER_ID = 2 ** 31 - 1
+
+
+class ChatRequest(NamedTuple):
+    user_id: int
+    question: str
+    stream: bool
+
+
+class FeedbackRequest(NamedTuple):
+    user_id: int
+    select_date: datetime.date
+    force_refresh: bool
+    stream: bool
+
+
+class RecommendRequest(NamedTuple):
+    user_id: int
+    force_refresh: bool
+    stream: bool
+
+
+class IngestEvent(NamedTuple):
+    user_id: int
+    select_date: datetime.date
+
+
+def parse_date(date_str) -> Tuple[Optional[datetime.date], Optional[str]]:
+    # YYYY-MM-DD 형식, 없으면 오늘
+    try:
+        if date_str is None:
+            return datetime.now().date(), None
+        return datetime.strptime(date_str, '%Y-%m-%d').date(), None
+    except (TypeError, ValueError):
+        return None, '올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)'
+
+
+def parse_chat_request(data, args: Optional[Mapping] = None) -> Tuple[Optional[ChatRequest], Optional[str]]:
+    if not isinstance(data, dict):
+        return None, '잘못된 요청 형식입니다.'
+
+    user_id = data.get('user_id')
+    question = data.get('question')
+
+    if not user_id:
+        return None, '사용자 ID가 필요합니다.'
+
+    if not question:
+        return None, '질문을 입력해주세요.'
+
+    return ChatRequest(user_id, question, wants_stream(data, args)), None
+
+
+def parse_feedback_request(data, args: Optional[Mapping] = None) -> Tuple[Optional[FeedbackRequest], Optional[str]]:
+    if not isinstance(data, dict):
+        return None, '잘못된 요청 형식입니다.'
+
+    user_id = data.get('user_id')
+    date_str = data.get('select_date')  # YYYY-MM-DD 형식
+
+    if not user_id:
+        return None, '사용자 ID가 필요합니다.'
+
+    select_date, error = parse_date(date_str)
+    if error:
+        return None, error
+
+    force_refresh = data.get('refresh') is True  # 캐시된 응답 대신 새로 생성
+
+    return FeedbackRequest(user_id, select_date, force_refresh, wants_stream(data, args)), None
+
+
+def parse_recommend_request(data, args: Optional[Mapping] = None) -> Tuple[Optional[RecommendRequest], Optional[str]]:
+    if not isinstance(data, dict):
+        return None, '잘못된 요청 형식입니다.'
+
+    user_id = data.get('user_id')
+
+    if not user_id:
+        return None, '사용자 ID가 필요합니다.'
+
+    force_refresh = data.get('refresh') is True  # 캐시된 응답 대신 새로 생성
+
+    return RecommendRequest(user_id, force_refresh, wants_stream(data, args)), None
+
+
+def parse_ingest_event(event) -> Tuple[Optional[IngestEvent], Optional[str]]:
+    # {"user_id": 1, "created_date": "YYYY-MM-DD"} - created_date는 항목이 작성된 날, 이전 이름 select_date도 받는다
+    user_id = event.get('user_id') if isinstance(event, dict) else None
+
+    if not user_id:
+        return None, '사용자 ID가 필요합니다.'
+
+    if isinstance(user_id, bool) or not isinstance(user_id, int) or not 0 < user_id <= MAX_USER_ID:
+        return None, '사용자 ID는 양의 정수여야 합니다.'
+
+    select_date, error = parse_date(event.get('created_date', event.get('select_date')))
+    if error:
+        return None, error
+
+    return IngestEvent(user_id, select_date), None
@@ -0,0 +1,155 @@
+"""동기(LLMService + 워커 스레드)와 비동기(AsyncLLMService, ASGI 경로)의 /chatbot/ 처리량을 같은 동시성에서 비교.
+
+benchmarks.offline과 같은 방식으로 벤치마크 전용 Postgres에 사용자와 이력을 만들고, OpenAI 대신
+benchmarks.mock_openai 서버를 띄워 실제 ChatOpenAI/httpx 커넥션 풀을 거치게 한다.
+--concurrency의 각 값마다 같은 요청 순서로 두 경로를 실행한다.
+
+- sync: 워커 스레드 N개(flask run / gunicorn 스레드 워커)가 LLMService.get_chat_response를 호출
+- async: 이벤트 루프 하나에서 AsyncLLMService.get_chat_response를 동시에 N개까지 호출
+  (DB 작업은 ASGI lifespan과 같이 ASYNC_DB_WORKERS개 스레드에서)
+
+    python -m benchmarks.async_chat --database-url postgresql://bench@localhost/maiddy_bench \\
+        --requests 500 --concurrency 8,32,128 --chat-latency fixed:1.0
+"""
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default=os.environ.get('BENCH_DATABASE_URL'),
+                        help='벤치마크 전용 Postgres (pgvector). 기본값은 BENCH_DATABASE_URL')
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--days', type=int, default=30, help='사용자별 이력 일수')
+    parser.add_argument('--no-seed', dest='seed_data', action='store_false', help='이전에 만든 데이터를 그대로 사용')
+    parser.add_argument('--requests', type=int, default=500, help='동시성 단계별, 경로별 요청 수')
+    parser.add_argument('--concurrency', default='8,32,128', help='두 경로에 똑같이 적용할 동시 요청 수 (쉼표로 구분)')
+    parser.add_argument('--intent-ratio', type=float, default=0.0, help='일정/할일 변경 요청 비율')
+    parser.add_argument('--chat-latency', default='fixed:1.0', help='mock OpenAI 채팅 응답 지연 분포')
+    parser.add_argument('--embedding-latency', default='fixed:0.1', help='mock OpenAI 임베딩 응답 지연 분포')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장할 경로')
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error('--database-url 또는 BENCH_DATABASE_URL이 필요합니다 (운영 DB를 쓰지 마세요)')
+    args.concurrency = [int(level) for level in args.concurrency.split(',') if level.strip()]
+    if not args.concurrency or any(level < 1 for level in args.concurrency):
+        parser.error('--concurrency에는 1 이상의 값을 적어주세요')
+    return args
+
+
+def run_sync(app, payloads, requests: int, concurrency: int):
+    from app.utils.concurrency import run_in_app_context
+    from app.utils.llm_service import LLMService
+    from benchmarks.offline.scenarios import RssSampler, ScenarioResult
+
+    service = LLMService()
+    errors = []
+
+    def call(index: int):
+        payload = payloads(index)
+        started_at = time.perf_counter()
+        success, _ = run_in_app_context(app, service.get_chat_response, payload['user_id'], payload['question'])
+        if not success:
+            errors.append(index)
+            return None
+        return time.perf_counter() - started_at
+
+    with RssSampler() as rss:
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='bench-sync') as executor:
+            latencies = [latency for latency in executor.map(call, range(requests)) if latency is not None]
+        elapsed = time.perf_counter() - started_at
+    return ScenarioResult(f'sync@{concurrency}', latencies, len(errors), elapsed, rss.peak_mb)
+
+
+async def run_async(app, payloads, requests: int, levels):
+    # 비동기 httpx 풀은 만든 이벤트 루프에 묶이므로 모든 단계를 한 루프에서 실행한다
+    from app.utils.async_llm_service import AsyncLLMService
+    from app.utils.clients import clients
+    from benchmarks.offline.scenarios import RssSampler, ScenarioResult
+
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=app.config['ASYNC_DB_WORKERS'], thread_name_prefix='async-db')
+    )
+    service = AsyncLLMService(app)
+    results = []
+
+    for concurrency in levels:
+        semaphore = asyncio.Semaphore(concurrency)
+        errors = []
+
+        async def call(index: int):
+            payload = payloads(index)
+            async with semaphore:
+                started_at = time.perf_counter()
+                success, _ = await service.get_chat_response(payload['user_id'], payload['question'])
+                if not success:
+                    errors.append(index)
+                    return None
+                return time.perf_counter() - started_at
+
+        with RssSampler() as rss:
+            started_at = time.perf_counter()
+            latencies = [latency for latency in await asyncio.gather(*(call(index) for index in range(requests)))
+                         if latency is not None]
+            elapsed = time.perf_counter() - started_at
+        results.append(ScenarioResult(f'async@{concurrency}', latencies, len(errors), elapsed, rss.peak_mb))
+
+    await clients.aclose()
+    return results
+
+
+def main():
+    args = parse_args()
+
+    from benchmarks.mock_openai import MockOpenAIServer
+    from benchmarks.offline.fakes import LatencyModel
+
+    server = MockOpenAIServer(
+        chat_latency=LatencyModel.parse(args.chat_latency),
+        embedding_latency=LatencyModel.parse(args.embedding_latency),
+        seed=args.seed
+    ).start()
+
+    # config.py가 import 시점에 환경 변수를 읽으므로 앱을 불러오기 전에 설정
+    os.environ['DATABASE_URL'] = args.database_url
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-offline-bench')
+    os.environ['OPENAI_BASE_URL'] = server.base_url
+    os.environ['SCHEDULER_ENABLED'] = 'False'
+    # 커넥션 풀 크기가 어느 한쪽의 병목이 되지 않도록 가장 높은 동시성에 맞춘다
+    os.environ['OPENAI_HTTP_MAX_CONNECTIONS'] = str(max(args.concurrency))
+    os.environ['OPENAI_HTTP_MAX_KEEPALIVE'] = str(max(args.concurrency))
+
+    from app import create_app
+    from benchmarks.offline import datagen, scenarios
+
+    app = create_app()
+    with app.app_context():
+        datagen.create_schema()
+        if args.seed_data:
+            user_ids = datagen.seed(args.users, args.days, args.seed)
+            print(f"사용자 {len(user_ids)}명, {args.days}일 이력 생성")
+        else:
+            user_ids = datagen.bench_user_ids()
+    if not user_ids:
+        raise SystemExit('벤치마크 사용자가 없습니다 (--no-seed 없이 다시 실행하세요)')
+
+    print(f"chat={args.chat_latency} embedding={args.embedding_latency} requests={args.requests} "
+          f"concurrency={','.join(str(level) for level in args.concurrency)} "
+          f"async DB workers={app.config['ASYNC_DB_WORKERS']}")
+    payloads = scenarios.chatbot_payloads(user_ids, args.intent_ratio, False, args.seed)
+
+    sync_results = [run_sync(app, payloads, args.requests, level) for level in args.concurrency]
+    async_results = asyncio.run(run_async(app, payloads, args.requests, args.concurrency))
+
+    results = [result for pair in zip(sync_results, async_results) for result in pair]
+    scenarios.print_report(results, args.json_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,14 @@
+"""실행 중인 서비스에 HTTP 부하를 거는 부하 테스트 (/chatbot/, /feedback/, /recommend/).
+
+- runner: 요청 구성(엔드포인트 비율, 잡담/일정 변경 질문 비율, 스트리밍 비율)과 부하 모델
+    closed  가상 사용자 N명이 응답을 받고(생각 시간 후) 다음 요청을 보낸다. 단계마다 N을 늘린다
+    open    응답과 상관없이 초당 R건(포아송 도착)을 보낸다. 단계마다 R을 늘린다
+- report: 단계별 p50/p95/p99, 첫 바이트 시간, 오류율, 처리량과 포화 지점, SLO/기준 결과 비교
+
+    python -m benchmarks.mock_openai --port 8089 &
+    OPENAI_BASE_URL=http://127.0.0.1:8089/v1 flask run --port 5001 &
+    python -m benchmarks.loadtest --base-url http://127.0.0.1:5001 --mode closed --stages 4,8,16,32 \\
+        --stage-duration 30 --slo benchmarks/loadtest/slo.json
+
+SLO를 지키지 못하거나 기준 결과(--baseline)보다 느려지면 종료 코드 1로 끝난다.
+"""
@@ -0,0 +1,95 @@
+import argparse
+import asyncio
+import json
+import sys
+from benchmarks.loadtest import __doc__ as DESCRIPTION
+from benchmarks.loadtest import report
+from benchmarks.loadtest.runner import Runner, Workload, parse_mix, parse_user_ids
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://127.0.0.1:5001', help='부하를 걸 서비스 주소')
+    parser.add_argument('--mode', choices=('closed', 'open'), default='closed',
+                        help='closed: 동시 사용자 수 고정, open: 초당 도착 수 고정')
+    parser.add_argument('--stages', default='1,2,4,8,16,32',
+                        help='단계별 부하 (closed는 동시 사용자 수, open은 초당 요청 수)')
+    parser.add_argument('--stage-duration', type=float, default=30.0, help='단계별 실행 시간(초)')
+    parser.add_argument('--warmup', type=float, default=5.0, help='단계마다 집계에서 뺄 처음 몇 초')
+    parser.add_argument('--think-time', type=float, default=0.0, help='closed 모드에서 요청 사이 평균 생각 시간(초)')
+    parser.add_argument('--mix', default='chatbot=0.6,feedback=0.2,recommend=0.2', help='엔드포인트 비율')
+    parser.add_argument('--intent-ratio', type=float, default=0.3, help='챗봇 요청 중 일정/할일 변경 요청 비율')
+    parser.add_argument('--stream-ratio', type=float, default=0.5, help='스트리밍으로 보낼 요청 비율')
+    parser.add_argument('--refresh', action='store_true', help='/feedback, /recommend 응답 캐시를 쓰지 않음')
+    parser.add_argument('--user-ids', default='1-50', help='요청에 쓸 사용자 id (예: 1-50 또는 3,7,9)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='요청 타임아웃(초)')
+    parser.add_argument('--max-connections', type=int, default=1000)
+    parser.add_argument('--slo', help='SLO 파일 (JSON)')
+    parser.add_argument('--baseline', help='비교할 이전 --json 결과')
+    parser.add_argument('--max-regression', type=float, default=0.15, help='기준 결과 대비 허용할 p95/처리량 악화 비율')
+    parser.add_argument('--knee', type=float, default=0.5,
+                        help='처리량 증가율이 부하 증가율의 이 비율 아래면 포화로 본다')
+    parser.add_argument('--stop-on-saturation', action='store_true', help='SLO를 어긴 단계 다음은 실행하지 않음')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장할 경로')
+    args = parser.parse_args()
+
+    args.stages = [float(load) for load in args.stages.split(',') if load.strip()]
+    if not args.stages or any(load <= 0 for load in args.stages):
+        parser.error('--stages에는 0보다 큰 부하를 적어주세요')
+    if args.warmup >= args.stage_duration:
+        parser.error('--warmup은 --stage-duration보다 짧아야 합니다')
+    args.user_ids = parse_user_ids(args.user_ids)
+    if not args.user_ids:
+        parser.error('--user-ids가 비어 있습니다')
+    return args
+
+
+def _load_json(path):
+    if not path:
+        return {}
+    with open(path) as source:
+        return json.load(source)
+
+
+def main():
+    args = parse_args()
+    slo = _load_json(args.slo)
+    baseline = _load_json(args.baseline)
+    workload = Workload(args.user_ids, parse_mix(args.mix), args.intent_ratio, args.stream_ratio,
+                        args.refresh, args.seed)
+    runner = Runner(args.base_url, workload, args.timeout, args.max_connections, args.think_time, args.seed)
+
+    print(f"{args.base_url} mode={args.mode} stages={','.join(f'{load:g}' for load in args.stages)} "
+          f"duration={args.stage_duration:g}s mix={args.mix} stream={args.stream_ratio}")
+    report.print_header(args.mode)
+    summaries = []
+
+    async def run():
+        async with runner:
+            for stage, load in enumerate(args.stages):
+                records, elapsed = await runner.run_stage(args.mode, stage, load, args.stage_duration)
+                summary = report.summarize_stage(stage, load, records, elapsed, args.warmup)
+                summary['violations'] = report.slo_violations(summary, slo)
+                summaries.append(summary)
+                report.print_stage(summary)
+                if args.stop_on_saturation and summary['violations']:
+                    break
+
+    asyncio.run(run())
+    result = {
+        'mode': args.mode,
+        'base_url': args.base_url,
+        'mix': parse_mix(args.mix),
+        'stream_ratio': args.stream_ratio,
+        'stage_duration_s': args.stage_duration,
+        'stages': summaries,
+        'saturation': report.find_saturation(summaries, args.knee),
+        'gate': report.evaluate(args.mode, summaries, slo, baseline, args.max_regression),
+    }
+    report.print_report(result, args.json_path)
+    sys.exit(0 if result['gate']['passed'] else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""단계별 지표, 포화 지점, SLO/기준 결과 비교.
+
+SLO 파일(JSON) 형식 (benchmarks/loadtest/slo.json 참고):
+
+    error_rate      단계별 허용 오류율 (HTTP 200이 아니거나 event: error로 끝난 응답, 연결 실패/타임아웃)
+    latency_ms      엔드포인트별 {"p50": ..., "p95": ..., "p99": ...} 상한, "all"은 전체 요청
+    ttfb_ms         스트리밍 응답의 첫 바이트 시간 {"p95": ...} 상한
+    min_load        {"closed": 동시 사용자 수, "open": 초당 요청 수}. 이 부하까지의 단계는 모두 SLO를
+                    지켜야 한다 (없으면 모든 단계). 그보다 높은 단계의 위반은 포화 지점을 정할 때만 쓴다
+
+포화 지점은 SLO를 처음 어긴 단계와, 처리량 증가율이 부하 증가율의 knee 비율 아래로 떨어진
+단계(더 보내도 더 처리하지 못하는 지점) 중 먼저 오는 곳이다.
+"""
+import json
+from typing import Dict, List, Optional, Sequence
+from benchmarks.loadtest.runner import ENDPOINTS, Record
+
+PERCENTILES = {'p50': 0.50, 'p95': 0.95, 'p99': 0.99}
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return round(value * 1000, 1) if value is not None else None
+
+
+def _latencies(records: Sequence[Record]) -> Dict:
+    latencies = [record.latency for record in records if record.ok]
+    return {name: _ms(percentile(latencies, q)) for name, q in PERCENTILES.items()}
+
+
+def summarize_stage(stage: int, load: float, records: Sequence[Record], elapsed: float, warmup: float = 0.0) -> Dict:
+    # 단계 시작 후 warmup초 안에 보낸 요청은 빼고 정상 상태만 집계한다
+    steady = [record for record in records if record.started >= warmup]
+    window = max(elapsed - warmup, 1e-9)
+    ok = [record for record in steady if record.ok]
+    errors: Dict[str, int] = {}
+    for record in steady:
+        if not record.ok:
+            errors[record.status] = errors.get(record.status, 0) + 1
+    ttfb = [record.ttfb for record in ok if record.ttfb is not None]  # 스트리밍 요청만 ttfb가 있다
+    return {
+        'stage': stage,
+        'load': load,
+        'count': len(steady),
+        'errors': sum(errors.values()),
+        'error_rate': round(sum(errors.values()) / len(steady), 4) if steady else 0.0,
+        'error_statuses': errors,
+        'throughput_per_s': round(len(ok) / window, 2),
+        'latency_ms': dict(
+            {'all': _latencies(steady)},
+            **{name: _latencies([record for record in steady if record.endpoint == name])
+               for name in ENDPOINTS if any(record.endpoint == name for record in steady)}
+        ),
+        'ttfb_ms': {name: _ms(percentile(ttfb, q)) for name, q in PERCENTILES.items()},
+    }
+
+
+def slo_violations(summary: Dict, slo: Dict) -> List[str]:
+    violations = []
+    if 'error_rate' in slo and summary['error_rate'] > slo['error_rate']:
+        violations.append(f"오류율 {summary['error_rate']:.2%} > {slo['error_rate']:.2%}")
+    for endpoint, limits in (slo.get('latency_ms') or {}).items():
+        observed = summary['latency_ms'].get(endpoint) or {}
+        for name, limit in limits.items():
+            if observed.get(name) is not None and observed[name] > limit:
+                violations.append(f"{endpoint} {name} {observed[name]:.0f}ms > {limit}ms")
+    for name, limit in (slo.get('ttfb_ms') or {}).items():
+        observed = summary['ttfb_ms'].get(name)
+        if observed is not None and observed > limit:
+            violations.append(f"ttfb {name} {observed:.0f}ms > {limit}ms")
+    return violations
+
+
+def find_saturation(summaries: Sequence[Dict], knee: float = 0.5) -> Dict:
+    # max_load: 그 단계까지 모두 SLO를 지킨 가장 높은 부하, knee_load: 처리량이 부하를 따라가지 못한 첫 단계
+    max_load, knee_load, first_violation = None, None, None
+    for index, summary in enumerate(summaries):
+        if summary['violations']:
+            first_violation = summary['load'] if first_violation is None else first_violation
+        elif first_violation is None:
+            max_load = summary['load']
+        if index and knee_load is None:
+            previous = summaries[index - 1]
+            load_growth = summary['load'] / previous['load'] - 1 if previous['load'] else 0
+            throughput_growth = (summary['throughput_per_s'] / previous['throughput_per_s'] - 1
+                                 if previous['throughput_per_s'] else 0)
+            if load_growth > 0 and throughput_growth < load_growth * knee:
+                knee_load = summary['load']
+    candidates = [load for load in (first_violation, knee_load) if load is not None]
+    return {
+        'max_load_within_slo': max_load,
+        'first_slo_violation': first_violation,
+        'throughput_knee': knee_load,
+        'saturation_load': min(candidates) if candidates else None,
+        'peak_throughput_per_s': max((summary['throughput_per_s'] for summary in summaries), default=0.0),
+    }
+
+
+def compare_baseline(summaries: Sequence[Dict], baseline: Dict, max_regression: float) -> List[str]:
+    # 같은 부하 단계끼리 p95와 처리량을 비교한다
+    regressions = []
+    previous = {stage['load']: stage for stage in baseline.get('stages', [])}
+    for summary in summaries:
+        before = previous.get(summary['load'])
+        if not before:
+            continue
+        for endpoint, observed in summary['latency_ms'].items():
+            old, new = (before['latency_ms'].get(endpoint) or {}).get('p95'), observed.get('p95')
+            if old and new and new > old * (1 + max_regression):
+                regressions.append(f"부하 {summary['load']:g}: {endpoint} p95 {old:.0f}ms -> {new:.0f}ms")
+        old, new = before.get('throughput_per_s'), summary['throughput_per_s']
+        if old and new < old * (1 - max_regression):
+            regressions.append(f"부하 {summary['load']:g}: 처리량 {old:.2f}/s -> {new:.2f}/s")
+    return regressions
+
+
+def evaluate(mode: str, summaries: Sequence[Dict], slo: Dict, baseline: Optional[Dict] = None,
+             max_regression: float = 0.15) -> Dict:
+    # 회귀 게이트: min_load까지의 SLO 위반, 목표 부하 미달, 기준 결과 대비 악화를 실패로 본다
+    min_load = (slo.get('min_load') or {}).get(mode)
+    failures = []
+    for summary in summaries:
+        if summary['violations'] and (min_load is None or summary['load'] <= min_load):
+            failures += [f"부하 {summary['load']:g}: {violation}" for violation in summary['violations']]
+    if min_load is not None and summaries and summaries[-1]['load'] < min_load:
+        failures.append(f"가장 높은 단계({summaries[-1]['load']:g})가 목표 부하 {min_load:g}보다 낮습니다")
+    if baseline:
+        failures += compare_baseline(summaries, baseline, max_regression)
+    return {'passed': not failures, 'failures': failures}
+
+
+def print_stage(summary: Dict):
+    latency = summary['latency_ms']['all']
+    print(f"{summary['stage']:>5} {summary['load']:>7g} {summary['count']:>6} {summary['error_rate']:>7.2%} "
+          f"{summary['throughput_per_s']:>8.2f} {latency['p50'] or 0:>9.1f} {latency['p95'] or 0:>9.1f} "
+          f"{latency['p99'] or 0:>9.1f} {summary['ttfb_ms']['p95'] or 0:>9.1f}  "
+          f"{'; '.join(summary['violations']) or 'ok'}")
+
+
+def print_header(mode: str):
+    load = 'users' if mode == 'closed' else 'req/s'
+    print(f"{'stage':>5} {load:>7} {'count':>6} {'errors':>7} {'thru/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'ttfb p95':>9}  slo")
+
+
+def print_report(result: Dict, json_path: Optional[str] = None):
+    for summary in result['stages']:
+        endpoints = {name: values['p95'] for name, values in summary['latency_ms'].items() if name != 'all'}
+        if len(endpoints) > 1:
+            print(f"      stage {summary['stage']} p95: " +
+                  ', '.join(f"{name}={value or 0:.0f}ms" for name, value in endpoints.items()))
+    saturation = result['saturation']
+    print(f"SLO 내 최대 부하: {saturation['max_load_within_slo']}, 첫 SLO 위반: {saturation['first_slo_violation']}, "
+          f"처리량 꺾임: {saturation['throughput_knee']}, 최대 처리량: {saturation['peak_throughput_per_s']}/s")
+    gate = result['gate']
+    print('게이트: 통과' if gate['passed'] else '게이트: 실패')
+    for failure in gate['failures']:
+        print(f"  - {failure}")
+    if json_path:
+        with open(json_path, 'w') as output:
+            json.dump(result, output, ensure_ascii=False, indent=2)
@@ -0,0 +1,165 @@
+"""부하 모델과 요청 구성.
+
+요청 순서(엔드포인트, 사용자, 질문, 스트리밍 여부)와 open 모드의 도착 간격은 --seed로 고정되므로
+같은 설정의 두 실행은 같은 요청을 같은 순서로 보낸다.
+"""
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import httpx
+from benchmarks.questions import INTENT_QUESTIONS, SMALL_TALK
+
+ENDPOINTS = {'chatbot': '/chatbot/', 'feedback': '/feedback/', 'recommend': '/recommend/'}
+
+
+class Record(NamedTuple):
+    stage: int
+    endpoint: str
+    started: float  # 단계 시작 기준(초)
+    latency: float
+    ttfb: Optional[float]  # 스트리밍 요청의 첫 바이트(첫 토큰)까지, 일반 요청은 None
+    status: str  # HTTP 상태 코드 또는 예외 이름
+    ok: bool
+
+
+class Workload:
+    def __init__(self, user_ids: Sequence[int], mix: Dict[str, float], intent_ratio: float = 0.3,
+                 stream_ratio: float = 0.0, refresh: bool = False, seed: int = 0):
+        unknown = [name for name in mix if name not in ENDPOINTS]
+        if unknown:
+            raise ValueError(f"알 수 없는 엔드포인트: {', '.join(unknown)}")
+        self.user_ids = list(user_ids)
+        self.endpoints = [name for name, weight in mix.items() if weight > 0]
+        self.weights = [mix[name] for name in self.endpoints]
+        self.intent_ratio = intent_ratio
+        self.stream_ratio = stream_ratio
+        self.refresh = refresh
+        self.seed = seed
+        self.yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
+
+    def request(self, index: int) -> Tuple[str, Dict]:
+        # index번째 요청 -> (엔드포인트 이름, JSON 본문)
+        rng = random.Random(self.seed * 1_000_003 + index)
+        endpoint = rng.choices(self.endpoints, self.weights)[0]
+        payload = {'user_id': rng.choice(self.user_ids), 'stream': rng.random() < self.stream_ratio}
+        if endpoint == 'chatbot':
+            payload['question'] = rng.choice(INTENT_QUESTIONS if rng.random() < self.intent_ratio else SMALL_TALK)
+        elif endpoint == 'feedback':
+            payload.update(select_date=self.yesterday, refresh=self.refresh)
+        else:
+            payload['refresh'] = self.refresh
+        return endpoint, payload
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    # "chatbot=0.6,feedback=0.2,recommend=0.2"
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip():
+            mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def parse_user_ids(spec: str) -> List[int]:
+    # "1-50" 또는 "3,7,9"
+    user_ids = []
+    for part in spec.split(','):
+        first, _, last = part.strip().partition('-')
+        if first:
+            user_ids.extend(range(int(first), int(last or first) + 1))
+    return user_ids
+
+
+class Runner:
+    def __init__(self, base_url: str, workload: Workload, timeout: float = 60.0, max_connections: int = 1000,
+                 think_time: float = 0.0, seed: int = 0):
+        self.base_url = base_url.rstrip('/')
+        self.workload = workload
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.think_time = think_time
+        self.seed = seed
+        self.records: List[Record] = []
+        self._index = 0
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _next_request(self) -> Tuple[str, Dict]:
+        self._index += 1
+        return self.workload.request(self._index)
+
+    async def _send(self, stage: int, stage_started: float):
+        loop = asyncio.get_running_loop()
+        endpoint, payload = self._next_request()
+        started = loop.time()
+        ttfb = None
+        try:
+            async with self._client.stream('POST', ENDPOINTS[endpoint], json=payload) as response:
+                body = b''
+                async for chunk in response.aiter_bytes():
+                    # 일반 JSON 응답의 첫 바이트는 전체 응답 시간과 같으므로 스트리밍 요청만 기록
+                    if ttfb is None and payload['stream']:
+                        ttfb = loop.time() - started
+                    body += chunk
+            status = str(response.status_code)
+            ok = response.status_code == 200 and self._succeeded(body, payload['stream'])
+        except httpx.HTTPError as error:
+            status, ok = type(error).__name__, False
+        self.records.append(Record(stage, endpoint, started - stage_started, loop.time() - started, ttfb, status, ok))
+
+    def _succeeded(self, body: bytes, stream: bool) -> bool:
+        # 스트리밍 응답은 200으로 시작한 뒤 event: error로 끝날 수 있다
+        if stream:
+            return b'event: error' not in body
+        try:
+            return json.loads(body).get('success', True) is not False
+        except ValueError:
+            return False
+
+    async def closed(self, stage: int, concurrency: int, duration: float):
+        # 가상 사용자 concurrency명이 duration초 동안 요청 -> 응답 -> 생각 시간을 반복
+        loop = asyncio.get_running_loop()
+        stage_started = loop.time()
+        deadline = stage_started + duration
+
+        async def user(number: int):
+            think = random.Random(self.seed * 7919 + stage * 1009 + number)
+            while loop.time() < deadline:
+                await self._send(stage, stage_started)
+                if self.think_time:
+                    await asyncio.sleep(think.expovariate(1 / self.think_time))
+
+        await asyncio.gather(*(user(number) for number in range(concurrency)))
+        return loop.time() - stage_started
+
+    async def open(self, stage: int, rate: float, duration: float):
+        # 초당 rate건의 포아송 도착. 응답이 늦어져도 도착 간격은 그대로라 대기열이 쌓이는 것을 볼 수 있다
+        loop = asyncio.get_running_loop()
+        arrivals = random.Random(self.seed * 7919 + stage)
+        stage_started = loop.time()
+        tasks = []
+        offset = arrivals.expovariate(rate)
+        while offset < duration:
+            await asyncio.sleep(max(stage_started + offset - loop.time(), 0))
+            tasks.append(asyncio.create_task(self._send(stage, stage_started)))
+            offset += arrivals.expovariate(rate)
+        await asyncio.gather(*tasks)
+        return loop.time() - stage_started
+
+    async def __aenter__(self) -> 'Runner':
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout, limits=limits)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._client.aclose()
+
+    async def run_stage(self, mode: str, stage: int, load: float, duration: float) -> Tuple[List[Record], float]:
+        # 한 단계를 실행하고 (그 단계의 요청 기록, 경과 시간)을 돌려준다
+        if mode == 'closed':
+            elapsed = await self.closed(stage, int(load), duration)
+        else:
+            elapsed = await self.open(stage, load, duration)
+        return [record for record in self.records if record.stage == stage], elapsed
@@ -0,0 +1,249 @@
+"""OpenAI 호환 목(mock) 서버: /v1/chat/completions(스트리밍 포함)와 /v1/embeddings.
+
+네트워크 없이 한 대의 리눅스 머신에서 서비스 전체(HTTP 클라이언트, 커넥션 풀, 재시도)를 부하 테스트할 때 쓴다.
+응답 내용과 지연은 benchmarks.offline.fakes와 같은 방식으로 프롬프트에서 결정되고,
+429/500 응답은 --seed로 고정된 순서에 따라 요청 비율만큼 섞인다.
+
+    python -m benchmarks.mock_openai --port 8089 --chat-latency lognormal:0.8,0.4 --rate-limit-ratio 0.02
+    # .env: OPENAI_BASE_URL=http://127.0.0.1:8089/v1
+
+GET /stats 로 받은 요청 수와 주입한 오류 수를 볼 수 있다.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import random
+import threading
+import time
+from typing import Dict, Optional
+import numpy as np
+from benchmarks.offline.fakes import LatencyModel, _digest, fake_reply, fake_vector
+from app.utils.context import count_tokens
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 429: 'Too Many Requests', 500: 'Internal Server Error'}
+
+
+class MockOpenAIServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, chat_latency: LatencyModel = None,
+                 embedding_latency: LatencyModel = None, token_delay: float = 0.0, rate_limit_ratio: float = 0.0,
+                 error_ratio: float = 0.0, retry_after: float = 0.5, seed: int = 0):
+        self.host = host
+        self.port = port
+        self.chat_latency = chat_latency or LatencyModel()
+        self.embedding_latency = embedding_latency or LatencyModel()
+        self.token_delay = token_delay
+        self.rate_limit_ratio = rate_limit_ratio
+        self.error_ratio = error_ratio
+        self.retry_after = retry_after
+        self.seed = seed
+        self._faults = random.Random(seed)
+        self._ready = threading.Event()
+        self._sequence = 0
+        self.counts: Dict[str, int] = {'chat': 0, 'chat_stream': 0, 'embeddings': 0, 'rate_limited': 0, 'errors': 0}
+
+    def start(self) -> 'MockOpenAIServer':
+        # 다른 프로그램 안에서 백그라운드 스레드로 띄울 때
+        threading.Thread(target=self.serve_forever, name='mock-openai', daemon=True).start()
+        self._ready.wait()
+        return self
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def serve_forever(self):
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port, backlog=4096))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+                await self._dispatch(writer, method, path.split('?', 1)[0], body)
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, writer, method: str, path: str, body: bytes):
+        if method == 'GET' and path == '/stats':
+            return await self._send_json(writer, 200, self.counts)
+        if method != 'POST' or path not in ('/v1/chat/completions', '/v1/embeddings'):
+            return await self._send_error(writer, 404, f"{method} {path} 은(는) 지원하지 않습니다", 'invalid_request_error')
+        try:
+            payload = json.loads(body or b'{}')
+        except ValueError:
+            return await self._send_error(writer, 400, '요청 본문이 JSON이 아닙니다', 'invalid_request_error')
+
+        fault = self._faults.random()
+        if fault < self.rate_limit_ratio:
+            self.counts['rate_limited'] += 1
+            return await self._send_error(
+                writer, 429, 'Rate limit reached (mock)', 'requests', code='rate_limit_exceeded',
+                headers={'retry-after-ms': str(int(self.retry_after * 1000)), 'retry-after': str(max(int(self.retry_after), 1))}
+            )
+        if fault < self.rate_limit_ratio + self.error_ratio:
+            self.counts['errors'] += 1
+            return await self._send_error(writer, 500, 'The server had an error (mock)', 'server_error')
+
+        if path == '/v1/embeddings':
+            return await self._embeddings(writer, payload)
+        return await self._chat(writer, payload)
+
+    async def _chat(self, writer, payload: Dict):
+        model = payload.get('model', 'gpt-4o-mini')
+        contents = [self._content(message.get('content')) for message in payload.get('messages', [])]
+        text, usage, delay = fake_reply(contents, model, self.chat_latency, seed=self.seed)
+        usage = {
+            'prompt_tokens': usage['input_tokens'],
+            'completion_tokens': usage['output_tokens'],
+            'total_tokens': usage['total_tokens'],
+        }
+        self._sequence += 1
+        completion_id = f"chatcmpl-mock-{self._sequence}"
+        created = int(time.time())
+        await asyncio.sleep(delay)
+
+        if not payload.get('stream'):
+            self.counts['chat'] += 1
+            return await self._send_json(writer, 200, {
+                'id': completion_id,
+                'object': 'chat.completion',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}],
+                'usage': usage,
+            })
+
+        self.counts['chat_stream'] += 1
+        writer.write(self._head(200, {'content-type': 'text/event-stream', 'transfer-encoding': 'chunked'}))
+
+        def chunk(delta: Dict, finish_reason: Optional[str] = None, **extra) -> Dict:
+            return dict({
+                'id': completion_id,
+                'object': 'chat.completion.chunk',
+                'created': created,
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+            }, **extra)
+
+        events = [chunk({'role': 'assistant', 'content': ''})]
+        events += [chunk({'content': token if index == 0 else ' ' + token}) for index, token in enumerate(text.split(' '))]
+        events.append(chunk({}, 'stop'))
+        if (payload.get('stream_options') or {}).get('include_usage'):
+            events.append({'id': completion_id, 'object': 'chat.completion.chunk', 'created': created,
+                           'model': model, 'choices': [], 'usage': usage})
+
+        for event in events:
+            self._write_chunk(writer, f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode('utf-8'))
+            await writer.drain()
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+        self._write_chunk(writer, b"data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _embeddings(self, writer, payload: Dict):
+        model = payload.get('model', 'text-embedding-3-small')
+        inputs = payload.get('input', [])
+        if isinstance(inputs, str) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        # OpenAIEmbeddings는 기본적으로 텍스트 대신 tiktoken 토큰 id 배열을 보낸다
+        texts = [item if isinstance(item, str) else json.dumps(item) for item in inputs]
+        tokens = sum(count_tokens(model, item) if isinstance(item, str) else len(item) for item in inputs)
+        await asyncio.sleep(self.embedding_latency.sample(random.Random(_digest(str(self.seed), *texts))))
+
+        base64_format = payload.get('encoding_format') == 'base64'
+        data = []
+        for index, text in enumerate(texts):
+            vector = fake_vector(text, self.seed, payload.get('dimensions') or 1536)
+            if base64_format:
+                vector = base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode('ascii')
+            data.append({'object': 'embedding', 'index': index, 'embedding': vector})
+
+        self.counts['embeddings'] += 1
+        await self._send_json(writer, 200, {
+            'object': 'list',
+            'data': data,
+            'model': model,
+            'usage': {'prompt_tokens': tokens, 'total_tokens': tokens},
+        })
+
+    def _content(self, content) -> str:
+        # content는 문자열 또는 [{"type": "text", "text": ...}] 형식
+        if isinstance(content, list):
+            return ''.join(part.get('text', '') for part in content if isinstance(part, dict))
+        return content or ''
+
+    def _head(self, status: int, headers: Dict[str, str]) -> bytes:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    def _write_chunk(self, writer, data: bytes):
+        writer.write(f"{len(data):x}\r\n".encode('latin-1') + data + b"\r\n")
+
+    async def _send_json(self, writer, status: int, body: Dict, headers: Dict[str, str] = None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        writer.write(self._head(status, dict({
+            'content-type': 'application/json',
+            'content-length': str(len(data)),
+        }, **(headers or {}))) + data)
+        await writer.drain()
+
+    async def _send_error(self, writer, status: int, message: str, error_type: str, code: str = None,
+                          headers: Dict[str, str] = None):
+        await self._send_json(writer, status, {
+            'error': {'message': message, 'type': error_type, 'param': None, 'code': code}
+        }, headers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8089)
+    parser.add_argument('--chat-latency', default='lognormal:0.8,0.4', help='채팅 응답(첫 토큰까지) 지연 분포')
+    parser.add_argument('--token-delay', type=float, default=0.0, help='스트리밍 청크 사이 지연(초)')
+    parser.add_argument('--embedding-latency', default='lognormal:0.15,0.3', help='임베딩 응답 지연 분포')
+    parser.add_argument('--rate-limit-ratio', type=float, default=0.0, help='429로 응답할 요청 비율')
+    parser.add_argument('--error-ratio', type=float, default=0.0, help='500으로 응답할 요청 비율')
+    parser.add_argument('--retry-after', type=float, default=0.5, help='429 응답의 retry-after(초)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    server = MockOpenAIServer(
+        host=args.host,
+        port=args.port,
+        chat_latency=LatencyModel.parse(args.chat_latency),
+        embedding_latency=LatencyModel.parse(args.embedding_latency),
+        token_delay=args.token_delay,
+        rate_limit_ratio=args.rate_limit_ratio,
+        error_ratio=args.error_ratio,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    print(f"mock OpenAI 서버: http://{args.host}:{args.port}/v1 (chat={args.chat_latency}, "
+          f"embedding={args.embedding_latency}, 429={args.rate_limit_ratio}, 500={args.error_ratio})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
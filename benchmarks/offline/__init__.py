@@ -0,0 +1,8 @@
+"""OpenAI 키 없이 서비스 성능을 재는 오프라인 벤치마크.
+
+- fakes: 지연 분포를 지정할 수 있는 결정적 ChatOpenAI / OpenAIEmbeddings 대역
+- datagen: 일기/할일/일정/CleanedData/Summary/Embedding 이력을 가진 사용자 생성
+- scenarios: /chatbot/, /feedback/, /recommend/, 일일/주간 작업 측정
+
+    python -m benchmarks.offline --database-url postgresql://localhost/maiddy_bench --users 50 --days 90
+"""
@@ -0,0 +1,92 @@
+import argparse
+import os
+from benchmarks.offline import __doc__ as DESCRIPTION
+
+SCENARIOS = ('chatbot', 'feedback', 'recommend', 'daily', 'weekly')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=DESCRIPTION, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url', default=os.environ.get('BENCH_DATABASE_URL'),
+                        help='벤치마크 전용 Postgres (pgvector). 기본값은 BENCH_DATABASE_URL')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help=f"쉼표로 구분 ({', '.join(SCENARIOS)})")
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--days', type=int, default=90, help='사용자별 이력 일수')
+    parser.add_argument('--no-seed', dest='seed_data', action='store_false', help='이전에 만든 데이터를 그대로 사용')
+    parser.add_argument('--requests', type=int, default=200, help='HTTP 시나리오별 요청 수')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--intent-ratio', type=float, default=0.3, help='챗봇 요청 중 일정/할일 변경 요청 비율')
+    parser.add_argument('--stream', action='store_true', help='HTTP 시나리오를 스트리밍 응답으로')
+    parser.add_argument('--cached', action='store_true', help='/feedback, /recommend 응답 캐시 사용 (기본은 refresh)')
+    parser.add_argument('--chat-latency', default='lognormal:0.8,0.4', help='LLM 응답 지연 분포')
+    parser.add_argument('--token-delay', type=float, default=0.0, help='스트리밍 청크 사이 지연(초)')
+    parser.add_argument('--embedding-latency', default='lognormal:0.15,0.3', help='임베딩 요청 지연 분포')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', dest='json_path', help='결과를 JSON으로 저장할 경로')
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error('--database-url 또는 BENCH_DATABASE_URL이 필요합니다 (운영 DB를 쓰지 마세요)')
+    args.scenarios = [name.strip() for name in args.scenarios.split(',') if name.strip()]
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+    return args
+
+
+def main():
+    args = parse_args()
+    # config.py가 import 시점에 환경 변수를 읽으므로 앱을 불러오기 전에 설정
+    os.environ['DATABASE_URL'] = args.database_url
+    os.environ.setdefault('OPENAI_API_KEY', 'sk-offline-bench')
+    os.environ['SCHEDULER_ENABLED'] = 'False'
+
+    from app import create_app
+    from app.utils.clients import clients
+    from benchmarks.offline import datagen, scenarios
+    from benchmarks.offline.fakes import FakeChatModel, FakeEmbeddings, LatencyModel
+
+    app = create_app()
+    clients.override(
+        chat_model=FakeChatModel(
+            model_name=app.config['OPENAI_MODEL'],
+            latency=LatencyModel.parse(args.chat_latency),
+            token_delay=args.token_delay,
+            seed=args.seed
+        ),
+        embedding_model=FakeEmbeddings(LatencyModel.parse(args.embedding_latency), seed=args.seed)
+    )
+
+    with app.app_context():
+        datagen.create_schema()
+        if args.seed_data:
+            user_ids = datagen.seed(args.users, args.days, args.seed)
+            print(f"사용자 {len(user_ids)}명, {args.days}일 이력 생성")
+        else:
+            user_ids = datagen.bench_user_ids()
+    if not user_ids:
+        raise SystemExit('벤치마크 사용자가 없습니다 (--no-seed 없이 다시 실행하세요)')
+
+    print(f"chat={args.chat_latency} embedding={args.embedding_latency} "
+          f"requests={args.requests} concurrency={args.concurrency} stream={args.stream}")
+    refresh = not args.cached
+    http = {
+        'chatbot': ('/chatbot/', scenarios.chatbot_payloads(user_ids, args.intent_ratio, args.stream, args.seed)),
+        'feedback': ('/feedback/', scenarios.feedback_payloads(user_ids, refresh, args.stream, args.seed)),
+        'recommend': ('/recommend/', scenarios.recommend_payloads(user_ids, refresh, args.stream, args.seed)),
+    }
+    results = []
+    for name in args.scenarios:
+        if name in http:
+            path, payloads = http[name]
+            results.append(scenarios.run_http(app, name, path, payloads, args.requests, args.concurrency))
+        elif name == 'daily':
+            results.append(scenarios.run_daily(app, user_ids))
+        else:
+            results.append(scenarios.run_weekly(app, user_ids))
+
+    scenarios.print_report(results, args.json_path)
+
+
+if __name__ == '__main__':
+    main()
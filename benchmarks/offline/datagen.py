@@ -0,0 +1,126 @@
+"""벤치마크용 사용자와 기록 이력 생성.
+
+사용자마다 days일 동안의 일기/할일/일정을 만들고, 실제 파이프라인이 남겼을 상태를 함께 채운다.
+
+- 어제가 속한 주: 어제를 뺀 날의 CleanedData (일일/주간 작업 시나리오가 이어서 처리)
+- 그 이전의 주: 확정된 주간 Summary + Embedding
+- 월간 작업이 이미 돌았을 달: 월간 Summary + Embedding
+
+생성한 사용자는 username이 USERNAME_PREFIX로 시작하며, 다시 생성할 때 그 사용자들의 데이터만 지운다.
+"""
+import random
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List
+from sqlalchemy import delete, insert, select, text
+from app.extensions import db
+from app.models import (User, Diary, Todo, Schedule, Feedback, CleanedData, Summary, Embedding,
+                        ResponseCache, JobLedgerEntry, LLMUsageRecord)
+from benchmarks.offline.fakes import fake_vector, generate_text
+
+USERNAME_PREFIX = 'bench_'
+USER_TABLES = (Embedding, Summary, CleanedData, Feedback, ResponseCache, JobLedgerEntry, LLMUsageRecord,
+               Todo, Diary, Schedule)
+
+
+def create_schema():
+    db.session.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+    db.session.commit()
+    db.create_all()
+
+
+def bench_user_ids() -> List[int]:
+    return db.session.execute(
+        select(User.id).where(User.username.like(f'{USERNAME_PREFIX}%')).order_by(User.id)
+    ).scalars().all()
+
+
+def reset():
+    user_ids = bench_user_ids()
+    if user_ids:
+        for model in USER_TABLES:
+            db.session.execute(delete(model).where(model.user_id.in_(user_ids)))
+        db.session.execute(delete(User).where(User.id.in_(user_ids)))
+        db.session.commit()
+
+
+def _week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _summary_rows(user_id: int, rng: random.Random, kind: str, start_date: date, end_date: date, words: int) -> Dict:
+    return {
+        'user_id': user_id,
+        'summary_text': generate_text(rng, words),
+        'type': kind,
+        'start_date': start_date,
+        'end_date': end_date,
+        'is_final': True,
+    }
+
+
+def seed(users: int, days: int, seed: int = 0, today: date = None) -> List[int]:
+    """users명에게 오늘 이전 days일의 이력을 만들고 사용자 id 목록을 돌려준다."""
+    reset()
+    rng = random.Random(seed)
+    today = today or datetime.now().date()
+    yesterday = today - timedelta(days=1)
+    current_week = _week_start(yesterday)
+    first_day = today - timedelta(days=days)
+    # 월간 작업(매월 8일)이 이미 처리했을 마지막 달의 다음 날
+    monthly_until = (today - timedelta(days=7)).replace(day=1)
+
+    user_ids = db.session.execute(insert(User).returning(User.id), [
+        {'username': f'{USERNAME_PREFIX}{seed}_{index}', 'created_at': datetime.combine(first_day, time())}
+        for index in range(users)
+    ]).scalars().all()
+
+    diaries, todos, schedules, cleaned, summaries = [], [], [], [], []
+    for user_id in user_ids:
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            created_at = datetime.combine(day, time(rng.randint(7, 22), rng.randint(0, 59)))
+            if rng.random() < 0.7:
+                diaries.append({'user_id': user_id, 'content': generate_text(rng, rng.randint(40, 150)),
+                                'select_date': day, 'created_at': created_at})
+            for _ in range(rng.randint(0, 4)):
+                todos.append({'user_id': user_id, 'content': generate_text(rng, rng.randint(2, 6)),
+                              'is_completed': rng.random() < 0.6, 'select_date': day, 'created_at': created_at})
+            for _ in range(rng.randint(0, 3)):
+                schedules.append({'user_id': user_id, 'title': generate_text(rng, 2),
+                                  'content': generate_text(rng, rng.randint(3, 12)), 'select_date': day,
+                                  'time': time(rng.randint(8, 20), rng.choice((0, 30))), 'pinned': False,
+                                  'created_at': created_at})
+            if current_week <= day < yesterday:
+                cleaned.append({'user_id': user_id, 'select_date': day,
+                                'cleaned_text': generate_text(rng, rng.randint(60, 200))})
+
+        week = _week_start(first_day)
+        while week < current_week:
+            summaries.append(_summary_rows(user_id, rng, 'weekly', week, week + timedelta(days=6), 150))
+            week += timedelta(days=7)
+
+        month = first_day.replace(day=1)
+        while month < monthly_until:
+            month_end = (month + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+            summaries.append(_summary_rows(user_id, rng, 'monthly', month, month_end, 120))
+            month = month_end + timedelta(days=1)
+
+    for model, rows in ((Diary, diaries), (Todo, todos), (Schedule, schedules), (CleanedData, cleaned)):
+        if rows:
+            db.session.execute(insert(model), rows)
+
+    if summaries:
+        summary_rows = db.session.execute(insert(Summary).returning(
+            Summary.id, Summary.user_id, Summary.type, Summary.start_date, Summary.end_date, Summary.summary_text
+        ), summaries).all()
+        db.session.execute(insert(Embedding), [{
+            'user_id': row.user_id,
+            'summary_id': row.id,
+            'type': row.type,
+            'embedding': fake_vector(row.summary_text, seed),
+            'start_date': row.start_date,
+            'end_date': row.end_date,
+        } for row in summary_rows])
+
+    db.session.commit()
+    return user_ids
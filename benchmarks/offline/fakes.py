@@ -0,0 +1,194 @@
+"""OpenAI 없이 서비스를 돌리기 위한 ChatOpenAI / OpenAIEmbeddings 대역.
+
+같은 입력에는 항상 같은 응답(텍스트, 벡터, 지연 시간)을 돌려준다. 지연 시간은 LatencyModel로 지정한다.
+
+    fixed:0.5           항상 0.5초
+    uniform:0.2,1.0     0.2~1.0초 균등 분포
+    normal:0.8,0.2      평균 0.8초, 표준편차 0.2초 (0 미만은 0)
+    lognormal:0.8,0.5   중앙값 0.8초, sigma 0.5 (LLM 응답 시간처럼 꼬리가 긴 분포)
+"""
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional, Tuple
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+from app.utils.context import count_tokens
+from app.utils.intent import _extract_subject, _parse_date, _parse_time, classify_intent
+
+EMBEDDING_DIM = 1536
+INTENT_PROMPT_MARKER = '의도를 분석'
+WORDS = (
+    '오늘', '이번 주', '회의', '운동', '산책', '보고서', '정리', '계획', '휴식', '가족', '친구', '공부',
+    '프로젝트', '마감', '준비', '점심', '저녁', '컨디션', '기분', '집중', '목표', '진행', '완료', '시작',
+    '꾸준히', '조금', '많이', '좋았다', '힘들었다', '뿌듯했다', '바빴다', '여유로웠다', '내일은', '다음 주에는',
+)
+
+
+def _digest(*parts: str) -> int:
+    return int.from_bytes(hashlib.sha256('\x00'.join(parts).encode('utf-8')).digest()[:8], 'big')
+
+
+def generate_text(rng: random.Random, words: int) -> str:
+    sentences = []
+    while words > 0:
+        length = min(words, rng.randint(4, 10))
+        sentences.append(' '.join(rng.choice(WORDS) for _ in range(length)) + '.')
+        words -= length
+    return ' '.join(sentences)
+
+
+def fake_intent(question: str) -> dict:
+    # LLMService._parse_intent_response가 받는 형식의 JSON
+    intent = classify_intent(question)
+    if intent.type == 'chat' and _parse_time(question):
+        return {'type': 'schedule', 'action': 'add', 'content': {
+            'title': _extract_subject(question) or '일정',
+            'date': _parse_date(question) or '오늘',
+            'time': _parse_time(question)
+        }}
+    return {'type': intent.type, 'action': intent.action, 'content': intent.content}
+
+
+def fake_reply(contents: List[str], model_name: str, latency: 'LatencyModel', completion_words=(30, 120),
+               seed: int = 0) -> Tuple[str, dict, float]:
+    # 메시지 내용(첫 번째가 시스템 프롬프트, 마지막이 사용자 질문) -> (응답, 사용량, 지연)
+    prompt = '\n'.join(contents)
+    rng = random.Random(_digest(str(seed), prompt))
+    if contents and INTENT_PROMPT_MARKER in contents[0]:
+        text = json.dumps(fake_intent(contents[-1]), ensure_ascii=False)
+    else:
+        text = generate_text(rng, rng.randint(*completion_words))
+    usage = {
+        'input_tokens': count_tokens(model_name, prompt),
+        'output_tokens': count_tokens(model_name, text),
+    }
+    usage['total_tokens'] = usage['input_tokens'] + usage['output_tokens']
+    return text, usage, latency.sample(rng)
+
+
+def fake_vector(text: str, seed: int = 0, dim: int = EMBEDDING_DIM) -> List[float]:
+    vector = np.random.default_rng(_digest(str(seed), text)).normal(size=dim)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class LatencyModel:
+    def __init__(self, kind: str = 'fixed', params=(0.0,)):
+        if kind not in ('fixed', 'uniform', 'normal', 'lognormal'):
+            raise ValueError(f"알 수 없는 지연 분포: {kind}")
+        self.kind = kind
+        self.params = tuple(float(value) for value in params)
+
+    @classmethod
+    def parse(cls, spec: str) -> 'LatencyModel':
+        kind, _, values = spec.partition(':')
+        return cls(kind.strip(), [value for value in values.split(',') if value.strip()] or [0.0])
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return rng.uniform(self.params[0], self.params[1])
+        if self.kind == 'normal':
+            return max(rng.gauss(self.params[0], self.params[1]), 0.0)
+        return rng.lognormvariate(math.log(self.params[0]), self.params[1])
+
+    def __repr__(self):
+        return f"{self.kind}:{','.join(str(value) for value in self.params)}"
+
+
+class FakeChatModel(BaseChatModel):
+    # invoke/stream/batch/ainvoke/astream 모두 BaseChatModel이 _generate/_stream 계열로 연결한다
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model_name: str = 'gpt-4o-mini'
+    latency: LatencyModel = LatencyModel()
+    token_delay: float = 0.0  # 스트리밍 시 청크 사이 지연(초)
+    completion_words: tuple = (30, 120)
+    seed: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return 'fake-chat'
+
+    def _respond(self, messages: List[BaseMessage]):
+        return fake_reply([str(message.content) for message in messages], self.model_name, self.latency,
+                          self.completion_words, self.seed)
+
+    def _message(self, text: str, usage: dict) -> AIMessage:
+        return AIMessage(content=text, usage_metadata=usage, response_metadata={'model_name': self.model_name})
+
+    def _chunks(self, text: str, usage: dict) -> List[ChatGenerationChunk]:
+        tokens = text.split(' ')
+        chunks = [
+            ChatGenerationChunk(message=AIMessageChunk(content=token if index == 0 else ' ' + token))
+            for index, token in enumerate(tokens)
+        ]
+        # 실제 API(stream_usage=True)처럼 마지막 청크에 사용량을 싣는다
+        chunks.append(ChatGenerationChunk(message=AIMessageChunk(
+            content='', usage_metadata=usage, response_metadata={'model_name': self.model_name}
+        )))
+        return chunks
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Any = None, **kwargs) -> ChatResult:
+        text, usage, delay = self._respond(messages)
+        time.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=self._message(text, usage))])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Any = None, **kwargs) -> ChatResult:
+        text, usage, delay = self._respond(messages)
+        await asyncio.sleep(delay)
+        return ChatResult(generations=[ChatGeneration(message=self._message(text, usage))])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Any = None, **kwargs) -> Iterator[ChatGenerationChunk]:
+        text, usage, delay = self._respond(messages)
+        time.sleep(delay)  # 첫 토큰까지의 시간
+        for chunk in self._chunks(text, usage):
+            if self.token_delay:
+                time.sleep(self.token_delay)
+            yield chunk
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Any = None, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        text, usage, delay = self._respond(messages)
+        await asyncio.sleep(delay)
+        for chunk in self._chunks(text, usage):
+            if self.token_delay:
+                await asyncio.sleep(self.token_delay)
+            yield chunk
+
+
+class FakeEmbeddings(Embeddings):
+    # 텍스트의 해시로 만든 정규화된 1536차원 벡터, 요청(호출)마다 한 번 지연
+
+    def __init__(self, latency: LatencyModel = None, seed: int = 0, dim: int = EMBEDDING_DIM):
+        self.latency = latency or LatencyModel()
+        self.seed = seed
+        self.dim = dim
+
+    def _delay(self, texts: List[str]) -> float:
+        return self.latency.sample(random.Random(_digest(str(self.seed), *texts)))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self._delay(texts))
+        return [fake_vector(text, self.seed, self.dim) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(self._delay(texts))
+        return [fake_vector(text, self.seed, self.dim) for text in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
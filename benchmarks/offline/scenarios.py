@@ -0,0 +1,213 @@
+"""벤치마크 시나리오와 지표 (p50/p95/p99 지연, 처리량, 최대 RSS).
+
+HTTP 시나리오는 Flask test client로 /chatbot/, /feedback/, /recommend/를 동시에 호출하고,
+작업 시나리오는 scheduler.process_yesterday_data / process_weekly_data를 한 번 실행한 뒤
+job_ledger의 started_at/finished_at으로 사용자별 처리 시간을 구한다.
+"""
+import json
+import os
+import random
+import resource
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+from sqlalchemy import delete
+from app.extensions import db
+from app.models import CleanedData, Feedback, JobLedgerEntry, Summary
+from app.utils.embedding import EmbeddingService
+from benchmarks.questions import INTENT_QUESTIONS, SMALL_TALK
+
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+class ScenarioResult(NamedTuple):
+    name: str
+    latencies: List[float]
+    errors: int
+    elapsed: float
+    peak_rss_mb: float
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * q), len(ordered) - 1)]
+
+    def as_dict(self) -> Dict:
+        return {
+            'scenario': self.name,
+            'count': len(self.latencies),
+            'errors': self.errors,
+            'elapsed_s': round(self.elapsed, 3),
+            'throughput_per_s': round(len(self.latencies) / self.elapsed, 2) if self.elapsed > 0 else None,
+            'p50_ms': _ms(self.percentile(0.50)),
+            'p95_ms': _ms(self.percentile(0.95)),
+            'p99_ms': _ms(self.percentile(0.99)),
+            'peak_rss_mb': round(self.peak_rss_mb, 1),
+        }
+
+
+def _ms(value: Optional[float]) -> Optional[float]:
+    return round(value * 1000, 1) if value is not None else None
+
+
+class RssSampler:
+    # 시나리오 동안 /proc/self/statm을 주기적으로 읽어 최대 RSS를 잰다 (없으면 ru_maxrss로 대신)
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+
+    def _read(self) -> int:
+        try:
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * PAGE_SIZE
+        except OSError:
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._read())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak = self._read()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._read())
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak / (1024 * 1024)
+
+
+def run_http(app, name: str, path: str, payloads: Callable[[int], Dict], requests: int,
+             concurrency: int) -> ScenarioResult:
+    local = threading.local()
+    errors = []
+
+    def call(index: int) -> Optional[float]:
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+        payload = payloads(index)
+        started_at = time.perf_counter()
+        response = local.client.post(path, json=payload)
+        response.get_data()  # 스트리밍 응답은 끝까지 읽어야 완료
+        elapsed = time.perf_counter() - started_at
+        if response.status_code != 200:
+            errors.append(response.status_code)
+            return None
+        return elapsed
+
+    with RssSampler() as rss:
+        started_at = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f'bench-{name}') as executor:
+            latencies = [latency for latency in executor.map(call, range(requests)) if latency is not None]
+        elapsed = time.perf_counter() - started_at
+    return ScenarioResult(name, latencies, len(errors), elapsed, rss.peak_mb)
+
+
+def chatbot_payloads(user_ids: Sequence[int], intent_ratio: float, stream: bool, seed: int):
+    def payload(index: int) -> Dict:
+        rng = random.Random(seed * 1_000_003 + index)
+        questions = INTENT_QUESTIONS if rng.random() < intent_ratio else SMALL_TALK
+        return {'user_id': rng.choice(user_ids), 'question': rng.choice(questions), 'stream': stream}
+    return payload
+
+
+def feedback_payloads(user_ids: Sequence[int], refresh: bool, stream: bool, seed: int):
+    yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
+
+    def payload(index: int) -> Dict:
+        rng = random.Random(seed * 1_000_003 + index)
+        return {'user_id': rng.choice(user_ids), 'select_date': yesterday, 'refresh': refresh, 'stream': stream}
+    return payload
+
+
+def recommend_payloads(user_ids: Sequence[int], refresh: bool, stream: bool, seed: int):
+    def payload(index: int) -> Dict:
+        rng = random.Random(seed * 1_000_003 + index)
+        return {'user_id': rng.choice(user_ids), 'refresh': refresh, 'stream': stream}
+    return payload
+
+
+def _ledger_durations(job: str, period_start) -> List[float]:
+    rows = db.session.query(JobLedgerEntry.started_at, JobLedgerEntry.finished_at).filter(
+        JobLedgerEntry.job == job,
+        JobLedgerEntry.period_start == period_start,
+        JobLedgerEntry.status == 'done'
+    ).all()
+    return [(row.finished_at - row.started_at).total_seconds() for row in rows if row.finished_at and row.started_at]
+
+
+def _failed_count(job: str, period_start) -> int:
+    return JobLedgerEntry.query.filter_by(job=job, period_start=period_start, status='failed').count()
+
+
+def run_daily(app, user_ids: Sequence[int]) -> ScenarioResult:
+    from app.scheduler import process_yesterday_data
+
+    yesterday = datetime.now().date() - timedelta(days=1)
+    with app.app_context():
+        # 같은 기간을 다시 잴 수 있도록 이전 실행의 결과를 지운다
+        db.session.execute(delete(JobLedgerEntry).where(
+            JobLedgerEntry.job == 'daily', JobLedgerEntry.period_start == yesterday,
+            JobLedgerEntry.user_id.in_(user_ids)))
+        db.session.execute(delete(CleanedData).where(
+            CleanedData.select_date == yesterday, CleanedData.user_id.in_(user_ids)))
+        db.session.execute(delete(Feedback).where(
+            Feedback.select_date == yesterday, Feedback.user_id.in_(user_ids)))
+        db.session.commit()
+
+    with RssSampler() as rss:
+        started_at = time.perf_counter()
+        process_yesterday_data()
+        elapsed = time.perf_counter() - started_at
+
+    with app.app_context():
+        return ScenarioResult('daily_job', _ledger_durations('daily', yesterday),
+                              _failed_count('daily', yesterday), elapsed, rss.peak_mb)
+
+
+def run_weekly(app, user_ids: Sequence[int]) -> ScenarioResult:
+    from app.scheduler import process_weekly_data
+
+    with app.app_context():
+        start_date, _ = EmbeddingService().get_week_dates(datetime.now().date() - timedelta(days=1))
+        # 일일 작업이 만든 진행 중 요약도 지워서 주간 요약 전체 경로(요약 + 임베딩 + 저장)를 잰다
+        db.session.execute(delete(JobLedgerEntry).where(
+            JobLedgerEntry.job == 'weekly', JobLedgerEntry.period_start == start_date,
+            JobLedgerEntry.user_id.in_(user_ids)))
+        db.session.execute(delete(Summary).where(
+            Summary.type == 'weekly', Summary.start_date == start_date, Summary.user_id.in_(user_ids)))
+        db.session.commit()
+
+    with RssSampler() as rss:
+        started_at = time.perf_counter()
+        process_weekly_data()
+        elapsed = time.perf_counter() - started_at
+
+    with app.app_context():
+        return ScenarioResult('weekly_job', _ledger_durations('weekly', start_date),
+                              _failed_count('weekly', start_date), elapsed, rss.peak_mb)
+
+
+def print_report(results: Sequence[ScenarioResult], json_path: Optional[str] = None):
+    print(f"{'scenario':<12} {'count':>6} {'errors':>6} {'thru/s':>8} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'rss MB':>8}")
+    rows = [result.as_dict() for result in results]
+    for row in rows:
+        print(f"{row['scenario']:<12} {row['count']:>6} {row['errors']:>6} {row['throughput_per_s'] or 0:>8.2f} "
+              f"{row['p50_ms'] or 0:>9.1f} {row['p95_ms'] or 0:>9.1f} {row['p99_ms'] or 0:>9.1f} "
+              f"{row['peak_rss_mb']:>8.1f}")
+    if json_path:
+        with open(json_path, 'w') as output:
+            json.dump(rows, output, ensure_ascii=False, indent=2)
@@ -0,0 +1,15 @@
+# 챗봇 벤치마크/부하 테스트에서 쓰는 질문 (잡담과 일정/할일 변경 요청)
+SMALL_TALK = (
+    '요즘 내가 제일 많이 한 일이 뭐야?',
+    '이번 주 컨디션 어땠는지 정리해줘',
+    '지난달이랑 비교해서 달라진 점 알려줘',
+    '오늘 하루 어땠어?',
+    '최근에 운동 얼마나 했어?',
+)
+INTENT_QUESTIONS = (
+    '내일 3시에 회의 일정 추가해줘',
+    '오늘 할일에 보고서 작성 추가해줘',
+    '오늘 오후 5시에 운동하기',
+    '모레 10시 치과 일정 삭제해줘',
+    '오늘 할일 중에서 장보기 완료로 바꿔줘',
+)
@@ -0,0 +1,162 @@
+"""pgvector ANN 인덱스(HNSW/IVFFlat)와 정확 검색의 recall@k / 지연 시간 비교.
+
+로컬 Postgres(pgvector 확장 설치)에 임시 테이블을 만들어 합성 데이터를 넣고 측정한다.
+
+    python -m benchmarks.vector_index --rows 20000 --users 200 --index hnsw --ef-search 20,40,100
+"""
+import argparse
+import io
+import statistics
+import time
+import numpy as np
+from decouple import config
+from sqlalchemy import create_engine, text
+
+TABLE = 'bench_embeddings'
+
+
+def _vector_literal(vector) -> str:
+    return '[' + ','.join(f"{value:.6f}" for value in vector) + ']'
+
+
+def generate_corpus(rows: int, users: int, dim: int, seed: int):
+    # 사용자마다 중심 벡터 주변에 모인 데이터 (실제 사용자별 요약과 비슷한 분포)
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(users, dim)).astype(np.float32)
+    user_ids = rng.integers(0, users, size=rows)
+    vectors = centers[user_ids] + rng.normal(scale=0.8, size=(rows, dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return user_ids + 1, vectors, centers
+
+
+def load_corpus(engine, user_ids, vectors, dim: int):
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+        connection.execute(text(
+            f"CREATE TABLE {TABLE} (id serial PRIMARY KEY, user_id integer NOT NULL, embedding vector({dim}))"
+        ))
+        connection.execute(text(f"CREATE INDEX ON {TABLE} (user_id)"))
+
+    buffer = io.StringIO()
+    for user_id, vector in zip(user_ids, vectors):
+        buffer.write(f"{int(user_id)}\t{_vector_literal(vector)}\n")
+    buffer.seek(0)
+
+    raw = engine.raw_connection()
+    try:
+        with raw.cursor() as cursor:
+            cursor.copy_expert(f"COPY {TABLE} (user_id, embedding) FROM STDIN", buffer)
+        raw.commit()
+    finally:
+        raw.close()
+
+    with engine.begin() as connection:
+        connection.execute(text(f"ANALYZE {TABLE}"))
+
+
+def exact_neighbours(user_ids, vectors, query, k: int, user_id=None):
+    # numpy 전수 검색으로 정답(ground truth) 계산, id는 1부터 시작
+    distances = 1 - vectors @ query
+    if user_id is not None:
+        distances = np.where(user_ids == user_id, distances, np.inf)
+    order = np.argsort(distances)[:k]
+    return {int(index) + 1 for index in order if np.isfinite(distances[index])}
+
+
+def run_queries(engine, queries, k: int, settings: dict, per_user: bool):
+    latencies = []
+    results = []
+    with engine.connect() as connection:
+        for query_vector, user_id in queries:
+            with connection.begin():
+                for name, value in settings.items():
+                    connection.execute(text(f"SET LOCAL {name} = {value}"))
+                where = "WHERE user_id = :user_id" if per_user else ""
+                started_at = time.perf_counter()
+                rows = connection.execute(
+                    text(f"SELECT id FROM {TABLE} {where} ORDER BY embedding <=> CAST(:query AS vector) LIMIT :k"),
+                    {'query': _vector_literal(query_vector), 'k': k, 'user_id': int(user_id)}
+                ).all()
+                latencies.append((time.perf_counter() - started_at) * 1000)
+            results.append({row.id for row in rows})
+    return results, latencies
+
+
+def report(label: str, results, truths, latencies, k: int):
+    recalls = [len(result & truth) / max(min(k, len(truth)), 1) for result, truth in zip(results, truths)]
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1]
+    print(f"{label:<28} recall@{k}={statistics.mean(recalls):.4f}  "
+          f"p50={statistics.median(latencies):.2f}ms  p95={p95:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dsn', default=config('DATABASE_URL', default='postgresql://localhost/postgres'))
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--dim', type=int, default=1536)
+    parser.add_argument('--k', type=int, default=3)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--index', choices=['hnsw', 'ivfflat'], default='hnsw')
+    parser.add_argument('--m', type=int, default=16)
+    parser.add_argument('--ef-construction', type=int, default=64)
+    parser.add_argument('--ef-search', default='20,40,100', help='쉼표로 구분한 hnsw.ef_search 값')
+    parser.add_argument('--lists', type=int, default=100)
+    parser.add_argument('--probes', default='1,10,30', help='쉼표로 구분한 ivfflat.probes 값')
+    parser.add_argument('--iterative-scan', default='', help='hnsw.iterative_scan (pgvector 0.8+)')
+    parser.add_argument('--global', dest='per_user', action='store_false',
+                        help='사용자 필터 없이 전체 검색 (기본은 서비스와 같은 사용자별 검색)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keep', action='store_true', help='측정 후 테이블을 지우지 않음')
+    args = parser.parse_args()
+
+    engine = create_engine(args.dsn)
+    user_ids, vectors, centers = generate_corpus(args.rows, args.users, args.dim, args.seed)
+
+    started_at = time.perf_counter()
+    load_corpus(engine, user_ids, vectors, args.dim)
+    print(f"{args.rows}건 적재: {time.perf_counter() - started_at:.1f}s")
+
+    rng = np.random.default_rng(args.seed + 1)
+    queries = []
+    for _ in range(args.queries):
+        user_id = int(rng.integers(1, args.users + 1))
+        query = centers[user_id - 1] + rng.normal(scale=0.8, size=args.dim).astype(np.float32)
+        queries.append((query / np.linalg.norm(query), user_id))
+    truths = [exact_neighbours(user_ids, vectors, query, args.k, user_id if args.per_user else None)
+              for query, user_id in queries]
+
+    try:
+        results, latencies = run_queries(engine, queries, args.k, {}, args.per_user)
+        report('exact (no vector index)', results, truths, latencies, args.k)
+
+        if args.index == 'hnsw':
+            options = f"m = {args.m}, ef_construction = {args.ef_construction}"
+        else:
+            options = f"lists = {args.lists}"
+        started_at = time.perf_counter()
+        with engine.begin() as connection:
+            connection.execute(text(
+                f"CREATE INDEX ON {TABLE} USING {args.index} (embedding vector_cosine_ops) WITH ({options})"
+            ))
+            connection.execute(text(f"ANALYZE {TABLE}"))
+        print(f"{args.index} 인덱스 생성: {time.perf_counter() - started_at:.1f}s")
+
+        values = args.ef_search if args.index == 'hnsw' else args.probes
+        setting = 'hnsw.ef_search' if args.index == 'hnsw' else 'ivfflat.probes'
+        for value in [int(v) for v in values.split(',') if v]:
+            settings = {setting: value}
+            if args.index == 'hnsw' and args.iterative_scan:
+                settings['hnsw.iterative_scan'] = args.iterative_scan
+            results, latencies = run_queries(engine, queries, args.k, settings, args.per_user)
+            report(f"{args.index} {setting}={value}", results, truths, latencies, args.k)
+    finally:
+        if not args.keep:
+            with engine.begin() as connection:
+                connection.execute(text(f"DROP TABLE IF EXISTS {TABLE}"))
+
+
+if __name__ == '__main__':
+    main()
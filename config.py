@@ -15,7 +15,87 @@ class Config:
     # OpenAI
     OPENAI_API_KEY = config('OPENAI_API_KEY')
     OPENAI_MODEL = config('OPENAI_MODEL', default='gpt-4o-mini')
+    # OpenAI 호환 서버 주소 (예: 부하 테스트용 python -m benchmarks.mock_openai -> http://127.0.0.1:8089/v1), 비우면 api.openai.com
+    OPENAI_BASE_URL = config('OPENAI_BASE_URL', default='') or None
     OPENAI_TEMPERATURE = config('OPENAI_TEMPERATURE', default=0.7, cast=float)
+    OPENAI_EMBEDDING_MODEL = config('OPENAI_EMBEDDING_MODEL', default='text-embedding-3-small')
+    OPENAI_REQUEST_TIMEOUT = config('OPENAI_REQUEST_TIMEOUT', default=60.0, cast=float)
+    OPENAI_MAX_RETRIES = config('OPENAI_MAX_RETRIES', default=2, cast=int)
+    
+    # OpenAI keep-alive 커넥션 풀 (프로세스당)
+    OPENAI_HTTP_MAX_CONNECTIONS = config('OPENAI_HTTP_MAX_CONNECTIONS', default=50, cast=int)
+    OPENAI_HTTP_MAX_KEEPALIVE = config('OPENAI_HTTP_MAX_KEEPALIVE', default=20, cast=int)
+    OPENAI_HTTP_KEEPALIVE_EXPIRY = config('OPENAI_HTTP_KEEPALIVE_EXPIRY', default=30.0, cast=float)
+    
+    # ASGI(asgi.py) 경로에서 DB 작업을 실행할 스레드 수
+    ASYNC_DB_WORKERS = config('ASYNC_DB_WORKERS', default=16, cast=int)
+    
+    # Embedding cache (메모리 LRU + 선택적으로 Postgres 테이블)
+    EMBEDDING_CACHE_SIZE = config('EMBEDDING_CACHE_SIZE', default=2048, cast=int)
+    EMBEDDING_CACHE_TTL = config('EMBEDDING_CACHE_TTL', default=86400, cast=int)  # 초
+    EMBEDDING_CACHE_PERSIST = config('EMBEDDING_CACHE_PERSIST', default=False, cast=bool)
+    EMBEDDING_CACHE_DB_TTL_DAYS = config('EMBEDDING_CACHE_DB_TTL_DAYS', default=30, cast=int)
+    
+    # Vector index (pgvector) - none | hnsw | ivfflat, 인덱스 생성은 flask vector-index create
+    VECTOR_INDEX_TYPE = config('VECTOR_INDEX_TYPE', default='none')
+    VECTOR_HNSW_M = config('VECTOR_HNSW_M', default=16, cast=int)
+    VECTOR_HNSW_EF_CONSTRUCTION = config('VECTOR_HNSW_EF_CONSTRUCTION', default=64, cast=int)
+    VECTOR_HNSW_EF_SEARCH = config('VECTOR_HNSW_EF_SEARCH', default=40, cast=int)
+    VECTOR_HNSW_ITERATIVE_SCAN = config('VECTOR_HNSW_ITERATIVE_SCAN', default='')  # strict_order | relaxed_order
+    VECTOR_IVFFLAT_LISTS = config('VECTOR_IVFFLAT_LISTS', default=100, cast=int)
+    VECTOR_IVFFLAT_PROBES = config('VECTOR_IVFFLAT_PROBES', default=10, cast=int)
+    
+    # Prompt context (tiktoken 기준 토큰 예산)
+    CHAT_CONTEXT_TOKEN_BUDGET = config('CHAT_CONTEXT_TOKEN_BUDGET', default=3000, cast=int)
+    FEEDBACK_CONTEXT_TOKEN_BUDGET = config('FEEDBACK_CONTEXT_TOKEN_BUDGET', default=2000, cast=int)
+    RECOMMEND_CONTEXT_TOKEN_BUDGET = config('RECOMMEND_CONTEXT_TOKEN_BUDGET', default=2000, cast=int)
+    
+    # 사용자별 컨텍스트 스냅샷 캐시 (쓰기 시 무효화, 다른 워커의 변경은 TTL 이내 반영)
+    CONTEXT_CACHE_SIZE = config('CONTEXT_CACHE_SIZE', default=1024, cast=int)
+    CONTEXT_CACHE_TTL = config('CONTEXT_CACHE_TTL', default=60, cast=int)  # 초
+    CONTEXT_SNAPSHOT_PAST_ENTRIES = config('CONTEXT_SNAPSHOT_PAST_ENTRIES', default=30, cast=int)
+    CONTEXT_MONTHLY_SUMMARIES = config('CONTEXT_MONTHLY_SUMMARIES', default=3, cast=int)  # 주간 요약 이전 기간에 붙일 월간 요약 수
+    
+    # /feedback, /recommend 응답 캐시 (입력 지문이 같으면 LLM 호출 생략, 요청의 "refresh": true로 재생성)
+    RESPONSE_CACHE_ENABLED = config('RESPONSE_CACHE_ENABLED', default=True, cast=bool)
+    
+    # 챗봇: 의도 분석과 검색/조회를 동시에 실행
+    CHAT_PARALLEL_PREFETCH = config('CHAT_PARALLEL_PREFETCH', default=True, cast=bool)
+    
+    # 규칙 기반 의도 분류 결과를 그대로 쓰는 최소 신뢰도 (1보다 크면 항상 LLM 사용)
+    INTENT_RULE_CONFIDENCE_THRESHOLD = config('INTENT_RULE_CONFIDENCE_THRESHOLD', default=0.8, cast=float)
+ 
+    # 수집 이벤트(/ingest): (사용자, 날짜)별 디바운스 후 CleanedData 갱신
+    INGEST_DEBOUNCE_SECONDS = config('INGEST_DEBOUNCE_SECONDS', default=30.0, cast=float)
+    INGEST_MAX_DELAY_SECONDS = config('INGEST_MAX_DELAY_SECONDS', default=300.0, cast=float)
+    INGEST_MAX_WORKERS = config('INGEST_MAX_WORKERS', default=2, cast=int)
+ 
+    # 토큰 사용량 원장 (llm_usage 테이블): 요청 경로에서는 메모리에 쌓고 백그라운드 스레드가 묶어서 INSERT
+    USAGE_LEDGER_ENABLED = config('USAGE_LEDGER_ENABLED', default=True, cast=bool)
+    USAGE_LEDGER_BATCH_SIZE = config('USAGE_LEDGER_BATCH_SIZE', default=200, cast=int)
+    USAGE_LEDGER_FLUSH_INTERVAL = config('USAGE_LEDGER_FLUSH_INTERVAL', default=5.0, cast=float)  # 초
+    USAGE_LEDGER_MAX_PENDING = config('USAGE_LEDGER_MAX_PENDING', default=10000, cast=int)  # 넘으면 버리고 dropped로 집계
+ 
+    # 시작 워밍업: create_app 직후 백그라운드에서 LangChain/OpenAI import, 클라이언트 생성, tiktoken 로드를 미리 해둔다
+    WARMUP_ENABLED = config('WARMUP_ENABLED', default=False, cast=bool)
+ 
+    # Scheduler
+    SCHEDULER_MAX_WORKERS = config('SCHEDULER_MAX_WORKERS', default=4, cast=int)  # 1이면 순차 처리
+    SCHEDULER_CANDIDATE_CHUNK = config('SCHEDULER_CANDIDATE_CHUNK', default=1000, cast=int)  # 대상 사용자 쿼리를 읽는 단위
+    # False면 웹 프로세스에서 스케줄러를 띄우지 않는다 (flask scheduler run 전용 워커 사용)
+    SCHEDULER_ENABLED = config('SCHEDULER_ENABLED', default=True, cast=bool)
+    # 클러스터 전체에서 리더 한 곳만 작업을 실행하도록 잡는 Postgres advisory lock 키
+    SCHEDULER_LEADER_LOCK_KEY = config('SCHEDULER_LEADER_LOCK_KEY', default=7240001, cast=int)
+    # True면 일일 작업마다 이번 주 요약/임베딩을 갱신하고 월요일 작업은 확정만 한다
+    WEEKLY_SUMMARY_INCREMENTAL = config('WEEKLY_SUMMARY_INCREMENTAL', default=True, cast=bool)
+    # 주간 작업을 사용자 N명씩 묶어서 처리 (0이면 사용자별 처리)
+    WEEKLY_BATCH_SIZE = config('WEEKLY_BATCH_SIZE', default=50, cast=int)
+    EMBEDDING_BATCH_SIZE = config('EMBEDDING_BATCH_SIZE', default=100, cast=int)  # embed_documents 한 번에 보낼 텍스트 수
+    
+    # 작업 원장 (job_ledger 테이블)
+    JOB_LEDGER_MAX_ATTEMPTS = config('JOB_LEDGER_MAX_ATTEMPTS', default=3, cast=int)  # 사용자별 실행 횟수 상한
+    JOB_LEDGER_STALE_AFTER = config('JOB_LEDGER_STALE_AFTER', default=1800, cast=int)  # 초, running 행을 회수하기까지
+    JOB_LEDGER_RESUME_DAYS = config('JOB_LEDGER_RESUME_DAYS', default=7, cast=int)  # 시작 시 재개할 기간
  
     # Timezone
     TIMEZONE = config('TIMEZONE', default='Asia/Seoul')
@@ -0,0 +1,48 @@
+import unittest
+from datetime import date
+from unittest import mock
+from flask import Flask
+from app.utils.embedding import EmbeddingService
+from app.utils.llm_service import LLMService
+
+
+class RefreshDailyDataFinalWeekTest(unittest.TestCase):
+    # 주간 요약이 확정된 주에 늦게 들어온 수정(수집 이벤트)은 CleanedData를 다시 만들지 않는다
+
+    def setUp(self):
+        app = Flask(__name__)
+        app.config['WEEKLY_SUMMARY_INCREMENTAL'] = True
+        self.context = app.app_context()
+        self.context.push()
+        self.service = LLMService(job='ingestion')
+        self.service._init_model = mock.Mock()
+        self.service.embedding_service = mock.Mock(spec=EmbeddingService)
+        self.service.get_daily_data = mock.Mock(return_value=(False, None, "데이터 조회 중 오류가 발생했습니다."))
+        self.service._preprocess_text = mock.Mock()
+
+    def tearDown(self):
+        self.context.pop()
+
+    def test_late_edit_to_finalized_week_is_skipped(self):
+        self.service.embedding_service.discard_day_in_final_week.return_value = True
+
+        success, _ = self.service.refresh_daily_data(1, date(2025, 1, 8))
+
+        self.assertTrue(success)
+        self.service.embedding_service.discard_day_in_final_week.assert_called_once_with(1, date(2025, 1, 8))
+        self.service.get_daily_data.assert_not_called()
+        self.service._preprocess_text.assert_not_called()
+        self.service.embedding_service.refold_running_weekly_summary.assert_not_called()
+
+    def test_open_week_is_rebuilt(self):
+        self.service.embedding_service.discard_day_in_final_week.return_value = False
+
+        success, _ = self.service.refresh_daily_data(1, date(2025, 1, 8))
+
+        # 원본 조회까지 진행한다 (여기서는 조회 실패로 끝난다)
+        self.assertFalse(success)
+        self.service.get_daily_data.assert_called_once_with(1, date(2025, 1, 8))
+
+
+if __name__ == '__main__':
+    unittest.main()